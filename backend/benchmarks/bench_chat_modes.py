@@ -0,0 +1,188 @@
+"""
+Benchmark chat execution modes on latency and token cost
+
+Compares, per message:
+- dual: NavigationService (Gemini function calling) + AnswerService, run concurrently
+- dual-fast-path: the same, with the local navigation classifier answering obvious intents
+- fused: one AnswerService generation that also calls navigate_to_section
+
+By default Gemini is simulated: tokens are estimated from the prompt, tool
+declarations and reply (~4 characters per token) and latency grows with them,
+so the numbers show the relative cost of each mode without an API key.
+With --live the real API is called (GOOGLE_API_KEY) and token counts come
+from usage_metadata (thinking tokens included in output).
+
+Run from backend/: python benchmarks/bench_chat_modes.py [--live]
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import os
+import time
+from types import SimpleNamespace
+from typing import Any, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+os.environ.setdefault("GOOGLE_API_KEY", "simulated")
+
+from google import genai
+from google.genai import types
+from src.services import AnswerService, NavigationService
+
+MESSAGES = [
+    "Hi!",
+    "Show me your projects",
+    "What programming languages do you know?",
+    "Tell me about your work experience",
+    "How can I contact Sriharsha?",
+    "What has he built with RAG?",
+    "Is he a good fit for an LLM platform team?",
+    "What makes his approach to agents different?",
+]
+
+# Simulated Gemini: fixed overhead plus prefill and decode time
+SIMULATED_BASE_SECONDS = 0.25
+SIMULATED_INPUT_SECONDS_PER_TOKEN = 0.00002
+SIMULATED_OUTPUT_SECONDS_PER_TOKEN = 0.004
+SIMULATED_ANSWER = (
+    "Sriharsha is a Gen AI Engineer who builds retrieval-augmented generation systems and LLM "
+    "orchestration platforms. His projects include a multi-agent system, a RAG framework and this "
+    "portfolio's dual-LLM chat, built with Python, FastAPI, LangChain and Gemini. " * 2
+)
+
+
+def estimate_tokens(text: str) -> int:
+    return max(1, len(text) // 4)
+
+
+def _declaration_names(config: types.GenerateContentConfig) -> List[str]:
+    return [
+        declaration.name
+        for tool in (config.tools or [])
+        for declaration in (tool.function_declarations or [])
+    ]
+
+
+class SimulatedModels:
+    """Stands in for client.aio.models, replying like each mode's Gemini call would"""
+
+    def __init__(self, calls: List[Dict[str, int]]):
+        self.calls = calls
+
+    async def generate_content(self, model, contents, config):
+        names = _declaration_names(config)
+        if config.response_mime_type == "text/x.enum":
+            parts = [types.Part(text="projects")]
+        elif "navigate_to_projects" in names:
+            parts = [types.Part(function_call=types.FunctionCall(name="navigate_to_projects", args={}))]
+        elif "navigate_to_section" in names:
+            parts = [
+                types.Part(function_call=types.FunctionCall(name="navigate_to_section", args={"section_id": "projects"})),
+                types.Part(text=SIMULATED_ANSWER),
+            ]
+        else:
+            parts = [types.Part(text=SIMULATED_ANSWER)]
+
+        prompt = (config.system_instruction or "") + "".join(
+            tool.model_dump_json(exclude_none=True) for tool in (config.tools or [])
+        ) + "".join(part.text or "" for content in contents for part in content.parts)
+        reply = "".join(part.text or part.function_call.model_dump_json(exclude_none=True) for part in parts)
+        input_tokens, output_tokens = estimate_tokens(prompt), estimate_tokens(reply)
+        self.calls.append({"input": input_tokens, "output": output_tokens})
+
+        await asyncio.sleep(
+            SIMULATED_BASE_SECONDS
+            + input_tokens * SIMULATED_INPUT_SECONDS_PER_TOKEN
+            + output_tokens * SIMULATED_OUTPUT_SECONDS_PER_TOKEN
+        )
+        return types.GenerateContentResponse(
+            candidates=[types.Candidate(content=types.Content(role="model", parts=parts))]
+        )
+
+
+class UsageRecorder:
+    """Wraps the real client.aio.models and records usage_metadata per call"""
+
+    def __init__(self, models, calls: List[Dict[str, int]]):
+        self.models = models
+        self.calls = calls
+
+    async def generate_content(self, model, contents, config):
+        response = await self.models.generate_content(model=model, contents=contents, config=config)
+        usage = response.usage_metadata
+        self.calls.append({
+            "input": (usage.prompt_token_count or 0) if usage else 0,
+            "output": ((usage.candidates_token_count or 0) + (usage.thoughts_token_count or 0)) if usage else 0,
+        })
+        return response
+
+
+async def run_mode(mode: str, live: bool) -> Dict[str, Any]:
+    answer_service = AnswerService()
+    navigation_service = NavigationService()
+    navigation_service.fast_path = mode == "dual-fast-path"
+    navigation_service.shadow = None
+
+    calls: List[Dict[str, int]] = []
+    if live:
+        models = UsageRecorder(genai.Client(api_key=os.getenv("GOOGLE_API_KEY")).aio.models, calls)
+    else:
+        models = SimulatedModels(calls)
+    answer_service.client = navigation_service.client = SimpleNamespace(aio=SimpleNamespace(models=models))
+
+    latencies = []
+    for message in MESSAGES:
+        navigation_service.decision_cache.clear()  # measure the decision itself, not the cache
+        start = time.perf_counter()
+        if mode == "fused":
+            await answer_service.get_response_and_navigation(message, [])
+        else:
+            await asyncio.gather(
+                navigation_service.get_navigation_decision(message),
+                answer_service.get_response(message, [])
+            )
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    latencies.sort()
+    count = len(MESSAGES)
+    return {
+        "mode": mode,
+        "requests": len(calls) / count,
+        "mean_ms": sum(latencies) / count,
+        "p95_ms": latencies[min(count - 1, int(0.95 * count))],
+        "input_tokens": sum(call["input"] for call in calls) / count,
+        "output_tokens": sum(call["output"] for call in calls) / count,
+    }
+
+
+async def main(live: bool, as_json: bool = False):
+    source = "live Gemini" if live else "simulated Gemini (estimated tokens)"
+    print(f"Chat execution modes over {len(MESSAGES)} messages, {source}\n")
+    print(f"{'mode':<16}{'requests/msg':>14}{'mean ms':>10}{'p95 ms':>10}{'input tok':>11}{'output tok':>12}")
+    results = []
+    for mode in ("dual", "dual-fast-path", "fused"):
+        result = await run_mode(mode, live)
+        results.append(result)
+        print(
+            f"{result['mode']:<16}{result['requests']:>14.2f}{result['mean_ms']:>10.0f}{result['p95_ms']:>10.0f}"
+            f"{result['input_tokens']:>11.0f}{result['output_tokens']:>12.0f}"
+        )
+
+    dual, fused = results[0], results[-1]
+    print(
+        f"\nfused vs dual: {fused['requests'] / dual['requests']:.0%} of the requests, "
+        f"{(fused['input_tokens'] + fused['output_tokens']) / (dual['input_tokens'] + dual['output_tokens']):.0%} "
+        f"of the tokens, {fused['mean_ms'] / dual['mean_ms']:.0%} of the mean latency"
+    )
+    if as_json:
+        print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark chat execution modes")
+    parser.add_argument("--live", action="store_true", help="Call the real Gemini API (needs GOOGLE_API_KEY)")
+    parser.add_argument("--json", action="store_true", help="Also print raw results as JSON")
+    args = parser.parse_args()
+    asyncio.run(main(args.live, args.json))
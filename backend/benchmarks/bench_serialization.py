@@ -0,0 +1,131 @@
+"""
+Benchmark JSON serialization and response compression on realistic API payloads
+
+Compares:
+- encoding: stdlib json (FastAPI's JSONResponse) vs serialization.dumps (orjson when installed)
+- tool results: json.loads(json.dumps(..., default=str)) vs to_jsonable
+- bytes on the wire: identity vs gzip vs brotli (when installed)
+
+Run from backend/: python benchmarks/bench_serialization.py
+"""
+
+import gzip
+import json
+import sys
+import os
+import timeit
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from src.api.compression import BROTLI_QUALITY, GZIP_LEVEL, brotli
+from src.services import serialization
+from src.services.serialization import dumps, to_jsonable
+
+
+def repositories_payload(count: int = 100) -> dict:
+    """Shape of /github/repositories?per_page=100"""
+    repos = [
+        {
+            "name": f"project-{i}",
+            "full_name": f"sriharsha8991/project-{i}",
+            "description": f"Retrieval-augmented generation experiment number {i} with FastAPI and Gemini",
+            "html_url": f"https://github.com/sriharsha8991/project-{i}",
+            "homepage": None,
+            "language": ["Python", "TypeScript", "Jupyter Notebook"][i % 3],
+            "languages_url": f"https://api.github.com/repos/sriharsha8991/project-{i}/languages",
+            "stargazers_count": i * 3,
+            "watchers_count": i * 3,
+            "forks_count": i % 7,
+            "open_issues_count": i % 4,
+            "size": 1000 + i * 17,
+            "default_branch": "main",
+            "topics": ["ai", "llm", "rag"][: i % 4],
+            "visibility": "public",
+            "is_fork": i % 9 == 0,
+            "created_at": "2023-05-01T10:00:00Z",
+            "updated_at": "2024-06-01T10:00:00Z",
+            "pushed_at": "2024-06-01T10:00:00Z",
+        }
+        for i in range(count)
+    ]
+    return {"success": True, "data": repos, "count": len(repos)}
+
+
+def events_payload(count: int = 100) -> dict:
+    """Shape of /github/events with full payload objects"""
+    events = [
+        {
+            "type": "PushEvent",
+            "repo": f"sriharsha8991/project-{i % 10}",
+            "created_at": "2024-06-01T10:00:00Z",
+            "payload": {
+                "ref": "refs/heads/main",
+                "size": 3,
+                "commits": [
+                    {
+                        "sha": f"{i:04x}{j:036x}",
+                        "author": {"email": "dev@example.com", "name": "Sriharsha"},
+                        "message": f"Refine prompt templates and add evaluation step {j}",
+                        "distinct": True,
+                        "url": f"https://api.github.com/repos/sriharsha8991/project-{i % 10}/commits/{i:04x}{j:036x}",
+                    }
+                    for j in range(3)
+                ],
+            },
+        }
+        for i in range(count)
+    ]
+    return {"success": True, "data": events, "count": len(events)}
+
+
+def tool_result() -> dict:
+    """A get_github_stats tool result as returned to AnswerService (includes a datetime)"""
+    payload = repositories_payload(30)["data"]
+    return {
+        "success": True,
+        "fetched_at": datetime(2024, 6, 1, 10, 0, 0),
+        "stats": {"total_repos": 30, "top_repositories": payload},
+    }
+
+
+def stdlib_json_response(content) -> bytes:
+    # What fastapi.responses.JSONResponse.render does
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+
+def per_call_us(fn, number: int) -> float:
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e6
+
+
+def main():
+    encoder = "orjson" if serialization.orjson is not None else "stdlib json (orjson not installed)"
+    print(f"serialization.dumps backend: {encoder}")
+    print(f"brotli: {'available' if brotli is not None else 'not installed'}\n")
+
+    print(f"{'payload':<22}{'stdlib json':>14}{'dumps':>12}{'speedup':>10}")
+    for name, payload in [("repositories (100)", repositories_payload()), ("events (100)", events_payload())]:
+        base = per_call_us(lambda: stdlib_json_response(payload), 200)
+        fast = per_call_us(lambda: dumps(payload), 200)
+        print(f"{name:<22}{base:>11.0f} us{fast:>9.0f} us{base / fast:>9.1f}x")
+
+    result = tool_result()
+    base = per_call_us(lambda: json.loads(json.dumps(result, default=str)), 500)
+    fast = per_call_us(lambda: to_jsonable(result), 500)
+    print(f"{'tool result':<22}{base:>11.0f} us{fast:>9.0f} us{base / fast:>9.1f}x   (round trip vs to_jsonable)\n")
+
+    print(f"{'payload':<22}{'identity':>10}{'gzip':>10}{'br':>10}{'gzip us':>10}{'br us':>10}")
+    for name, payload in [("repositories (100)", repositories_payload()), ("events (100)", events_payload())]:
+        body = dumps(payload)
+        gz = gzip.compress(body, compresslevel=GZIP_LEVEL)
+        gz_us = per_call_us(lambda: gzip.compress(body, compresslevel=GZIP_LEVEL), 50)
+        if brotli is not None:
+            br = len(brotli.compress(body, quality=BROTLI_QUALITY))
+            br_us = f"{per_call_us(lambda: brotli.compress(body, quality=BROTLI_QUALITY), 50):.0f}"
+        else:
+            br, br_us = "-", "-"
+        print(f"{name:<22}{len(body):>10}{len(gz):>10}{br:>10}{gz_us:>10.0f}{br_us:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Summarise the navigation shadow log (NAVIGATION_SHADOW_ENABLED=true)
+
+Reports how often the local classifier agrees with Gemini, latency percentiles
+for each path, agreement per confidence bucket (to choose
+NAVIGATION_FAST_PATH_MIN_CONFIDENCE) and recent disagreements.
+
+Run from backend/: python benchmarks/navigation_shadow_report.py [--log PATH] [--samples N] [--json]
+"""
+
+import argparse
+import json
+import sys
+import os
+from typing import List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from src.services.navigation_shadow import NAVIGATION_SHADOW_LOG_PATH, load_records, summarize
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Summarise the navigation shadow log")
+    parser.add_argument("--log", default=NAVIGATION_SHADOW_LOG_PATH, help="Shadow log path")
+    parser.add_argument("--samples", type=int, default=10, help="Disagreement samples to show")
+    parser.add_argument("--json", action="store_true", help="Print the raw summary as JSON")
+    args = parser.parse_args(argv)
+
+    summary = summarize(load_records(args.log), samples=args.samples)
+    if args.json:
+        print(json.dumps(summary, indent=2, ensure_ascii=False))
+        return
+    if not summary["records"]:
+        print(f"No shadow records in {args.log}")
+        return
+
+    print(f"Shadow log: {args.log}")
+    print(f"Records: {summary['records']}  served: {summary['served']}")
+    print(f"Agreement (local vs llm): {summary['agreement_rate']:.1%}")
+    print("\nLatency (ms):")
+    for path, stats in summary["latency_ms"].items():
+        print(f"  {path:<6} n={stats['count']:<6} p50={stats['p50']}  p95={stats['p95']}  p99={stats['p99']}")
+    print("\nAgreement by local confidence:")
+    for bucket, stats in summary["agreement_by_confidence"].items():
+        print(f"  {bucket}  {stats['agreement_rate']:.1%} of {stats['records']}")
+    if summary["top_confusions"]:
+        print("\nTop confusions:")
+        for pair, count in summary["top_confusions"].items():
+            print(f"  {count:>4}  {pair}")
+    if summary["disagreements"]:
+        print("\nRecent disagreements:")
+        for sample in summary["disagreements"]:
+            print(
+                f"  [{sample['served']}] {sample['message']!r}: local={sample['local']} "
+                f"({sample['confidence']}) llm={sample['llm']}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,48 @@
-﻿"""
+"""
 FastAPI Backend for Portfolio Chat with Gemini AI
 Minimal structure with only chat endpoint
 """
 
+import asyncio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from src.api.chat import router as chat_router
 from src.api.github import router as github_router
+from src.api.websocket import router as websocket_router
+from src.api.compression import CompressionMiddleware
+from src.api.responses import FastJSONResponse
+from src.services.http_session import open_http_session, close_http_session
+from src.services.github_service import get_github_service
+from src.services.github_warmup import GitHubWarmup, WARMUP_ENABLED
+from src.services.resilience import breaker_states
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open shared resources on startup and release them on shutdown"""
+    await open_http_session()
+    github_service = get_github_service()
+    app.state.github_warmup = GitHubWarmup([github_service]) if WARMUP_ENABLED else None
+    if app.state.github_warmup:
+        app.state.github_warmup.start()
+    yield
+    if app.state.github_warmup:
+        await app.state.github_warmup.stop()
+    await close_http_session()
+    if github_service.disk:
+        # Waits for in-flight SQLite work (it holds the connection lock), off the event loop
+        await asyncio.to_thread(github_service.disk.close)
+        github_service.disk = None
+
 
 # Initialize FastAPI app
 app = FastAPI(
     title="Portfolio Chat API",
     description="AI-powered chat assistant for Sriharsha Velicheti's portfolio",
-    version="2.0.0"
+    version="2.0.0",
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse
 )
 
 # CORS middleware
@@ -24,9 +54,21 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Negotiated brotli/gzip for responses over COMPRESSION_MIN_BYTES (event streams are never compressed)
+app.add_middleware(CompressionMiddleware)
+
 # Include routers
 app.include_router(chat_router)
 app.include_router(github_router)
+app.include_router(websocket_router)
+
+
+@app.get("/health")
+async def health():
+    """Liveness check with upstream (GitHub, Gemini) circuit breaker state"""
+    breakers = breaker_states()
+    degraded = any(breaker["state"] != "closed" for breaker in breakers.values())
+    return {"status": "degraded" if degraded else "ok", "breakers": breakers}
 
 if __name__ == "__main__":
     import uvicorn
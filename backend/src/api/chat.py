@@ -1,14 +1,22 @@
 """
-Chat API - Dual LLM endpoint using separate services (Sequential Execution)
-LLM Instance 1 (NavigationService): Determines navigation first (fast decision)
+Chat API - Dual LLM endpoint using separate services
+LLM Instance 1 (NavigationService): Determines navigation (fast decision)
 LLM Instance 2 (AnswerService): Answers questions with tools (detailed response)
-Calls are sequential: Navigation → Answer
+Execution mode (CHAT_EXECUTION_MODE):
+- concurrent (default): Navigation and Answer start together, each with its own deadline
+- sequential: Navigation → Answer
+- fused: one AnswerService generation picks the section (navigate_to_section tool) and answers
+Streaming (/api/chat/stream): navigation action first, then tool events and answer text
 """
-from fastapi import APIRouter, HTTPException
+import asyncio
+import os
+from fastapi import APIRouter
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Awaitable, AsyncIterator, TypeVar
 from datetime import datetime
 from src.services import AnswerService, NavigationService
+from src.services.serialization import dumps
 
 router = APIRouter(prefix="/api", tags=["chat"])
 
@@ -16,6 +24,20 @@ router = APIRouter(prefix="/api", tags=["chat"])
 answer_service = AnswerService()
 navigation_service = NavigationService()
 
+# Execution settings
+CHAT_EXECUTION_MODE = os.getenv("CHAT_EXECUTION_MODE", "concurrent").lower()
+NAVIGATION_TIMEOUT_SECONDS = float(os.getenv("NAVIGATION_TIMEOUT_SECONDS", "5"))
+ANSWER_TIMEOUT_SECONDS = float(os.getenv("ANSWER_TIMEOUT_SECONDS", "30"))
+
+ANSWER_TIMEOUT_MESSAGE = (
+    "I apologize, but I'm taking too long to answer that right now. Please try again in a moment."
+)
+ANSWER_ERROR_MESSAGE = (
+    "I apologize, but something went wrong while answering that. Please try again."
+)
+
+T = TypeVar("T")
+
 
 # Request/Response Models
 class ChatRequest(BaseModel):
@@ -30,10 +52,43 @@ class ChatResponse(BaseModel):
     actions: Optional[List[Dict[str, Any]]] = []
 
 
+async def _run_stage(
+    name: str,
+    stage: Awaitable[T],
+    timeout: float,
+    fallback: T,
+    error_fallback: Optional[T] = None
+) -> T:
+    """
+    Await a single pipeline stage under its own deadline
+    
+    On timeout the stage is cancelled; on timeout or failure a fallback is
+    returned so the other stage's result is never discarded.
+    
+    Args:
+        name: Stage name (for logging)
+        stage: Awaitable producing the stage result
+        timeout: Deadline in seconds
+        fallback: Value returned when the stage times out
+        error_fallback: Value returned when the stage raises (defaults to fallback)
+        
+    Returns:
+        Stage result or fallback
+    """
+    try:
+        return await asyncio.wait_for(stage, timeout=timeout)
+    except asyncio.TimeoutError:
+        print(f"{name} stage timed out after {timeout}s")
+        return fallback
+    except Exception as e:
+        print(f"{name} stage error: {e}")
+        return fallback if error_fallback is None else error_fallback
+
+
 @router.post("/chat", response_model=ChatResponse)
 async def chat(request: ChatRequest):
     """
-    Dual LLM Chat Endpoint - Sequential Execution
+    Dual LLM Chat Endpoint - Concurrent or Sequential Execution
     
     Architecture:
     ┌─────────────────────────────────────────────────────────┐
@@ -110,24 +165,190 @@ async def chat(request: ChatRequest):
     - Answer service can take its time with complex queries
     - Clear execution order for debugging
     - Frontend can show "Navigating to..." indicator first
+    
+    Fused Mode:
+    - A single AnswerService generation also calls navigate_to_section, so
+      there is one Gemini request per message instead of two
+    
+    Concurrent Mode (default):
+    - Both stages start together, so latency is max(nav, answer) instead of the sum
+    - Each stage has its own deadline (NAVIGATION_TIMEOUT_SECONDS, ANSWER_TIMEOUT_SECONDS)
+    - A slow or failed stage is cancelled and replaced by an empty/fallback result
+      without discarding the other stage's result
     """
-    try:
-        # Step 1: Get navigation decision FIRST (fast)
-        actions = await navigation_service.get_navigation_decision(
-            user_message=request.message
-        )
-        print(f"Navigation Actions: {actions}")
-        # Step 2: Get detailed answer SECOND (may take longer)
-        answer_text, tools_used = await answer_service.get_response(
-            user_message=request.message,
-            conversation_history=request.conversation_history
+    if CHAT_EXECUTION_MODE == "fused":
+        # One generation returns both the answer and the section to show
+        answer_text, tools_used, actions = await _run_stage(
+            "Answer",
+            answer_service.get_response_and_navigation(
+                user_message=request.message,
+                conversation_history=request.conversation_history
+            ),
+            ANSWER_TIMEOUT_SECONDS,
+            (ANSWER_TIMEOUT_MESSAGE, [], []),
+            (ANSWER_ERROR_MESSAGE, [], [])
         )
-        
         return ChatResponse(
             response=answer_text,
             tools_used=tools_used if tools_used else None,
             actions=actions if actions else None
         )
+    
+    navigation_stage = _run_stage(
+        "Navigation",
+        navigation_service.get_navigation_decision(user_message=request.message),
+        NAVIGATION_TIMEOUT_SECONDS,
+        []
+    )
+    answer_stage = _run_stage(
+        "Answer",
+        answer_service.get_response(
+            user_message=request.message,
+            conversation_history=request.conversation_history
+        ),
+        ANSWER_TIMEOUT_SECONDS,
+        (ANSWER_TIMEOUT_MESSAGE, []),
+        (ANSWER_ERROR_MESSAGE, [])
+    )
+    
+    if CHAT_EXECUTION_MODE == "sequential":
+        # Step 1: Get navigation decision FIRST (fast)
+        actions = await navigation_stage
+        # Step 2: Get detailed answer SECOND (may take longer)
+        answer_text, tools_used = await answer_stage
+    else:
+        # Both stages run together; response is assembled once both finish or time out
+        actions, (answer_text, tools_used) = await asyncio.gather(
+            navigation_stage, answer_stage
+        )
+    print(f"Navigation Actions: {actions}")
+    
+    return ChatResponse(
+        response=answer_text,
+        tools_used=tools_used if tools_used else None,
+        actions=actions if actions else None
+    )
+
+
+async def chat_events(
+    message: str,
+    conversation_history: List[dict]
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Produce chat events for a single message
+    
+    Navigation and the streamed answer start together. The navigation
+    'actions' event is always emitted first (as soon as NavigationService
+    decides or its deadline passes), followed by the answer events buffered
+    or produced by AnswerService.stream_response. In fused mode the actions
+    come from the answer stream itself; anything the model emits before
+    choosing a section is held back until it does (or the answer ends).
+    
+    Args:
+        message: Current user message
+        conversation_history: Previous conversation exchanges
         
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Chat error: {str(e)}")
+    Yields:
+        Event dicts with 'event' and 'data' keys
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + ANSWER_TIMEOUT_SECONDS
+    queue: asyncio.Queue = asyncio.Queue()
+    fused = CHAT_EXECUTION_MODE == "fused"
+    
+    async def pump_answer():
+        try:
+            async for event in answer_service.stream_response(
+                user_message=message,
+                conversation_history=conversation_history,
+                navigate=fused
+            ):
+                await queue.put(event)
+        except Exception as e:
+            await queue.put({"event": "error", "data": {"detail": f"Chat error: {str(e)}"}})
+        finally:
+            await queue.put(None)
+    
+    navigation_task = None if fused else asyncio.create_task(_run_stage(
+        "Navigation",
+        navigation_service.get_navigation_decision(user_message=message),
+        NAVIGATION_TIMEOUT_SECONDS,
+        []
+    ))
+    answer_task = asyncio.create_task(pump_answer())
+    
+    try:
+        if navigation_task:
+            actions = await navigation_task
+            yield {"event": "actions", "data": actions}
+        # Fused mode: events held back until the model picks a section
+        held = [] if fused else None
+        
+        timed_out = False
+        while not timed_out:
+            try:
+                event = await asyncio.wait_for(queue.get(), timeout=max(deadline - loop.time(), 0))
+            except asyncio.TimeoutError:
+                print(f"Answer stage timed out after {ANSWER_TIMEOUT_SECONDS}s")
+                event = {"event": "error", "data": {"detail": ANSWER_TIMEOUT_MESSAGE}}
+                timed_out = True
+            if event is None:
+                break
+            if event["event"] == "actions":
+                if held is not None:
+                    yield event
+                    for held_event in held:
+                        yield held_event
+                    held = None
+            elif held is not None:
+                held.append(event)
+            else:
+                yield event
+        
+        if held is not None:
+            # The model never chose a section
+            yield {"event": "actions", "data": []}
+            for held_event in held:
+                yield held_event
+    finally:
+        # Cancel whatever is still running (client disconnect, timeout, cancel)
+        if navigation_task:
+            navigation_task.cancel()
+        answer_task.cancel()
+
+
+def _format_sse(event: Dict[str, Any]) -> bytes:
+    """Format a chat event as a Server-Sent Events message (same JSON encoding as the API responses)"""
+    return b"event: " + event["event"].encode("utf-8") + b"\ndata: " + dumps(event["data"]) + b"\n\n"
+
+
+@router.post("/chat/stream")
+async def chat_stream(request: ChatRequest):
+    """
+    Streaming Chat Endpoint - Server-Sent Events
+    
+    Event order:
+    1. actions       - navigation actions (as soon as NavigationService decides)
+    2. tool_started  - answer tool about to run ({name, args})
+       tool_finished - answer tool completed ({name, success})
+    3. answer        - incremental answer text ({text})
+    4. done          - answer complete ({tools_used, timestamp})
+       error         - answer failed or timed out ({detail})
+    """
+    async def event_stream():
+        async for event in chat_events(request.message, request.conversation_history or []):
+            if event["event"] == "done":
+                event["data"]["timestamp"] = datetime.now().isoformat()
+            yield _format_sse(event)
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@router.get("/navigation/stats")
+async def navigation_stats():
+    """Navigation path statistics - how many decisions the local fast path answered vs Gemini"""
+    return navigation_service.get_stats()
@@ -0,0 +1,145 @@
+"""
+Response compression middleware - negotiates brotli or gzip for buffered responses
+"""
+
+import gzip
+import os
+from typing import List, Optional
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # optional dependency; gzip only without it
+    brotli = None
+
+# Responses smaller than this are sent as-is (compression overhead outweighs the savings)
+COMPRESSION_MIN_BYTES = int(os.getenv("COMPRESSION_MIN_BYTES", "1024"))
+GZIP_LEVEL = int(os.getenv("GZIP_LEVEL", "6"))
+BROTLI_QUALITY = int(os.getenv("BROTLI_QUALITY", "5"))
+
+# Never compressed: live event streams and formats that are already compressed
+SKIP_CONTENT_TYPES = ("text/event-stream", "image/", "video/", "audio/", "application/zip", "application/gzip")
+
+
+def supported_encodings() -> List[str]:
+    """Encodings this server can produce, in preference order"""
+    return ["br", "gzip"] if brotli is not None else ["gzip"]
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """
+    Pick the best supported encoding from an Accept-Encoding header
+
+    Args:
+        accept_encoding: e.g. "gzip, deflate, br;q=0.9"
+
+    Returns:
+        "br", "gzip" or None (identity)
+    """
+    weights = {}
+    for item in (accept_encoding or "").split(","):
+        coding, _, params = item.strip().partition(";")
+        coding = coding.strip().lower()
+        q = 1.0
+        if params.strip().startswith("q="):
+            try:
+                q = float(params.strip()[2:])
+            except ValueError:
+                q = 0.0
+        if coding:
+            weights[coding] = q
+
+    best, best_q = None, 0.0
+    for coding in supported_encodings():
+        q = weights.get(coding, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=GZIP_LEVEL)
+
+
+class CompressionMiddleware:
+    """
+    ASGI middleware compressing complete (single-chunk) HTTP responses
+
+    Streaming responses (several body chunks, e.g. Server-Sent Events) pass
+    through untouched, so tokens are never held back. Every response that
+    could be compressed gets Vary: Accept-Encoding, including the ones sent
+    as-is to clients that don't accept br/gzip, so shared caches keep the
+    variants apart. A compressed response's ETag is marked weak, since the
+    bytes no longer match the strong validator of the uncompressed payload.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = COMPRESSION_MIN_BYTES):
+        """
+        Args:
+            app: Wrapped ASGI application
+            minimum_size: Smallest body (bytes) worth compressing
+        """
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("Accept-Encoding"))
+        start: List[Optional[Message]] = [None]
+        streaming: List[bool] = [False]
+
+        async def send_compressed(message: Message):
+            if message["type"] == "http.response.start":
+                content_type = Headers(raw=message["headers"]).get("content-type", "")
+                if content_type.startswith(SKIP_CONTENT_TYPES):
+                    # Event streams must reach the client immediately
+                    streaming[0] = True
+                    await send(message)
+                else:
+                    start[0] = message
+                return
+            if message["type"] != "http.response.body" or start[0] is None or streaming[0]:
+                await send(message)
+                return
+
+            start_message, start[0] = start[0], None
+            body = message.get("body", b"")
+            if message.get("more_body", False) or not self._should_compress(start_message, body):
+                streaming[0] = message.get("more_body", False)
+                await send(start_message)
+                await send(message)
+                return
+
+            headers = MutableHeaders(raw=start_message["headers"])
+            headers.add_vary_header("Accept-Encoding")
+            if encoding is None:
+                # Identity for this client, but the representation still depends on Accept-Encoding
+                await send(start_message)
+                await send(message)
+                return
+
+            compressed = compress(body, encoding)
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(compressed))
+            etag = headers.get("ETag")
+            if etag and not etag.startswith("W/"):
+                headers["ETag"] = f"W/{etag}"
+            await send(start_message)
+            await send({"type": "http.response.body", "body": compressed})
+
+        await self.app(scope, receive, send_compressed)
+
+    def _should_compress(self, start_message: Message, body: bytes) -> bool:
+        if len(body) < self.minimum_size or start_message["status"] in (204, 206, 304):
+            return False
+        headers = Headers(raw=start_message["headers"])
+        if "content-encoding" in headers:
+            return False
+        content_type = headers.get("content-type", "")
+        return not content_type.startswith(SKIP_CONTENT_TYPES)
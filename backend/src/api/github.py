@@ -2,26 +2,49 @@
 GitHub API Router - Endpoints for fetching GitHub profile and repository data
 """
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request
 from typing import Optional
-from src.services.github_service import GitHubService
+from src.api.http_cache import cache_control, conditional_json
+from src.services.github_service import get_github_service
+from src.services.projection import project
 import logging
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/github", tags=["GitHub"])
 
-# Initialize GitHub service
-github_service = GitHubService()
+# Process-wide GitHub service (shared with the chat tools and warmup job)
+github_service = get_github_service()
+
+# Sparse fieldsets: ?fields=name,stargazers_count (dotted paths for nested keys, e.g. profile.followers)
+FIELDS_QUERY = Query(None, description="Comma-separated fields to return (dotted paths for nested keys)")
+
+# Per-route browser/CDN caching: max-age, then stale-while-revalidate window (kept below the service TTLs' stale window)
+CACHE_CONTROL = {
+    "profile": cache_control(300, 3600),
+    "repositories": cache_control(300, 3600),
+    "languages": cache_control(3600, 86400),
+    "stats": cache_control(600, 3600),
+    "dashboard": cache_control(300, 86400),
+    "events": cache_control(60, 300),
+    "gists": cache_control(300, 3600),
+    "commits": cache_control(300, 3600),
+    "search": cache_control(60, 300),
+}
 
 
 @router.get("/profile")
-async def get_github_profile(username: Optional[str] = Query(None, description="GitHub username")):
+async def get_github_profile(
+    request: Request,
+    username: Optional[str] = Query(None, description="GitHub username"),
+    fields: Optional[str] = FIELDS_QUERY
+):
     """
     Get GitHub user profile information
     
     Args:
         username: GitHub username (optional, uses authenticated user if not provided)
+        fields: Comma-separated fields to keep (optional, all fields if omitted)
         
     Returns:
         User profile data
@@ -30,7 +53,9 @@ async def get_github_profile(username: Optional[str] = Query(None, description="
         profile = await github_service.get_user_profile(username)
         if not profile:
             raise HTTPException(status_code=404, detail="User not found or API error")
-        return {"success": True, "data": profile}
+        return conditional_json(request, {"success": True, "data": project(profile, fields)}, CACHE_CONTROL["profile"])
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error fetching profile: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error fetching profile: {str(e)}")
@@ -38,9 +63,12 @@ async def get_github_profile(username: Optional[str] = Query(None, description="
 
 @router.get("/repositories")
 async def get_repositories(
+    request: Request,
     username: Optional[str] = Query(None, description="GitHub username"),
     sort: str = Query("updated", description="Sort by: created, updated, pushed, full_name"),
-    per_page: int = Query(100, ge=1, le=100, description="Results per page")
+    per_page: int = Query(100, ge=1, le=100, description="Results per page"),
+    max_pages: int = Query(1, ge=1, le=50, description="Maximum pages to fetch"),
+    fields: Optional[str] = FIELDS_QUERY
 ):
     """
     Get user's repositories
@@ -48,31 +76,34 @@ async def get_repositories(
     Args:
         username: GitHub username (optional)
         sort: Sort order
-        per_page: Number of results
+        per_page: Number of results per page
+        max_pages: Maximum pages to fetch
+        fields: Comma-separated fields to keep (optional, all fields if omitted)
         
     Returns:
         List of repositories
     """
     try:
-        repos = await github_service.get_repositories(username, sort, per_page)
-        return {
+        repos = await github_service.get_repositories(username, sort, per_page, max_pages)
+        return conditional_json(request, {
             "success": True, 
-            "data": repos,
+            "data": project(repos, fields),
             "count": len(repos)
-        }
+        }, CACHE_CONTROL["repositories"])
     except Exception as e:
         logger.error(f"Error fetching repositories: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error fetching repositories: {str(e)}")
 
 
 @router.get("/repositories/{owner}/{repo}/languages")
-async def get_repository_languages(owner: str, repo: str):
+async def get_repository_languages(request: Request, owner: str, repo: str, fields: Optional[str] = FIELDS_QUERY):
     """
     Get languages used in a specific repository
     
     Args:
         owner: Repository owner
         repo: Repository name
+        fields: Comma-separated fields to keep (optional, all fields if omitted)
         
     Returns:
         Dictionary of languages and byte counts
@@ -92,11 +123,11 @@ async def get_repository_languages(owner: str, repo: str):
             for lang, count in languages.items()
         }
         
-        return {
+        return conditional_json(request, {
             "success": True,
-            "data": language_percentages,
+            "data": project(language_percentages, fields),
             "total_bytes": total
-        }
+        }, CACHE_CONTROL["languages"])
     except HTTPException:
         raise
     except Exception as e:
@@ -105,12 +136,13 @@ async def get_repository_languages(owner: str, repo: str):
 
 
 @router.get("/stats/{username}")
-async def get_user_stats(username: str):
+async def get_user_stats(request: Request, username: str, fields: Optional[str] = FIELDS_QUERY):
     """
     Get comprehensive statistics for a GitHub user
     
     Args:
         username: GitHub username
+        fields: Comma-separated fields to keep (optional, all fields if omitted)
         
     Returns:
         User statistics including repos, stars, languages, etc.
@@ -119,34 +151,72 @@ async def get_user_stats(username: str):
         stats = await github_service.get_user_stats(username)
         if not stats:
             raise HTTPException(status_code=404, detail="User not found or API error")
-        return {"success": True, "data": stats}
+        return conditional_json(request, {"success": True, "data": project(stats, fields)}, CACHE_CONTROL["stats"])
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error fetching stats: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error fetching stats: {str(e)}")
 
 
+@router.get("/dashboard/{username}")
+async def get_dashboard(
+    request: Request,
+    username: str,
+    repos: int = Query(6, ge=1, le=30, description="Recently updated repositories to include"),
+    activity: int = Query(10, ge=0, le=100, description="Recent public events to include"),
+    fields: Optional[str] = FIELDS_QUERY
+):
+    """
+    Get the portfolio GitHub section in one request
+    
+    Args:
+        username: GitHub username
+        repos: Number of recently updated repositories
+        activity: Number of recent public events
+        fields: Comma-separated fields to keep (optional, all fields if omitted)
+        
+    Returns:
+        Profile, statistics, language breakdown, top and recent repositories, and recent activity
+    """
+    try:
+        dashboard = await github_service.get_dashboard(username, repo_limit=repos, activity_limit=activity)
+    except Exception as e:
+        logger.error(f"Error fetching dashboard: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error fetching dashboard: {str(e)}")
+    
+    if not dashboard:
+        raise HTTPException(status_code=404, detail="User not found or API error")
+    return conditional_json(request, {"success": True, "data": project(dashboard, fields)}, CACHE_CONTROL["dashboard"])
+
+
 @router.get("/events/{username}")
 async def get_user_events(
+    request: Request,
     username: str,
-    per_page: int = Query(30, ge=1, le=100, description="Results per page")
+    per_page: int = Query(30, ge=1, le=100, description="Results per page"),
+    max_pages: int = Query(1, ge=1, le=50, description="Maximum pages to fetch"),
+    fields: Optional[str] = FIELDS_QUERY
 ):
     """
     Get recent public events for a user
     
     Args:
         username: GitHub username
-        per_page: Number of results
+        per_page: Number of results per page
+        max_pages: Maximum pages to fetch
+        fields: Comma-separated fields to keep (optional, all fields if omitted)
         
     Returns:
         List of public events
     """
     try:
-        events = await github_service.get_user_events(username, per_page)
-        return {
+        events = await github_service.get_user_events(username, per_page, max_pages)
+        return conditional_json(request, {
             "success": True,
-            "data": events,
+            "data": project(events, fields),
             "count": len(events)
-        }
+        }, CACHE_CONTROL["events"])
     except Exception as e:
         logger.error(f"Error fetching events: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error fetching events: {str(e)}")
@@ -154,26 +224,31 @@ async def get_user_events(
 
 @router.get("/gists/{username}")
 async def get_user_gists(
+    request: Request,
     username: str,
-    per_page: int = Query(30, ge=1, le=100, description="Results per page")
+    per_page: int = Query(30, ge=1, le=100, description="Results per page"),
+    max_pages: int = Query(1, ge=1, le=50, description="Maximum pages to fetch"),
+    fields: Optional[str] = FIELDS_QUERY
 ):
     """
     Get user's public gists
     
     Args:
         username: GitHub username
-        per_page: Number of results
+        per_page: Number of results per page
+        max_pages: Maximum pages to fetch
+        fields: Comma-separated fields to keep (optional, all fields if omitted)
         
     Returns:
         List of gists
     """
     try:
-        gists = await github_service.get_user_gists(username, per_page)
-        return {
+        gists = await github_service.get_user_gists(username, per_page, max_pages)
+        return conditional_json(request, {
             "success": True,
-            "data": gists,
+            "data": project(gists, fields),
             "count": len(gists)
-        }
+        }, CACHE_CONTROL["gists"])
     except Exception as e:
         logger.error(f"Error fetching gists: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error fetching gists: {str(e)}")
@@ -181,9 +256,12 @@ async def get_user_gists(
 
 @router.get("/repositories/{owner}/{repo}/commits")
 async def get_repository_commits(
+    request: Request,
     owner: str,
     repo: str,
-    per_page: int = Query(30, ge=1, le=100, description="Results per page")
+    per_page: int = Query(30, ge=1, le=100, description="Results per page"),
+    max_pages: int = Query(1, ge=1, le=50, description="Maximum pages to fetch"),
+    fields: Optional[str] = FIELDS_QUERY
 ):
     """
     Get commits for a specific repository
@@ -191,18 +269,20 @@ async def get_repository_commits(
     Args:
         owner: Repository owner
         repo: Repository name
-        per_page: Number of results
+        per_page: Number of results per page
+        max_pages: Maximum pages to fetch
+        fields: Comma-separated fields to keep (optional, all fields if omitted)
         
     Returns:
         List of commits
     """
     try:
-        commits = await github_service.get_repository_commits(owner, repo, per_page)
-        return {
+        commits = await github_service.get_repository_commits(owner, repo, per_page, max_pages)
+        return conditional_json(request, {
             "success": True,
-            "data": commits,
+            "data": project(commits, fields),
             "count": len(commits)
-        }
+        }, CACHE_CONTROL["commits"])
     except Exception as e:
         logger.error(f"Error fetching commits: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error fetching commits: {str(e)}")
@@ -210,10 +290,12 @@ async def get_repository_commits(
 
 @router.get("/search/repositories")
 async def search_repositories(
+    request: Request,
     q: str = Query(..., description="Search query"),
     sort: str = Query("stars", description="Sort by: stars, forks, help-wanted-issues, updated"),
     order: str = Query("desc", description="Order: asc or desc"),
-    per_page: int = Query(30, ge=1, le=100, description="Results per page")
+    per_page: int = Query(30, ge=1, le=100, description="Results per page"),
+    fields: Optional[str] = FIELDS_QUERY
 ):
     """
     Search GitHub repositories
@@ -223,17 +305,44 @@ async def search_repositories(
         sort: Sort field
         order: Sort order
         per_page: Number of results
+        fields: Comma-separated fields to keep (optional, all fields if omitted)
         
     Returns:
         List of matching repositories
     """
     try:
         repos = await github_service.search_repositories(q, sort, order, per_page)
-        return {
+        return conditional_json(request, {
             "success": True,
-            "data": repos,
+            "data": project(repos, fields),
             "count": len(repos)
-        }
+        }, CACHE_CONTROL["search"])
     except Exception as e:
         logger.error(f"Error searching repositories: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error searching repositories: {str(e)}")
+
+
+@router.get("/cache/stats")
+async def get_cache_stats():
+    """
+    Get GitHub response cache counters
+    
+    Returns:
+        Conditional-request (ETag) counters, response cache (TTL) counters,
+        disk cache counters and rate-limit scheduler state
+    """
+    return {"success": True, "data": await github_service.get_cache_stats()}
+
+
+@router.get("/warmup/status")
+async def get_warmup_status(request: Request):
+    """
+    Get the background cache warmup status
+    
+    Returns:
+        Configured usernames, last refresh time and duration, or enabled=False
+    """
+    warmup = getattr(request.app.state, "github_warmup", None)
+    if warmup is None:
+        return {"success": True, "data": {"enabled": False}}
+    return {"success": True, "data": {"enabled": True, **warmup.status()}}
@@ -0,0 +1,65 @@
+"""
+HTTP caching helpers for API routes - strong ETags, conditional GET and Cache-Control
+"""
+
+import hashlib
+from typing import Any, Optional
+from fastapi import Request, Response
+from src.services.serialization import dumps
+
+
+def cache_control(max_age: int, stale_while_revalidate: int = 0, public: bool = True) -> str:
+    """
+    Build a Cache-Control header value
+
+    Args:
+        max_age: Seconds a browser or CDN may reuse the response without asking
+        stale_while_revalidate: Further seconds it may serve it stale while revalidating in the background
+        public: Allow shared caches (CDNs) to store the response
+
+    Returns:
+        Header value, e.g. "public, max-age=300, stale-while-revalidate=3600"
+    """
+    directives = ["public" if public else "private", f"max-age={max_age}"]
+    if stale_while_revalidate:
+        directives.append(f"stale-while-revalidate={stale_while_revalidate}")
+    return ", ".join(directives)
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag (as RFC 9110 requires for GET)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if (candidate[2:] if candidate.startswith("W/") else candidate) == opaque:
+            return True
+    return False
+
+
+def conditional_json(request: Request, content: Any, cache_control_value: str) -> Response:
+    """
+    Serialize a JSON payload with a strong ETag, answering 304 when the client already has it
+
+    The ETag is a hash of the exact response bytes, so it changes only when the
+    cached payload behind the route changes.
+
+    Args:
+        request: Incoming request (for If-None-Match)
+        content: JSON-serializable payload
+        cache_control_value: Cache-Control header for the route
+
+    Returns:
+        200 JSON response, or an empty 304 Not Modified
+    """
+    body = dumps(content)
+    headers = {
+        "ETag": f'"{hashlib.sha256(body).hexdigest()[:32]}"',
+        "Cache-Control": cache_control_value,
+    }
+    if etag_matches(request.headers.get("If-None-Match"), headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -0,0 +1,14 @@
+"""
+Response classes for the API
+"""
+
+from typing import Any
+from fastapi.responses import JSONResponse
+from src.services.serialization import dumps
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson when available (compact output either way)"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
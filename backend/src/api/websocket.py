@@ -0,0 +1,108 @@
+"""
+WebSocket Chat API - Persistent chat channel with server-held conversation state
+One connection = one conversation; history lives on the server for the connection's lifetime
+"""
+import asyncio
+import json
+from contextlib import aclosing
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from src.api.chat import chat_events
+from src.services.serialization import dumps
+
+router = APIRouter(tags=["chat"])
+
+# Exchanges kept per connection (AnswerService only uses the most recent ones)
+MAX_HISTORY_EXCHANGES = 10
+
+
+@router.websocket("/ws/chat")
+async def chat_websocket(websocket: WebSocket):
+    """
+    Persistent Chat Channel
+
+    Client → Server:
+    - {"type": "message", "message": "..."}  ask a question
+    - {"type": "cancel"}                     cancel the in-flight answer
+    - {"type": "reset"}                      clear the server-held history
+
+    Server → Client ({"type": <event>, "data": ...}):
+    - actions, tool_started, tool_finished, answer, done, error
+      (same events as /api/chat/stream)
+    - cancelled  the in-flight answer was cancelled
+    - reset      history was cleared
+
+    Only one answer is in flight per connection; the history is updated
+    when an answer completes and is never re-sent by the client.
+    """
+    await websocket.accept()
+
+    history: List[Dict[str, str]] = []
+    current_task: Optional[asyncio.Task] = None
+
+    async def send(event: str, data: Any):
+        # Same JSON encoding as the HTTP and SSE responses
+        await websocket.send_text(dumps({"type": event, "data": data}).decode("utf-8"))
+
+    def answer_finished(task: asyncio.Task):
+        # Retrieve the outcome so failures (e.g. a send after disconnect) are reported, not lost
+        if not task.cancelled() and task.exception() is not None:
+            print(f"WebSocket answer error: {task.exception()}")
+
+    async def answer(message: str):
+        answer_parts = []
+        async with aclosing(chat_events(message, list(history))) as events:
+            async for event in events:
+                if event["event"] == "answer":
+                    answer_parts.append(event["data"]["text"])
+                elif event["event"] == "done":
+                    event["data"]["timestamp"] = datetime.now().isoformat()
+                    history.append({"user": message, "assistant": "".join(answer_parts)})
+                    del history[:-MAX_HISTORY_EXCHANGES]
+                await send(event["event"], event["data"])
+
+    try:
+        while True:
+            frame = await websocket.receive()
+            if frame["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(frame.get("code", 1000))
+            if frame.get("text") is None:
+                await send("error", {"detail": "Binary frames are not supported; send JSON text"})
+                continue
+            try:
+                payload = json.loads(frame["text"])
+            except ValueError:  # json.JSONDecodeError
+                await send("error", {"detail": "Malformed JSON"})
+                continue
+            message_type = payload.get("type", "message") if isinstance(payload, dict) else None
+
+            if message_type == "message":
+                message = str(payload.get("message") or "").strip()
+                if not message:
+                    await send("error", {"detail": "Message is empty"})
+                elif current_task and not current_task.done():
+                    await send("error", {"detail": "An answer is already in progress; cancel it first"})
+                else:
+                    current_task = asyncio.create_task(answer(message))
+                    current_task.add_done_callback(answer_finished)
+
+            elif message_type == "cancel":
+                if current_task and not current_task.done():
+                    current_task.cancel()
+                    await asyncio.gather(current_task, return_exceptions=True)
+                    await send("cancelled", {})
+
+            elif message_type == "reset":
+                history.clear()
+                await send("reset", {})
+
+            else:
+                await send("error", {"detail": f"Unknown message type: {message_type}"})
+
+    except WebSocketDisconnect:
+        pass
+    finally:
+        if current_task and not current_task.done():
+            current_task.cancel()
+            await asyncio.gather(current_task, return_exceptions=True)
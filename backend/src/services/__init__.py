@@ -2,8 +2,8 @@
 Services module for external API integrations
 """
 
-from .github_service import GitHubService
+from .github_service import GitHubService, get_github_service
 from .answer_service import AnswerService
 from .navigation_service import NavigationService
 
-__all__ = ['GitHubService', 'AnswerService', 'NavigationService']
+__all__ = ['GitHubService', 'get_github_service', 'AnswerService', 'NavigationService']
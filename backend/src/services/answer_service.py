@@ -4,10 +4,12 @@ Handles question answering using profile and GitHub tools
 """
 from google import genai
 from google.genai import types
+import asyncio
 import os
 import json
+import time
 from pathlib import Path
-from typing import List, Tuple, Dict, Any
+from typing import List, Tuple, Dict, Any, AsyncIterator
 from src.tools.profile_tools import get_sriharsha_profile, PROFILE_TOOL_DECLARATION
 from src.tools.github_tools import (
     get_github_profile,
@@ -16,6 +18,35 @@ from src.tools.github_tools import (
     search_github_repositories,
     GITHUB_TOOL_DECLARATIONS
 )
+from src.tools.navigation_tools import build_section_table, navigation_tool_declaration
+from src.services.navigation_service import NAVIGATION_SECTIONS_CHECK_SECONDS
+from src.services.serialization import to_jsonable
+from src.services.resilience import (
+    GEMINI_RETRIES,
+    GEMINI_TIMEOUT_SECONDS,
+    GEMINI_TRANSIENT_ERRORS,
+    CircuitOpenError,
+    get_breaker,
+    resilient_call
+)
+
+
+# Deadline for a single tool call (tools from one model turn run concurrently)
+TOOL_TIMEOUT_SECONDS = float(os.getenv("TOOL_TIMEOUT_SECONDS", "10"))
+
+# Served instead of an answer while the Gemini circuit breaker is open
+DEGRADED_ANSWER = (
+    "I'm having trouble reaching my AI service right now. Please try again in a minute - "
+    "in the meantime, feel free to explore the portfolio sections directly."
+)
+
+# Fused mode: the answer call also picks the portfolio section to show
+NAVIGATE_TOOL = "navigate_to_section"
+FUSED_NAVIGATION_INSTRUCTION = """
+
+Portfolio navigation: in your first response, call navigate_to_section with the section that best
+matches the visitor's message, alongside any other tools you need. When no other tool is needed,
+write your answer in that same response."""
 
 
 class AnswerService:
@@ -23,6 +54,10 @@ class AnswerService:
     
     def __init__(self):
         self.model_name = 'gemini-2.5-flash'
+        self.tool_timeout = TOOL_TIMEOUT_SECONDS
+        self.timeout = GEMINI_TIMEOUT_SECONDS
+        self.retries = GEMINI_RETRIES
+        self.breaker = get_breaker("gemini")
         self.client = genai.Client(api_key=os.getenv("GOOGLE_API_KEY"))
         
         # Load system prompt
@@ -57,6 +92,190 @@ class AnswerService:
             system_instruction=self.system_prompt,
             tools=[self.tools],
         )
+        
+        # Fused mode: same tools plus navigate_to_section, so one generation yields answer and section
+        self.sections_file = base_dir.parent.parent / "sections.json"
+        self._sections_checked_at = time.monotonic()
+        self._load_sections()
+    
+    def _load_sections(self):
+        """Load sections.json and rebuild the fused-mode section table and Gemini config"""
+        self._sections_mtime = os.stat(self.sections_file).st_mtime
+        with open(self.sections_file, 'r', encoding='utf-8') as f:
+            sections = json.load(f)['sections']
+        self.section_table = build_section_table(sections)
+        self.fused_config = types.GenerateContentConfig(
+            temperature=0.7,
+            top_p=0.95,
+            top_k=40,
+            max_output_tokens=2048,
+            system_instruction=self.system_prompt + FUSED_NAVIGATION_INSTRUCTION,
+            tools=[types.Tool(function_declarations=[
+                PROFILE_TOOL_DECLARATION,
+                *GITHUB_TOOL_DECLARATIONS,
+                navigation_tool_declaration(sections)
+            ])],
+        )
+    
+    def _check_sections(self):
+        """Reload sections.json if it changed (checked at most every NAVIGATION_SECTIONS_CHECK_SECONDS)"""
+        now = time.monotonic()
+        if now - self._sections_checked_at < NAVIGATION_SECTIONS_CHECK_SECONDS:
+            return
+        self._sections_checked_at = now
+        try:
+            if os.stat(self.sections_file).st_mtime != self._sections_mtime:
+                self._load_sections()
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Sections reload error: {e}")
+    
+    def _build_contents(
+        self,
+        user_message: str,
+        conversation_history: List[dict]
+    ) -> List[types.Content]:
+        """
+        Build Gemini contents from conversation history and the current message
+        
+        Args:
+            user_message: Current user message
+            conversation_history: Previous conversation exchanges
+            
+        Returns:
+            List of Content objects
+        """
+        contents = []
+        for msg in conversation_history[-3:]:  # Last 3 exchanges
+            user_msg = msg.get('user') or msg.get('message')
+            assistant_msg = msg.get('assistant') or msg.get('response')
+            
+            if user_msg:
+                contents.append(
+                    types.Content(role="user", parts=[types.Part(text=str(user_msg))])
+                )
+            if assistant_msg:
+                contents.append(
+                    types.Content(role="model", parts=[types.Part(text=str(assistant_msg))])
+                )
+        
+        # Add current message
+        contents.append(
+            types.Content(role="user", parts=[types.Part(text=user_message)])
+        )
+        return contents
+    
+    async def _execute_tool(self, function_name: str, function_args: Dict[str, Any]) -> types.Part:
+        """
+        Execute a tool and wrap its result (or error) as a function response part
+        
+        Args:
+            function_name: Name of the tool requested by the model
+            function_args: Arguments supplied by the model
+            
+        Returns:
+            Function response Part to send back to the model
+        """
+        if function_name == NAVIGATE_TOOL:
+            # Navigation happens in the browser; just confirm the choice to the model
+            section_id = function_args.get('section_id')
+            return types.Part.from_function_response(
+                name=function_name,
+                response={"result": {"section_id": section_id, "navigated": section_id in self.section_table}}
+            )
+        
+        if function_name not in self.tool_functions:
+            # Function not found
+            return types.Part.from_function_response(
+                name=function_name,
+                response={"error": "Function not found"}
+            )
+        
+        try:
+            # Execute tool function under its own deadline
+            function_response = await asyncio.wait_for(
+                self.tool_functions[function_name](**function_args),
+                timeout=self.tool_timeout
+            )
+            response_data = to_jsonable(function_response)
+            return types.Part.from_function_response(
+                name=function_name,
+                response={"result": response_data}
+            )
+        except asyncio.TimeoutError:
+            return types.Part.from_function_response(
+                name=function_name,
+                response={"error": f"Tool timed out after {self.tool_timeout}s"}
+            )
+        except Exception as e:
+            # Handle function execution error
+            return types.Part.from_function_response(
+                name=function_name,
+                response={"error": str(e)}
+            )
+    
+    @staticmethod
+    def _get_function_calls(parts: List[types.Part]) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        Collect every function call from a model turn
+        
+        Args:
+            parts: Parts of the model's response content
+            
+        Returns:
+            List of (function_name, function_args) in the order the model emitted them
+        """
+        return [
+            (part.function_call.name, dict(part.function_call.args) if part.function_call.args else {})
+            for part in parts
+            if part.function_call
+        ]
+    
+    @staticmethod
+    def _get_text(parts: List[types.Part]) -> str:
+        """Answer text of a model turn (thoughts and function calls excluded)"""
+        return "".join(part.text for part in parts if part.text and not part.thought)
+    
+    def _navigation_actions(self, function_calls: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Build navigation actions from navigate_to_section calls (the last valid one wins)
+        
+        Args:
+            function_calls: List of (function_name, function_args) from one model turn
+            
+        Returns:
+            List with one navigation action, or empty if the model chose no known section
+        """
+        for function_name, function_args in reversed(function_calls):
+            section = self.section_table.get(function_args.get('section_id'))
+            if function_name == NAVIGATE_TOOL and section:
+                return [{
+                    'type': 'navigate',
+                    'section_id': section['section_id'],
+                    'section_name': section['section_name'],
+                    'reason': section['reason'],
+                    'audio_text': section['audio_text'],
+                    'path': 'fused',
+                    'confidence': None
+                }]
+        return []
+    
+    async def _execute_tool_calls(
+        self,
+        function_calls: List[Tuple[str, Dict[str, Any]]]
+    ) -> List[types.Part]:
+        """
+        Execute all function calls from one model turn concurrently
+        
+        Args:
+            function_calls: List of (function_name, function_args)
+            
+        Returns:
+            Function response Parts, in the same order as the calls
+        """
+        return await asyncio.gather(*[
+            self._execute_tool(function_name, function_args)
+            for function_name, function_args in function_calls
+        ])
     
     async def get_response(
         self, 
@@ -73,26 +292,50 @@ class AnswerService:
         Returns:
             Tuple of (response_text, tools_used)
         """
+        response_text, tools_used, _ = await self._generate(user_message, conversation_history, self.config)
+        return (response_text, tools_used)
+    
+    async def get_response_and_navigation(
+        self,
+        user_message: str,
+        conversation_history: List[dict]
+    ) -> Tuple[str, List[str], List[Dict[str, Any]]]:
+        """
+        Get the answer and the navigation decision from one generation (fused mode)
+        
+        The model calls navigate_to_section alongside its other tools or its
+        answer, replacing the separate NavigationService call.
+        
+        Args:
+            user_message: Current user message
+            conversation_history: Previous conversation exchanges
+            
+        Returns:
+            Tuple of (response_text, tools_used, navigation_actions)
+        """
+        self._check_sections()
+        return await self._generate(user_message, conversation_history, self.fused_config)
+    
+    async def _generate(
+        self,
+        user_message: str,
+        conversation_history: List[dict],
+        config: types.GenerateContentConfig
+    ) -> Tuple[str, List[str], List[Dict[str, Any]]]:
+        """
+        Run the tool calling loop with the given config
+        
+        Args:
+            user_message: Current user message
+            conversation_history: Previous conversation exchanges
+            config: self.config, or self.fused_config to also pick a section
+            
+        Returns:
+            Tuple of (response_text, tools_used, navigation_actions)
+        """
+        actions = []
         try:
-            # Build conversation history
-            contents = []
-            for msg in conversation_history[-3:]:  # Last 3 exchanges
-                user_msg = msg.get('user') or msg.get('message')
-                assistant_msg = msg.get('assistant') or msg.get('response')
-                
-                if user_msg:
-                    contents.append(
-                        types.Content(role="user", parts=[types.Part(text=str(user_msg))])
-                    )
-                if assistant_msg:
-                    contents.append(
-                        types.Content(role="model", parts=[types.Part(text=str(assistant_msg))])
-                    )
-            
-            # Add current message
-            contents.append(
-                types.Content(role="user", parts=[types.Part(text=user_message)])
-            )
+            contents = self._build_contents(user_message, conversation_history)
             
             tools_used = []
             max_iterations = 5
@@ -102,72 +345,180 @@ class AnswerService:
             while iteration < max_iterations:
                 iteration += 1
                 
-                response = self.client.models.generate_content(
-                    model=self.model_name,
-                    contents=contents,
-                    config=self.config
+                # Deadline, jittered retries and circuit breaker (generation has no side effects)
+                response = await resilient_call(
+                    lambda: self.client.aio.models.generate_content(
+                        model=self.model_name,
+                        contents=contents,
+                        config=config
+                    ),
+                    self.breaker,
+                    self.timeout,
+                    retries=self.retries,
+                    retry_on=GEMINI_TRANSIENT_ERRORS
                 )
                 
                 if response.candidates and response.candidates[0].content.parts:
-                    first_part = response.candidates[0].content.parts[0]
+                    parts = response.candidates[0].content.parts
+                    function_calls = self._get_function_calls(parts)
+                    actions = self._navigation_actions(function_calls) or actions
+                    tool_calls = [call for call in function_calls if call[0] != NAVIGATE_TOOL]
+                    
+                    if not tool_calls and function_calls and self._get_text(parts):
+                        # Navigation chosen alongside the final answer - no follow-up turn needed
+                        return (self._get_text(parts), tools_used, actions)
                     
-                    if first_part.function_call:
-                        function_call = first_part.function_call
-                        function_name = function_call.name
-                        function_args = dict(function_call.args) if function_call.args else {}
+                    if function_calls:
+                        tools_used.extend(function_name for function_name, _ in tool_calls)
                         
-                        tools_used.append(function_name)
+                        # Run every requested tool concurrently
+                        function_response_parts = await self._execute_tool_calls(function_calls)
                         
-                        if function_name in self.tool_functions:
-                            try:
-                                # Execute tool function
-                                function_response = await self.tool_functions[function_name](**function_args)
-                                response_data = json.loads(json.dumps(function_response, default=str))
-                                
-                                # Append model's response with function call
-                                contents.append(response.candidates[0].content)
-                                
-                                # Append function response
-                                function_response_part = types.Part.from_function_response(
-                                    name=function_name,
-                                    response={"result": response_data}
-                                )
-                                
-                                contents.append(
-                                    types.Content(role="user", parts=[function_response_part])
-                                )
-                                
-                            except Exception as e:
-                                # Handle function execution error
-                                contents.append(response.candidates[0].content)
-                                error_response_part = types.Part.from_function_response(
-                                    name=function_name,
-                                    response={"error": str(e)}
-                                )
-                                contents.append(
-                                    types.Content(role="user", parts=[error_response_part])
-                                )
-                        else:
-                            # Function not found
-                            contents.append(response.candidates[0].content)
-                            error_response_part = types.Part.from_function_response(
-                                name=function_name,
-                                response={"error": "Function not found"}
-                            )
-                            contents.append(
-                                types.Content(role="user", parts=[error_response_part])
-                            )
+                        # Append model's response with function call(s)
+                        contents.append(response.candidates[0].content)
+                        
+                        # Append all function responses in a single turn
+                        contents.append(
+                            types.Content(role="user", parts=function_response_parts)
+                        )
                     else:
                         # Got final text response
-                        return (response.text, tools_used)
+                        return (response.text, tools_used, actions)
                 else:
                     break
             
             # Max iterations reached
             return (
                 "I apologize, but I'm having trouble processing your request. Please try rephrasing your question.",
-                tools_used
+                tools_used,
+                actions
             )
             
+        except CircuitOpenError:
+            return (DEGRADED_ANSWER, [], actions)
+        except Exception as e:
+            return (f"Error getting response: {str(e)}", [], actions)
+    
+    async def stream_response(
+        self,
+        user_message: str,
+        conversation_history: List[dict],
+        navigate: bool = False
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream answer events for user query using Gemini's streaming API
+        
+        Events (dicts with 'event' and 'data' keys):
+        - actions: navigation actions, as soon as the model picks a section (navigate only)
+        - tool_started: {"name", "args"} before a tool runs
+        - tool_finished: {"name", "success"} after a tool runs
+        - answer: {"text"} incremental answer text
+        - done: {"tools_used"} when the answer is complete
+        - error: {"detail"} when the answer could not be produced
+        
+        Args:
+            user_message: Current user message
+            conversation_history: Previous conversation exchanges
+            navigate: Fused mode - the model also picks the portfolio section
+            
+        Yields:
+            Answer events in the order they happen
+        """
+        if navigate:
+            self._check_sections()
+        config = self.fused_config if navigate else self.config
+        try:
+            contents = self._build_contents(user_message, conversation_history)
+            
+            tools_used = []
+            max_iterations = 5
+            
+            # Tool calling loop (streamed)
+            for _ in range(max_iterations):
+                model_parts = []
+                answered = False
+                
+                # Opening the stream is retried; once text has been sent it is not
+                stream = await resilient_call(
+                    lambda: self.client.aio.models.generate_content_stream(
+                        model=self.model_name,
+                        contents=contents,
+                        config=config
+                    ),
+                    self.breaker,
+                    self.timeout,
+                    retries=self.retries,
+                    retry_on=GEMINI_TRANSIENT_ERRORS
+                )
+                
+                try:
+                    async for chunk in stream:
+                        if not (chunk.candidates and chunk.candidates[0].content and chunk.candidates[0].content.parts):
+                            continue
+                        
+                        for part in chunk.candidates[0].content.parts:
+                            model_parts.append(part)
+                            if part.text and not part.thought and not part.function_call:
+                                answered = True
+                                yield {"event": "answer", "data": {"text": part.text}}
+                            elif part.function_call and part.function_call.name == NAVIGATE_TOOL:
+                                actions = self._navigation_actions(self._get_function_calls([part]))
+                                if actions:
+                                    yield {"event": "actions", "data": actions}
+                except GEMINI_TRANSIENT_ERRORS:
+                    self.breaker.record_failure()
+                    raise
+                
+                function_calls = self._get_function_calls(model_parts)
+                tool_calls = [call for call in function_calls if call[0] != NAVIGATE_TOOL]
+                if not function_calls or (not tool_calls and answered):
+                    # Got final text response
+                    yield {"event": "done", "data": {"tools_used": tools_used}}
+                    return
+                
+                # Append model's turn with function call(s)
+                contents.append(types.Content(role="model", parts=model_parts))
+                
+                # Run every requested tool concurrently, reporting each as it finishes
+                pending = {}
+                response_parts = [None] * len(function_calls)
+                for index, (function_name, function_args) in enumerate(function_calls):
+                    if function_name == NAVIGATE_TOOL:
+                        response_parts[index] = await self._execute_tool(function_name, function_args)
+                        continue
+                    tools_used.append(function_name)
+                    yield {"event": "tool_started", "data": {"name": function_name, "args": function_args}}
+                    pending[asyncio.create_task(self._execute_tool(function_name, function_args))] = index
+                
+                try:
+                    while pending:
+                        done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                        for task in done:
+                            index = pending.pop(task)
+                            part = task.result()
+                            response_parts[index] = part
+                            yield {
+                                "event": "tool_finished",
+                                "data": {
+                                    "name": function_calls[index][0],
+                                    "success": "error" not in part.function_response.response
+                                }
+                            }
+                finally:
+                    for task in pending:
+                        task.cancel()
+                
+                # Append function response(s)
+                contents.append(types.Content(role="user", parts=response_parts))
+            
+            # Max iterations reached
+            yield {
+                "event": "error",
+                "data": {"detail": "I apologize, but I'm having trouble processing your request. Please try rephrasing your question."}
+            }
+            
+        except CircuitOpenError:
+            yield {"event": "answer", "data": {"text": DEGRADED_ANSWER}}
+            yield {"event": "done", "data": {"tools_used": [], "degraded": True}}
         except Exception as e:
-            return (f"Error getting response: {str(e)}", [])
+            yield {"event": "error", "data": {"detail": f"Error getting response: {str(e)}"}}
@@ -0,0 +1,134 @@
+"""
+In-process TTL cache with LRU eviction and stale-while-revalidate
+Used by GitHubService so hot data is served without waiting on GitHub
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+import logging
+from .rate_limit import background_priority
+from .single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+
+class TTLCache:
+    """
+    Bounded LRU cache whose entries expire after a per-entry TTL
+
+    Expired entries stay servable for `stale_ttl` seconds: a stale read returns
+    the old value immediately and starts a single background refresh for the key.
+    Concurrent misses for the same key share one load.
+    Empty results (None, {}, []) are never cached, so errors are retried.
+    """
+
+    def __init__(self, max_entries: int = 256, stale_ttl: float = 86400):
+        """
+        Args:
+            max_entries: Maximum number of entries before LRU eviction
+            stale_ttl: Seconds after expiry during which stale values are still served
+        """
+        self.max_entries = max_entries
+        self.stale_ttl = stale_ttl
+        self._entries: "OrderedDict[Hashable, Dict[str, Any]]" = OrderedDict()
+        self._refreshing: Dict[Hashable, asyncio.Task] = {}
+        self._loads = SingleFlight()
+        self._stats = {"hits": 0, "stale_hits": 0, "misses": 0, "refreshes": 0, "evictions": 0}
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Get a value regardless of freshness (None if absent or past the stale window)"""
+        entry = self._entries.get(key)
+        if entry and time.monotonic() < entry["expires_at"] + self.stale_ttl:
+            return entry["value"]
+        return None
+
+    def set(self, key: Hashable, value: Any, ttl: float):
+        """Store a value for `ttl` seconds, evicting the least recently used entries"""
+        if not value:
+            return
+        self._entries[key] = {"value": value, "expires_at": time.monotonic() + ttl}
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._stats["evictions"] += 1
+
+    def invalidate(self, key: Hashable):
+        """Drop a single entry"""
+        self._entries.pop(key, None)
+
+    def clear(self):
+        """Drop all entries"""
+        self._entries.clear()
+
+    async def get_or_load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: float
+    ) -> Any:
+        """
+        Get a cached value, loading or revalidating it as needed
+
+        Args:
+            key: Cache key
+            loader: Zero-argument coroutine function that fetches a fresh value
+            ttl: Freshness lifetime in seconds for a newly loaded value
+
+        Returns:
+            Fresh value, stale value (refresh scheduled in background), or loaded value
+        """
+        entry = self._entries.get(key)
+        if entry:
+            now = time.monotonic()
+            if now < entry["expires_at"]:
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+                return entry["value"]
+            if now < entry["expires_at"] + self.stale_ttl:
+                self._entries.move_to_end(key)
+                self._stats["stale_hits"] += 1
+                self._schedule_refresh(key, loader, ttl)
+                return entry["value"]
+
+        self._stats["misses"] += 1
+        return await self._loads.do(key, lambda: self.refresh(key, loader, ttl))
+
+    async def refresh(self, key: Hashable, loader: Callable[[], Awaitable[Any]], ttl: float) -> Any:
+        """Load a fresh value now and store it, regardless of the current entry"""
+        value = await loader()
+        self.set(key, value, ttl)
+        return value
+
+    def _schedule_refresh(self, key: Hashable, loader: Callable[[], Awaitable[Any]], ttl: float):
+        """Start one background refresh per key (no-op if one is already running)"""
+        if key in self._refreshing:
+            return
+        self._refreshing[key] = asyncio.create_task(self._background_refresh(key, loader, ttl))
+
+    async def _background_refresh(self, key: Hashable, loader: Callable[[], Awaitable[Any]], ttl: float):
+        try:
+            self._stats["refreshes"] += 1
+            with background_priority():
+                await self.refresh(key, loader, ttl)
+        except Exception as e:
+            logger.error(f"Background refresh failed for {key}: {str(e)}")
+        finally:
+            self._refreshing.pop(key, None)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache counters
+
+        Returns:
+            Dictionary with hits, stale_hits, misses, refreshes, evictions,
+            current entry count and hit rate
+        """
+        lookups = self._stats["hits"] + self._stats["stale_hits"] + self._stats["misses"]
+        served = self._stats["hits"] + self._stats["stale_hits"]
+        return {
+            **self._stats,
+            "entries": len(self._entries),
+            "hit_rate": round(served / lookups, 4) if lookups else 0.0
+        }
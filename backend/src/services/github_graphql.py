@@ -0,0 +1,236 @@
+"""
+GitHub GraphQL client for fetching a user's profile, repositories and languages in one query
+Results are mapped into the same dicts the REST methods in GitHubService return
+"""
+
+import asyncio
+import os
+from typing import Dict, List, Optional, Any
+import logging
+import aiohttp
+from .http_session import get_http_session
+from .rate_limit import get_rate_limiter
+from .resilience import GITHUB_RETRIES, GITHUB_TIMEOUT_SECONDS, CircuitOpenError, get_breaker, resilient_call
+
+logger = logging.getLogger(__name__)
+
+GRAPHQL_URL = os.getenv("GITHUB_GRAPHQL_URL", "https://api.github.com/graphql")
+
+USER_BUNDLE_QUERY = """
+query($login: String!, $cursor: String) {
+  user(login: $login) {
+    login
+    name
+    bio
+    avatarUrl
+    location
+    company
+    websiteUrl
+    email
+    twitterUsername
+    createdAt
+    updatedAt
+    url
+    gists(privacy: PUBLIC) { totalCount }
+    followers { totalCount }
+    following { totalCount }
+    repositories(
+      first: 100
+      after: $cursor
+      privacy: PUBLIC
+      ownerAffiliations: OWNER
+      orderBy: {field: UPDATED_AT, direction: DESC}
+    ) {
+      totalCount
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        name
+        nameWithOwner
+        description
+        url
+        homepageUrl
+        primaryLanguage { name }
+        stargazerCount
+        watchers { totalCount }
+        forkCount
+        issues(states: OPEN) { totalCount }
+        diskUsage
+        defaultBranchRef { name }
+        repositoryTopics(first: 20) { nodes { topic { name } } }
+        visibility
+        isFork
+        createdAt
+        updatedAt
+        pushedAt
+        languages(first: 20, orderBy: {field: SIZE, direction: DESC}) {
+          edges { size node { name } }
+        }
+      }
+    }
+  }
+}
+"""
+
+
+class GitHubGraphQLClient:
+    """Batch client for the GitHub GraphQL API (requires a token)"""
+
+    def __init__(self, token: str, url: str = GRAPHQL_URL):
+        """
+        Args:
+            token: GitHub token (GraphQL does not allow anonymous access)
+            url: GraphQL endpoint (overridable for local stubs)
+        """
+        self.url = url
+        self.headers = {"Authorization": f"bearer {token}"}
+        # GraphQL has its own points budget, separate from the REST quota
+        self.rate_limiter = get_rate_limiter(f"graphql:{token}")
+        self.breaker = get_breaker("github_graphql")
+
+    async def _query(self, query: str, variables: Dict[str, Any]) -> Optional[Dict]:
+        """
+        Run a GraphQL query
+
+        Args:
+            query: GraphQL query document
+            variables: Query variables
+
+        Returns:
+            The response's 'data' object, or None on HTTP or GraphQL errors (or if shed)
+        """
+        if not await self.rate_limiter.acquire():
+            logger.warning("GitHub GraphQL request shed (rate limit)")
+            return None
+        try:
+            # Read-only queries are safe to retry
+            payload = await resilient_call(
+                lambda: self._post(query, variables),
+                self.breaker,
+                GITHUB_TIMEOUT_SECONDS,
+                retries=GITHUB_RETRIES,
+                retry_on=(aiohttp.ClientError, asyncio.TimeoutError)
+            )
+        except CircuitOpenError as e:
+            logger.warning(str(e))
+            return None
+        except Exception as e:
+            logger.error(f"GraphQL request error: {str(e)}")
+            return None
+        finally:
+            self.rate_limiter.release()
+
+        if payload is None:
+            return None
+        if payload.get("errors"):
+            logger.error(f"GitHub GraphQL errors: {payload['errors']}")
+            return None
+        return payload.get("data")
+
+    async def _post(self, query: str, variables: Dict[str, Any]) -> Optional[Dict]:
+        """POST one query; returns the JSON payload, None on non-200, raises on 5xx"""
+        session = get_http_session()
+        async with session.post(self.url, json={"query": query, "variables": variables}, headers=self.headers) as response:
+            message = await response.text() if response.status in (403, 429) else ""
+            self.rate_limiter.update(response.status, response.headers, message)
+            if response.status >= 500:
+                raise aiohttp.ClientResponseError(response.request_info, response.history, status=response.status)
+            if response.status != 200:
+                logger.error(f"GitHub GraphQL error: {response.status}")
+                return None
+            return await response.json()
+
+    async def fetch_user_bundle(self, username: str, max_pages: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """
+        Fetch profile, repositories and per-repository languages in one query per 100 repos
+
+        Args:
+            username: GitHub username
+            max_pages: Maximum repository pages to fetch (None for all)
+
+        Returns:
+            Dictionary with:
+            - profile: same shape as GitHubService.get_user_profile
+            - repositories: same shape as GitHubService.get_repositories
+            - languages: {full_name: {language: bytes}}
+            or None if the user could not be fetched
+        """
+        cursor = None
+        pages = 0
+        user = None
+        nodes: List[Dict] = []
+
+        while True:
+            data = await self._query(USER_BUNDLE_QUERY, {"login": username, "cursor": cursor})
+            if not data or not data.get("user"):
+                return None
+
+            user = data["user"]
+            connection = user["repositories"]
+            nodes.extend(connection["nodes"])
+            pages += 1
+
+            page_info = connection["pageInfo"]
+            if not page_info["hasNextPage"] or (max_pages is not None and pages >= max_pages):
+                break
+            cursor = page_info["endCursor"]
+
+        return {
+            "profile": self._map_profile(user),
+            "repositories": [self._map_repository(node) for node in nodes],
+            "languages": {
+                node["nameWithOwner"]: {
+                    edge["node"]["name"]: edge["size"]
+                    for edge in (node.get("languages") or {}).get("edges", [])
+                }
+                for node in nodes
+            }
+        }
+
+    @staticmethod
+    def _map_profile(user: Dict) -> Dict:
+        return {
+            "username": user.get("login"),
+            "name": user.get("name"),
+            "bio": user.get("bio"),
+            "avatar_url": user.get("avatarUrl"),
+            "location": user.get("location"),
+            "company": user.get("company"),
+            "blog": user.get("websiteUrl") or "",
+            "email": user.get("email") or None,
+            "twitter_username": user.get("twitterUsername"),
+            "public_repos": user["repositories"]["totalCount"],
+            "public_gists": (user.get("gists") or {}).get("totalCount"),
+            "followers": (user.get("followers") or {}).get("totalCount"),
+            "following": (user.get("following") or {}).get("totalCount"),
+            "created_at": user.get("createdAt"),
+            "updated_at": user.get("updatedAt"),
+            "html_url": user.get("url")
+        }
+
+    @staticmethod
+    def _map_repository(node: Dict) -> Dict:
+        full_name = node.get("nameWithOwner")
+        return {
+            "name": node.get("name"),
+            "full_name": full_name,
+            "description": node.get("description"),
+            "html_url": node.get("url"),
+            "homepage": node.get("homepageUrl"),
+            "language": (node.get("primaryLanguage") or {}).get("name"),
+            "languages_url": f"https://api.github.com/repos/{full_name}/languages",
+            "stargazers_count": node.get("stargazerCount"),
+            "watchers_count": (node.get("watchers") or {}).get("totalCount"),
+            "forks_count": node.get("forkCount"),
+            "open_issues_count": (node.get("issues") or {}).get("totalCount"),
+            "size": node.get("diskUsage"),
+            "default_branch": (node.get("defaultBranchRef") or {}).get("name"),
+            "topics": [
+                topic_node["topic"]["name"]
+                for topic_node in (node.get("repositoryTopics") or {}).get("nodes", [])
+            ],
+            "visibility": (node.get("visibility") or "").lower() or None,
+            "is_fork": node.get("isFork"),
+            "created_at": node.get("createdAt"),
+            "updated_at": node.get("updatedAt"),
+            "pushed_at": node.get("pushedAt"),
+        }
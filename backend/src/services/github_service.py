@@ -3,13 +3,59 @@ GitHub Service for fetching user profile, repositories, and statistics
 """
 
 import os
-import aiohttp
-from typing import Dict, List, Optional, Any
+import time
+import asyncio
+from collections import OrderedDict
+from typing import Dict, List, Optional, Any, AsyncIterator, Awaitable, Callable, Tuple
+from urllib.parse import urlparse, parse_qs
 from datetime import datetime
+from pathlib import Path
 import logging
+import aiohttp
+from .http_session import get_http_session
+from .cache import TTLCache
+from .github_graphql import GitHubGraphQLClient
+from .persistent_cache import GitHubDiskCache
+from .rate_limit import GitHubRateLimiter, current_priority, get_rate_limiter
+from .resilience import GITHUB_RETRIES, GITHUB_TIMEOUT_SECONDS, CircuitBreaker, backoff_delay, get_breaker
+from .single_flight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
+# Max endpoints kept in the conditional-request (ETag) cache
+ETAG_CACHE_MAX_ENTRIES = int(os.getenv("GITHUB_ETAG_CACHE_MAX_ENTRIES", "1000"))
+
+# Response cache: freshness per method (seconds), size bound and stale-while-revalidate window
+CACHE_TTLS = {
+    "profile": float(os.getenv("GITHUB_PROFILE_TTL_SECONDS", "600")),
+    "repositories": float(os.getenv("GITHUB_REPOSITORIES_TTL_SECONDS", "600")),
+    "stats": float(os.getenv("GITHUB_STATS_TTL_SECONDS", "900")),
+    "languages": float(os.getenv("GITHUB_LANGUAGES_TTL_SECONDS", "3600")),
+    "commits": float(os.getenv("GITHUB_COMMITS_TTL_SECONDS", "600")),
+    "dashboard": float(os.getenv("GITHUB_DASHBOARD_TTL_SECONDS", "300")),
+}
+CACHE_MAX_ENTRIES = int(os.getenv("GITHUB_CACHE_MAX_ENTRIES", "256"))
+CACHE_STALE_SECONDS = float(os.getenv("GITHUB_CACHE_STALE_SECONDS", "86400"))
+
+# Disk cache tier (SQLite) so cold starts don't refetch everything; empty path disables it
+DISK_CACHE_PATH = os.getenv(
+    "GITHUB_DISK_CACHE_PATH",
+    str(Path(__file__).resolve().parent.parent.parent / ".cache" / "github_cache.sqlite3")
+)
+DISK_CACHE_MAX_BYTES = int(float(os.getenv("GITHUB_DISK_CACHE_MAX_MB", "50")) * 1024 * 1024)
+
+# Max pages fetched at once when paginating
+PAGINATION_CONCURRENCY = int(os.getenv("GITHUB_PAGINATION_CONCURRENCY", "4"))
+
+# Stats backend: "rest" (profile + repo pages + /languages per repo) or "graphql" (one query per 100 repos)
+GITHUB_BACKEND = os.getenv("GITHUB_BACKEND", "rest").lower()
+
+# Max /languages requests in flight while computing stats
+LANGUAGES_CONCURRENCY = int(os.getenv("GITHUB_LANGUAGES_CONCURRENCY", "8"))
+
+# Process-wide coalescing of identical in-flight GitHub requests (shared by every instance)
+_in_flight = SingleFlight()
+
 
 class GitHubService:
     """Service to interact with GitHub API"""
@@ -26,6 +72,130 @@ class GitHubService:
             "Accept": "application/vnd.github.v3+json",
             "Authorization": f"token {self.token}" if self.token else ""
         }
+        
+        # Quota tracking and request priority, shared by every instance using this token
+        self.rate_limiter: GitHubRateLimiter = get_rate_limiter(self.token)
+        
+        # Per-request deadline, retry budget and the process-wide GitHub circuit breaker
+        self.timeout = aiohttp.ClientTimeout(total=GITHUB_TIMEOUT_SECONDS)
+        self.retries = GITHUB_RETRIES
+        self.breaker: CircuitBreaker = get_breaker("github")
+        
+        # Conditional-request cache: endpoint -> {body, etag, last_modified, fetched_at}
+        # 304 Not Modified responses don't count against the rate limit
+        self._etag_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._etag_cache_stats = {"hits": 0, "misses": 0, "not_modified": 0}
+        
+        # Response cache for profile, repositories, stats, languages and commits (TTL + stale-while-revalidate)
+        self.cache_ttls = dict(CACHE_TTLS)
+        self._cache = TTLCache(max_entries=CACHE_MAX_ENTRIES, stale_ttl=CACHE_STALE_SECONDS)
+        
+        # Disk tier under the response and ETag caches
+        self.disk: Optional[GitHubDiskCache] = None
+        if DISK_CACHE_PATH:
+            try:
+                self.disk = GitHubDiskCache(DISK_CACHE_PATH, DISK_CACHE_MAX_BYTES)
+            except Exception as e:
+                logger.error(f"Disk cache unavailable ({DISK_CACHE_PATH}): {str(e)}")
+        
+        # Optional GraphQL batch backend for stats (GraphQL requires a token)
+        self.graphql: Optional[GitHubGraphQLClient] = None
+        if GITHUB_BACKEND == "graphql":
+            if self.token:
+                self.graphql = GitHubGraphQLClient(self.token)
+            else:
+                logger.warning("GITHUB_BACKEND=graphql requires GITHUB_TOKEN; using REST")
+    
+    async def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get cache counters
+        
+        Returns:
+            Dictionary with:
+            - conditional_requests: hits (cached validator sent), misses (no validator),
+              not_modified (304 served from cache) and entry count
+            - response_cache: TTL cache hits, stale hits, misses, refreshes and hit rate
+            - disk_cache: SQLite tier reads, hits, writes, evictions and size (None if disabled)
+            - rate_limit: remaining quota, reset time and scheduler counters
+            - single_flight: upstream calls made, callers that shared one, and calls in flight
+        """
+        return {
+            "conditional_requests": {
+                **self._etag_cache_stats,
+                "entries": len(self._etag_cache)
+            },
+            "response_cache": self._cache.stats(),
+            "disk_cache": await self.disk.stats() if self.disk else None,
+            "rate_limit": self.rate_limiter.status(),
+            "single_flight": _in_flight.stats()
+        }
+    
+    async def _cached(
+        self,
+        key: Tuple,
+        fetch: Callable[[], Awaitable[Any]],
+        ttl: float,
+        disk_load: Optional[Callable[[], Awaitable[Optional[Tuple[Any, float]]]]] = None,
+        disk_store: Optional[Callable[[Any], Awaitable[None]]] = None,
+        refresh: bool = False
+    ) -> Any:
+        """
+        Read through the response cache, then the disk tier, then the API
+        
+        On a memory miss (e.g. after a cold start) a disk record is loaded into
+        the response cache with its remaining freshness; if it is already past
+        its TTL it is served immediately and revalidated in the background.
+        
+        Args:
+            key: Response cache key
+            fetch: Coroutine function that fetches from the API
+            ttl: Freshness lifetime in seconds
+            disk_load: Coroutine function returning (value, fetched_at) from disk, if persisted
+            disk_store: Coroutine function persisting a freshly fetched value, if persisted
+            refresh: Skip cached data and fetch now (the result is cached)
+            
+        Returns:
+            Cached or fetched value
+        """
+        async def load():
+            value = await fetch()
+            if value and disk_store:
+                await disk_store(value)
+            return value
+        
+        if refresh:
+            return await self._cache.refresh(key, load, ttl)
+        
+        if disk_load and self._cache.get(key) is None:
+            stored = await disk_load()
+            if stored:
+                value, fetched_at = stored
+                self._cache.set(key, value, max(ttl - (time.time() - fetched_at), 0))
+        
+        return await self._cache.get_or_load(key, load, ttl)
+    
+    def _store_etag_entry(
+        self,
+        endpoint: str,
+        body: Any,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        link: Optional[str]
+    ):
+        """Remember a 200 response and its validators, evicting the least recently used entry"""
+        self._put_etag_entry(endpoint, {
+            "body": body,
+            "etag": etag,
+            "last_modified": last_modified,
+            "link": link,
+            "fetched_at": time.time()
+        })
+    
+    def _put_etag_entry(self, endpoint: str, entry: Dict[str, Any]):
+        self._etag_cache[endpoint] = entry
+        self._etag_cache.move_to_end(endpoint)
+        while len(self._etag_cache) > ETAG_CACHE_MAX_ENTRIES:
+            self._etag_cache.popitem(last=False)
     
     async def _make_request(self, endpoint: str) -> Optional[Dict]:
         """
@@ -37,30 +207,271 @@ class GitHubService:
         Returns:
             JSON response as dictionary or None if error
         """
+        data, _ = await self._request(endpoint)
+        return data
+    
+    async def _request(self, endpoint: str) -> Tuple[Optional[Any], Dict[str, str]]:
+        """
+        Make an async HTTP request to GitHub API, returning body and pagination headers
+        
+        Identical concurrent requests (same API, token, endpoint and priority) are
+        coalesced process-wide into one upstream call. Priority is part of the key
+        so a shed background request never answers an interactive caller.
+        
+        Args:
+            endpoint: API endpoint (e.g., '/user', '/users/username')
+            
+        Returns:
+            Tuple of (JSON response or None if error, {"Link": ...} if present)
+        """
+        key = (self.BASE_URL, self.token, endpoint, current_priority())
+        return await _in_flight.do(key, lambda: self._send_request(endpoint))
+    
+    async def _send_request(self, endpoint: str) -> Tuple[Optional[Any], Dict[str, str]]:
+        """
+        Send one GitHub API request (callers go through `_request`)
+        
+        Sends If-None-Match / If-Modified-Since when a previous response for the
+        endpoint is cached, and serves the cached body on 304 Not Modified.
+        Goes through the per-token rate limiter and the GitHub circuit breaker.
+        Timeouts, connection errors, 5xx and rate limits are retried with backoff;
+        when the request is shed, rejected or out of retries, the last known body
+        is served.
+        
+        Args:
+            endpoint: API endpoint (e.g., '/user', '/users/username')
+            
+        Returns:
+            Tuple of (JSON response or None if error, {"Link": ...} if present)
+        """
         url = f"{self.BASE_URL}{endpoint}"
+        headers = dict(self.headers)
         
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=self.headers) as response:
-                    if response.status == 200:
-                        return await response.json()
+        cached = self._etag_cache.get(endpoint)
+        if cached is None and self.disk:
+            # Validators persisted before a restart
+            cached = await self.disk.get_etag(endpoint)
+            if cached:
+                self._put_etag_entry(endpoint, cached)
+        if cached:
+            self._etag_cache_stats["hits"] += 1
+            if cached["etag"]:
+                headers["If-None-Match"] = cached["etag"]
+            if cached["last_modified"]:
+                headers["If-Modified-Since"] = cached["last_modified"]
+        else:
+            self._etag_cache_stats["misses"] += 1
+        
+        for attempt in range(self.retries + 1):
+            # Fail fast while GitHub is unhealthy: serve the last known body instead
+            if not self.breaker.allow():
+                return self._fallback_response(cached)
+            # Quota-aware scheduling: interactive requests go first, background work is shed when quota is low
+            if not await self.rate_limiter.acquire():
+                logger.warning(f"GitHub request shed (rate limit) for {endpoint}")
+                return self._fallback_response(cached)
+            try:
+                # Shared pooled session: reuses keep-alive connections to api.github.com
+                session = get_http_session()
+                async with session.get(url, headers=headers, timeout=self.timeout) as response:
+                    message = await response.text() if response.status in (403, 429) else ""
+                    retry_in = self.rate_limiter.update(response.status, response.headers, message)
+                    if response.status >= 500:
+                        raise aiohttp.ClientResponseError(
+                            response.request_info, response.history, status=response.status
+                        )
+                    self.breaker.record_success()
+                    if response.status == 304 and cached:
+                        self._etag_cache_stats["not_modified"] += 1
+                        cached["fetched_at"] = time.time()
+                        self._etag_cache.move_to_end(endpoint)
+                        return cached["body"], self._link_headers(cached["link"])
+                    elif response.status == 200:
+                        body = await response.json()
+                        etag = response.headers.get("ETag")
+                        last_modified = response.headers.get("Last-Modified")
+                        link = response.headers.get("Link")
+                        if etag or last_modified:
+                            self._store_etag_entry(endpoint, body, etag, last_modified, link)
+                            if self.disk:
+                                await self.disk.put_etag(endpoint, self._etag_cache[endpoint])
+                        return body, self._link_headers(link)
+                    elif retry_in is not None:
+                        logger.warning(f"GitHub rate limited for {endpoint}; retry in {retry_in:.0f}s")
+                        continue
                     else:
                         logger.error(f"GitHub API error: {response.status} for {endpoint}")
-                        return None
-        except Exception as e:
-            logger.error(f"Request error for {endpoint}: {str(e)}")
+                        return None, {}
+            except asyncio.CancelledError:
+                self.breaker.cancel_trial()
+                raise
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                # Timeouts, connection errors and 5xx are transient: retry GETs with jittered backoff
+                self.breaker.record_failure()
+                logger.error(f"Request error for {endpoint} (attempt {attempt + 1}): {str(e) or type(e).__name__}")
+                if attempt < self.retries:
+                    await asyncio.sleep(backoff_delay(attempt))
+            except Exception as e:
+                logger.error(f"Request error for {endpoint}: {str(e)}")
+                return None, {}
+            finally:
+                self.rate_limiter.release()
+        
+        return self._fallback_response(cached)
+    
+    def _fallback_response(self, cached: Optional[Dict[str, Any]]) -> Tuple[Optional[Any], Dict[str, str]]:
+        """Last known body for a request that could not be sent (None if never fetched)"""
+        if cached:
+            return cached["body"], self._link_headers(cached["link"])
+        return None, {}
+    
+    @staticmethod
+    def _link_headers(link: Optional[str]) -> Dict[str, str]:
+        return {"Link": link} if link else {}
+    
+    @staticmethod
+    def _parse_link_header(link: Optional[str]) -> Dict[str, int]:
+        """
+        Parse a GitHub Link header into page numbers
+        
+        Args:
+            link: e.g. '<https://api.github.com/user/repos?page=2>; rel="next", <...?page=5>; rel="last"'
+            
+        Returns:
+            Mapping of rel ('next', 'last', 'prev', 'first') to page number
+        """
+        pages = {}
+        for part in (link or "").split(","):
+            url_part, _, params = part.partition(";")
+            url = url_part.strip().strip("<>")
+            rel = params.split("rel=")[-1].strip().strip('"') if "rel=" in params else None
+            page = parse_qs(urlparse(url).query).get("page")
+            if rel and page and page[0].isdigit():
+                pages[rel] = int(page[0])
+        return pages
+    
+    @staticmethod
+    def _with_page(endpoint: str, page: int) -> str:
+        """Append a page parameter to an endpoint"""
+        separator = "&" if "?" in endpoint else "?"
+        return f"{endpoint}{separator}page={page}"
+    
+    async def _paginate(self, endpoint: str, max_pages: Optional[int] = None) -> Optional[List[Dict]]:
+        """
+        Fetch every page of a list endpoint
+        
+        The first page's Link header gives the last page number; the remaining
+        pages are then fetched concurrently (bounded by PAGINATION_CONCURRENCY)
+        and concatenated in page order. If any page fails the whole result is
+        None, so a truncated list is never cached as if it were complete.
+        
+        Args:
+            endpoint: List endpoint including per_page (e.g. '/users/x/repos?per_page=100')
+            max_pages: Maximum pages to fetch (None for all)
+            
+        Returns:
+            Combined list of raw items, or None if any page failed
+        """
+        first_page, headers = await self._request(self._with_page(endpoint, 1))
+        if not isinstance(first_page, list):
+            return first_page
+        
+        last_page = self._parse_link_header(headers.get("Link")).get("last", 1)
+        if max_pages is not None:
+            last_page = min(last_page, max_pages)
+        if last_page <= 1:
+            return first_page
+        
+        semaphore = asyncio.Semaphore(PAGINATION_CONCURRENCY)
+        
+        async def fetch_page(page: int) -> Optional[List[Dict]]:
+            async with semaphore:
+                data = await self._make_request(self._with_page(endpoint, page))
+                return data if isinstance(data, list) else None
+        
+        remaining_pages = await asyncio.gather(*[
+            fetch_page(page) for page in range(2, last_page + 1)
+        ])
+        failed = [page for page, items in enumerate(remaining_pages, start=2) if items is None]
+        if failed:
+            logger.warning(f"Pagination incomplete for {endpoint}: pages {failed} of {last_page} failed")
             return None
+        
+        items = list(first_page)
+        for page_items in remaining_pages:
+            items.extend(page_items)
+        return items
+    
+    async def iter_items(self, endpoint: str, max_pages: Optional[int] = None) -> AsyncIterator[Dict]:
+        """
+        Iterate over a list endpoint one page at a time
+        
+        Pages are fetched lazily by following rel="next", so only one page is
+        held in memory at a time.
+        
+        Args:
+            endpoint: List endpoint including per_page
+            max_pages: Maximum pages to fetch (None for all)
+            
+        Yields:
+            Raw items from each page in order
+        """
+        page = 1
+        while max_pages is None or page <= max_pages:
+            data, headers = await self._request(self._with_page(endpoint, page))
+            if not isinstance(data, list):
+                return
+            for item in data:
+                yield item
+            
+            next_page = self._parse_link_header(headers.get("Link")).get("next")
+            if not next_page:
+                return
+            page = next_page
     
-    async def get_user_profile(self, username: Optional[str] = None) -> Optional[Dict]:
+    async def iter_repositories(
+        self,
+        username: Optional[str] = None,
+        sort: str = "updated",
+        per_page: int = 100
+    ) -> AsyncIterator[Dict]:
+        """
+        Iterate over all of a user's repositories without loading every page at once
+        
+        Args:
+            username: GitHub username (if None, iterates authenticated user's repos)
+            sort: Sort by 'created', 'updated', 'pushed', 'full_name'
+            per_page: Number of results per page (max 100)
+            
+        Yields:
+            Repository data
         """
-        Get GitHub user profile
+        async for repo in self.iter_items(self._repositories_endpoint(username, sort, per_page)):
+            yield self._format_repository(repo)
+    
+    async def get_user_profile(self, username: Optional[str] = None, refresh: bool = False) -> Optional[Dict]:
+        """
+        Get GitHub user profile (cached)
         
         Args:
             username: GitHub username (if None, gets authenticated user)
+            refresh: Bypass cached data and fetch fresh
             
         Returns:
             User profile data including bio, location, company, etc.
         """
+        persist = bool(self.disk and username)
+        return await self._cached(
+            ("profile", username),
+            lambda: self._fetch_user_profile(username),
+            self.cache_ttls["profile"],
+            disk_load=(lambda: self.disk.get_profile(username)) if persist else None,
+            disk_store=(lambda profile: self.disk.put_profile(username, profile)) if persist else None,
+            refresh=refresh
+        )
+    
+    async def _fetch_user_profile(self, username: Optional[str] = None) -> Optional[Dict]:
+        """Fetch GitHub user profile from the API"""
         endpoint = f"/users/{username}" if username else "/user"
         data = await self._make_request(endpoint)
         
@@ -89,52 +500,94 @@ class GitHubService:
         self, 
         username: Optional[str] = None,
         sort: str = "updated",
-        per_page: int = 100
+        per_page: int = 100,
+        max_pages: Optional[int] = None,
+        refresh: bool = False
     ) -> List[Dict]:
         """
-        Get user's repositories
+        Get user's repositories (cached)
         
         Args:
             username: GitHub username (if None, gets authenticated user's repos)
             sort: Sort by 'created', 'updated', 'pushed', 'full_name'
             per_page: Number of results per page (max 100)
+            max_pages: Maximum pages to fetch (None for all)
+            refresh: Bypass cached data and fetch fresh
             
         Returns:
             List of repository data
         """
-        endpoint = f"/users/{username}/repos?sort={sort}&per_page={per_page}" if username else f"/user/repos?sort={sort}&per_page={per_page}"
-        data = await self._make_request(endpoint)
+        # The disk tier keeps each owner's complete list in default order
+        persist = bool(self.disk and username and sort == "updated" and max_pages is None)
+        return await self._cached(
+            self._repositories_cache_key(username, sort, per_page, max_pages),
+            lambda: self._fetch_repositories(username, sort, per_page, max_pages),
+            self.cache_ttls["repositories"],
+            disk_load=(lambda: self.disk.get_repositories(username)) if persist else None,
+            disk_store=(lambda repos: self.disk.put_repositories(username, repos)) if persist else None,
+            refresh=refresh
+        )
+    
+    def has_repositories(self, username: str) -> bool:
+        """Whether the owner's full repository list (default order) is in the response cache"""
+        return self._cache.get(self._repositories_cache_key(username)) is not None
+    
+    async def _fetch_repositories(
+        self,
+        username: Optional[str] = None,
+        sort: str = "updated",
+        per_page: int = 100,
+        max_pages: Optional[int] = None
+    ) -> List[Dict]:
+        """Fetch user's repositories from the API"""
+        data = await self._paginate(self._repositories_endpoint(username, sort, per_page), max_pages)
         
         if data:
-            return [
-                {
-                    "name": repo.get("name"),
-                    "full_name": repo.get("full_name"),
-                    "description": repo.get("description"),
-                    "html_url": repo.get("html_url"),
-                    "homepage": repo.get("homepage"),
-                    "language": repo.get("language"),
-                    "languages_url": repo.get("languages_url"),
-                    "stargazers_count": repo.get("stargazers_count"),
-                    "watchers_count": repo.get("watchers_count"),
-                    "forks_count": repo.get("forks_count"),
-                    "open_issues_count": repo.get("open_issues_count"),
-                    "size": repo.get("size"),
-                    "default_branch": repo.get("default_branch"),
-                    "topics": repo.get("topics", []),
-                    "visibility": repo.get("visibility"),
-                    "is_fork": repo.get("fork"),
-                    "created_at": repo.get("created_at"),
-                    "updated_at": repo.get("updated_at"),
-                    "pushed_at": repo.get("pushed_at"),
-                }
-                for repo in data
-            ]
+            return [self._format_repository(repo) for repo in data]
         return []
     
+    @staticmethod
+    def _repositories_cache_key(
+        username: Optional[str],
+        sort: str = "updated",
+        per_page: int = 100,
+        max_pages: Optional[int] = None
+    ) -> Tuple:
+        return ("repositories", username, sort, per_page, max_pages)
+    
+    @staticmethod
+    def _repositories_endpoint(username: Optional[str], sort: str, per_page: int) -> str:
+        if username:
+            return f"/users/{username}/repos?sort={sort}&per_page={per_page}"
+        return f"/user/repos?sort={sort}&per_page={per_page}"
+    
+    @staticmethod
+    def _format_repository(repo: Dict) -> Dict:
+        return {
+            "name": repo.get("name"),
+            "full_name": repo.get("full_name"),
+            "description": repo.get("description"),
+            "html_url": repo.get("html_url"),
+            "homepage": repo.get("homepage"),
+            "language": repo.get("language"),
+            "languages_url": repo.get("languages_url"),
+            "stargazers_count": repo.get("stargazers_count"),
+            "watchers_count": repo.get("watchers_count"),
+            "forks_count": repo.get("forks_count"),
+            "open_issues_count": repo.get("open_issues_count"),
+            "size": repo.get("size"),
+            "default_branch": repo.get("default_branch"),
+            "topics": repo.get("topics", []),
+            "visibility": repo.get("visibility"),
+            "is_fork": repo.get("fork"),
+            "created_at": repo.get("created_at"),
+            "updated_at": repo.get("updated_at"),
+            "pushed_at": repo.get("pushed_at"),
+        }
+    
     async def get_repository_languages(self, owner: str, repo: str) -> Dict[str, int]:
         """
-        Get languages used in a repository
+        Get languages used in a repository (cached)
         
         Args:
             owner: Repository owner
@@ -143,6 +596,16 @@ class GitHubService:
         Returns:
             Dictionary of languages and their byte counts
         """
+        return await self._cached(
+            ("languages", owner, repo),
+            lambda: self._fetch_repository_languages(owner, repo),
+            self.cache_ttls["languages"],
+            disk_load=(lambda: self.disk.get_languages(owner, repo)) if self.disk else None,
+            disk_store=(lambda languages: self.disk.put_languages(owner, repo, languages)) if self.disk else None
+        )
+    
+    async def _fetch_repository_languages(self, owner: str, repo: str) -> Dict[str, int]:
+        """Fetch languages used in a repository from the API"""
         endpoint = f"/repos/{owner}/{repo}/languages"
         data = await self._make_request(endpoint)
         return data if data else {}
@@ -150,7 +613,8 @@ class GitHubService:
     async def get_user_events(
         self, 
         username: str,
-        per_page: int = 100
+        per_page: int = 100,
+        max_pages: Optional[int] = None
     ) -> List[Dict]:
         """
         Get recent public events for a user
@@ -158,12 +622,13 @@ class GitHubService:
         Args:
             username: GitHub username
             per_page: Number of results per page (max 100)
+            max_pages: Maximum pages to fetch (None for all; GitHub keeps at most 300 events)
             
         Returns:
             List of public events
         """
         endpoint = f"/users/{username}/events/public?per_page={per_page}"
-        data = await self._make_request(endpoint)
+        data = await self._paginate(endpoint, max_pages)
         
         if data:
             return [
@@ -177,37 +642,184 @@ class GitHubService:
             ]
         return []
     
-    async def get_user_stats(self, username: str) -> Dict[str, Any]:
+    async def get_user_stats(self, username: str, refresh: bool = False) -> Dict[str, Any]:
         """
-        Get comprehensive statistics for a user
+        Get comprehensive statistics for a user (cached)
         
         Args:
             username: GitHub username
+            refresh: Bypass the cached stats and recompute
             
         Returns:
             Dictionary with various statistics
         """
-        profile = await self.get_user_profile(username)
+        return await self._cached(
+            ("stats", username),
+            lambda: self._compute_user_stats(username),
+            self.cache_ttls["stats"],
+            refresh=refresh
+        )
+    
+    async def warm(self, username: str) -> Dict[str, Any]:
+        """
+        Refresh profile, repositories and stats for a user in the caches
+        
+        Args:
+            username: GitHub username
+            
+        Returns:
+            The refreshed statistics
+        """
+        await asyncio.gather(
+            self.get_user_profile(username, refresh=True),
+            self.get_repositories(username, refresh=True)
+        )
+        return await self.get_user_stats(username, refresh=True)
+    
+    async def get_dashboard(
+        self,
+        username: str,
+        repo_limit: int = 6,
+        activity_limit: int = 10,
+        refresh: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Get everything the portfolio's GitHub section shows, in one payload (cached)
+        
+        Args:
+            username: GitHub username
+            repo_limit: Number of recently updated repositories to include
+            activity_limit: Number of recent public events to include
+            refresh: Bypass the cached dashboard and rebuild it
+            
+        Returns:
+            Dictionary with profile, statistics, languages, top_repositories,
+            recent_repositories, recent_activity and generated_at (empty if the user was not found)
+        """
+        return await self._cached(
+            ("dashboard", username, repo_limit, activity_limit),
+            lambda: self._build_dashboard(username, repo_limit, activity_limit),
+            self.cache_ttls["dashboard"],
+            refresh=refresh
+        )
+    
+    async def _build_dashboard(self, username: str, repo_limit: int, activity_limit: int) -> Dict[str, Any]:
+        if activity_limit:
+            stats, events = await asyncio.gather(
+                self.get_user_stats(username),
+                self.get_user_events(username, per_page=activity_limit, max_pages=1)
+            )
+        else:
+            # No activity requested (the portfolio page sends activity=0): skip the events request
+            stats, events = await self.get_user_stats(username), []
+        if not stats:
+            return {}
+        
+        # Sorted by last update; served from the cache the stats computation just filled
         repos = await self.get_repositories(username)
+        return {
+            "profile": stats["profile"],
+            "statistics": stats["statistics"],
+            "languages": stats["languages"]["top_languages"],
+            "top_repositories": stats["top_repositories"],
+            "recent_repositories": [
+                {
+                    "name": repo.get("name"),
+                    "description": repo.get("description"),
+                    "html_url": repo.get("html_url"),
+                    "language": repo.get("language"),
+                    "stargazers_count": repo.get("stargazers_count"),
+                    "forks_count": repo.get("forks_count"),
+                    "updated_at": repo.get("updated_at")
+                }
+                for repo in repos[:repo_limit]
+            ],
+            "recent_activity": [
+                {"type": event["type"], "repo": event["repo"], "created_at": event["created_at"]}
+                for event in events[:activity_limit]
+            ],
+            "generated_at": datetime.now().isoformat()
+        }
+    
+    async def _compute_user_stats(self, username: str) -> Dict[str, Any]:
+        """Compute statistics for a user from profile, repository and language data"""
+        if self.graphql:
+            bundle = await self._load_graphql_bundle(username)
+            if bundle:
+                return self._build_user_stats(*bundle)
+            logger.warning(f"GraphQL stats failed for {username}; falling back to REST")
+        
+        profile, repos = await asyncio.gather(
+            self.get_user_profile(username),
+            self.get_repositories(username)
+        )
         
         if not profile or not repos:
             return {}
         
+        # Language bytes across original repositories
+        language_bytes = await self._aggregate_language_bytes(
+            [repo for repo in repos if not repo.get("is_fork")]
+        )
+        return self._build_user_stats(profile, repos, language_bytes)
+    
+    async def _load_graphql_bundle(self, username: str) -> Optional[Tuple[Dict, List[Dict], Dict[str, int]]]:
+        """
+        Fetch profile, repositories and languages with the GraphQL backend
+        
+        The REST-shaped results are also stored in the response cache, so
+        follow-up get_user_profile / get_repositories / get_repository_languages
+        calls are served without further requests.
+        
+        Args:
+            username: GitHub username
+            
+        Returns:
+            Tuple of (profile, repositories, language bytes of original repos) or None
+        """
+        bundle = await self.graphql.fetch_user_bundle(username)
+        if not bundle or not bundle["repositories"]:
+            return None
+        
+        profile, repos = bundle["profile"], bundle["repositories"]
+        self._cache.set(("profile", username), profile, self.cache_ttls["profile"])
+        self._cache.set(self._repositories_cache_key(username), repos, self.cache_ttls["repositories"])
+        if self.disk:
+            await self.disk.put_profile(username, profile)
+            await self.disk.put_repositories(username, repos)
+        
+        language_bytes = {}
+        originals = {repo["full_name"] for repo in repos if not repo.get("is_fork")}
+        for full_name, languages in bundle["languages"].items():
+            owner, _, name = full_name.partition("/")
+            self._cache.set(("languages", owner, name), languages, self.cache_ttls["languages"])
+            if self.disk and languages:
+                await self.disk.put_languages(owner, name, languages)
+            if full_name in originals:
+                for lang, byte_count in languages.items():
+                    language_bytes[lang] = language_bytes.get(lang, 0) + byte_count
+        
+        return profile, repos, language_bytes
+    
+    @staticmethod
+    def _build_user_stats(profile: Dict, repos: List[Dict], language_bytes: Dict[str, int]) -> Dict[str, Any]:
+        """Build the statistics payload from profile, repositories and language bytes"""
         # Calculate statistics
-        total_stars = sum(repo.get("stargazers_count", 0) for repo in repos)
-        total_forks = sum(repo.get("forks_count", 0) for repo in repos)
+        total_stars = sum(repo.get("stargazers_count") or 0 for repo in repos)
+        total_forks = sum(repo.get("forks_count") or 0 for repo in repos)
         
-        # Language statistics
+        # Language statistics (repositories per primary language)
         language_stats = {}
         for repo in repos:
             lang = repo.get("language")
             if lang:
                 language_stats[lang] = language_stats.get(lang, 0) + 1
+        total_bytes = sum(language_bytes.values())
         
-        # Get top languages by usage
+        # Get top languages by bytes (repo count when byte data is unavailable)
         top_languages = sorted(
-            language_stats.items(), 
-            key=lambda x: x[1], 
+            set(language_stats) | set(language_bytes),
+            key=lambda lang: (language_bytes.get(lang, 0), language_stats.get(lang, 0)),
             reverse=True
         )[:5]
         
@@ -234,8 +846,18 @@ class GitHubService:
                 "following": profile.get("following")
             },
             "languages": {
-                "top_languages": [{"name": lang, "count": count} for lang, count in top_languages],
-                "all_languages": language_stats
+                "top_languages": [
+                    {
+                        "name": lang,
+                        "count": language_stats.get(lang, 0),
+                        "bytes": language_bytes.get(lang, 0),
+                        "percentage": round(language_bytes.get(lang, 0) / total_bytes * 100, 2) if total_bytes else 0.0
+                    }
+                    for lang in top_languages
+                ],
+                "all_languages": language_stats,
+                "bytes": dict(sorted(language_bytes.items(), key=lambda x: x[1], reverse=True)),
+                "total_bytes": total_bytes
             },
             "top_repositories": [
                 {
@@ -250,25 +872,73 @@ class GitHubService:
             ]
         }
     
+    async def _aggregate_language_bytes(self, repos: List[Dict]) -> Dict[str, int]:
+        """
+        Sum per-language byte counts across repositories
+        
+        /languages is fetched for every repository concurrently, bounded by
+        LANGUAGES_CONCURRENCY; results are cached per repository.
+        
+        Args:
+            repos: Repository data (as returned by get_repositories)
+            
+        Returns:
+            Dictionary of languages and their total byte counts
+        """
+        semaphore = asyncio.Semaphore(LANGUAGES_CONCURRENCY)
+        
+        async def fetch_languages(repo: Dict) -> Dict[str, int]:
+            owner, _, name = (repo.get("full_name") or "").partition("/")
+            if not owner or not name:
+                return {}
+            async with semaphore:
+                return await self.get_repository_languages(owner, name)
+        
+        language_bytes = {}
+        for languages in await asyncio.gather(*[fetch_languages(repo) for repo in repos]):
+            for lang, byte_count in languages.items():
+                language_bytes[lang] = language_bytes.get(lang, 0) + byte_count
+        return language_bytes
+    
     async def get_repository_commits(
         self, 
         owner: str, 
         repo: str,
-        per_page: int = 100
+        per_page: int = 100,
+        max_pages: Optional[int] = 1
     ) -> List[Dict]:
         """
-        Get commits for a repository
+        Get commits for a repository (cached)
         
         Args:
             owner: Repository owner
             repo: Repository name
             per_page: Number of results per page (max 100)
+            max_pages: Maximum pages to fetch (default 1, since history is unbounded; None for all)
             
         Returns:
             List of commits
         """
+        # The disk tier can only answer bounded requests (newest N commits)
+        persist = bool(self.disk and max_pages is not None)
+        return await self._cached(
+            ("commits", owner, repo, per_page, max_pages),
+            lambda: self._fetch_repository_commits(owner, repo, per_page, max_pages),
+            self.cache_ttls["commits"],
+            disk_load=(lambda: self.disk.get_commits(owner, repo, per_page * max_pages)) if persist else None,
+            disk_store=(lambda commits: self.disk.put_commits(owner, repo, commits)) if persist else None
+        )
+    
+    async def _fetch_repository_commits(
+        self,
+        owner: str,
+        repo: str,
+        per_page: int = 100,
+        max_pages: Optional[int] = 1
+    ) -> List[Dict]:
+        """Fetch commits for a repository from the API"""
         endpoint = f"/repos/{owner}/{repo}/commits?per_page={per_page}"
-        data = await self._make_request(endpoint)
+        data = await self._paginate(endpoint, max_pages)
         
         if data:
             return [
@@ -283,19 +953,25 @@ class GitHubService:
             ]
         return []
     
-    async def get_user_gists(self, username: str, per_page: int = 100) -> List[Dict]:
+    async def get_user_gists(
+        self,
+        username: str,
+        per_page: int = 100,
+        max_pages: Optional[int] = None
+    ) -> List[Dict]:
         """
         Get user's public gists
         
         Args:
             username: GitHub username
             per_page: Number of results per page (max 100)
+            max_pages: Maximum pages to fetch (None for all)
             
         Returns:
             List of gists
         """
         endpoint = f"/users/{username}/gists?per_page={per_page}"
-        data = await self._make_request(endpoint)
+        data = await self._paginate(endpoint, max_pages)
         
         if data:
             return [
@@ -349,3 +1025,22 @@ class GitHubService:
                 for repo in data["items"]
             ]
         return []
+
+
+_shared_service: Optional[GitHubService] = None
+
+
+def get_github_service() -> GitHubService:
+    """
+    Get the process-wide GitHubService
+    
+    The API routes, chat tools and warmup job all use this instance, so they share
+    one response cache, ETag cache, disk tier and GraphQL client.
+    
+    Returns:
+        The shared GitHubService (created on first use)
+    """
+    global _shared_service
+    if _shared_service is None:
+        _shared_service = GitHubService()
+    return _shared_service
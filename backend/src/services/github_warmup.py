@@ -0,0 +1,125 @@
+"""
+GitHub cache warmup - keeps profile, repositories and stats hot for configured users
+Runs once at startup and then periodically from the FastAPI lifespan
+"""
+
+import asyncio
+import os
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence
+import logging
+from .github_service import GitHubService
+from .rate_limit import background_priority
+
+logger = logging.getLogger(__name__)
+
+WARMUP_ENABLED = os.getenv("GITHUB_WARMUP_ENABLED", "true").lower() in ("1", "true", "yes")
+WARMUP_USERNAMES = [
+    name.strip()
+    for name in os.getenv("GITHUB_WARMUP_USERNAMES", "sriharsha8991").split(",")
+    if name.strip()
+]
+WARMUP_INTERVAL_SECONDS = float(os.getenv("GITHUB_WARMUP_INTERVAL_SECONDS", "300"))
+
+
+class GitHubWarmup:
+    """
+    Background refresher for GitHubService caches
+
+    Each run refreshes every (service, username) pair concurrently; a failure
+    for one user is logged and recorded without stopping the others.
+    """
+
+    def __init__(
+        self,
+        services: Sequence[GitHubService],
+        usernames: Optional[List[str]] = None,
+        interval: float = WARMUP_INTERVAL_SECONDS
+    ):
+        """
+        Args:
+            services: Service instances whose caches should be kept hot
+            usernames: GitHub usernames to refresh (defaults to GITHUB_WARMUP_USERNAMES)
+            interval: Seconds between refreshes after the startup run
+        """
+        self.services = list(services)
+        self.usernames = list(usernames if usernames is not None else WARMUP_USERNAMES)
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+        self._status: Dict[str, Any] = {
+            "runs": 0,
+            "last_refresh_at": None,
+            "last_duration_ms": None,
+            "last_error": None
+        }
+
+    async def refresh_once(self) -> Dict[str, Any]:
+        """
+        Refresh all configured users on all services
+
+        Returns:
+            Current status (see `status`)
+        """
+        start = time.perf_counter()
+        with background_priority():
+            # Warmup yields to visitors and is shed when the GitHub quota runs low
+            results = await asyncio.gather(
+                *[service.warm(username) for service in self.services for username in self.usernames],
+                return_exceptions=True
+            )
+
+        errors = []
+        for result in results:
+            if isinstance(result, Exception):
+                errors.append(str(result))
+            elif not result:
+                errors.append("empty stats")
+        if errors:
+            logger.error(f"GitHub warmup errors: {errors}")
+
+        self._status.update({
+            "runs": self._status["runs"] + 1,
+            "last_refresh_at": datetime.now(timezone.utc).isoformat(),
+            "last_duration_ms": round((time.perf_counter() - start) * 1000, 1),
+            "last_error": "; ".join(errors) or None
+        })
+        return self.status()
+
+    async def _run(self):
+        while True:
+            try:
+                await self.refresh_once()
+            except Exception as e:
+                logger.error(f"GitHub warmup failed: {str(e)}")
+            await asyncio.sleep(self.interval)
+
+    def start(self):
+        """Start the background loop (first refresh runs immediately)"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Cancel the background loop"""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def status(self) -> Dict[str, Any]:
+        """
+        Get warmup status
+
+        Returns:
+            Dictionary with usernames, interval, running flag, run count,
+            last refresh time (UTC ISO), last duration in ms and last error
+        """
+        return {
+            "usernames": self.usernames,
+            "interval_seconds": self.interval,
+            "running": self._task is not None and not self._task.done(),
+            **self._status
+        }
@@ -0,0 +1,69 @@
+"""
+Shared HTTP Session - one pooled aiohttp session for outbound API calls
+Opened and closed by the FastAPI lifespan in main.py; created lazily for scripts and tests
+"""
+
+import os
+import asyncio
+import aiohttp
+from typing import Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Connection pool tuning
+HTTP_POOL_LIMIT = int(os.getenv("HTTP_POOL_LIMIT", "100"))
+HTTP_POOL_LIMIT_PER_HOST = int(os.getenv("HTTP_POOL_LIMIT_PER_HOST", "20"))
+HTTP_KEEPALIVE_SECONDS = float(os.getenv("HTTP_KEEPALIVE_SECONDS", "60"))
+HTTP_DNS_CACHE_SECONDS = int(os.getenv("HTTP_DNS_CACHE_SECONDS", "300"))
+
+_session: Optional[aiohttp.ClientSession] = None
+_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _create_session() -> aiohttp.ClientSession:
+    """Create a session with keep-alive, per-host limits and DNS caching"""
+    connector = aiohttp.TCPConnector(
+        limit=HTTP_POOL_LIMIT,
+        limit_per_host=HTTP_POOL_LIMIT_PER_HOST,
+        keepalive_timeout=HTTP_KEEPALIVE_SECONDS,
+        ttl_dns_cache=HTTP_DNS_CACHE_SECONDS,
+    )
+    return aiohttp.ClientSession(connector=connector)
+
+
+def get_http_session() -> aiohttp.ClientSession:
+    """
+    Get the shared HTTP session, creating it if needed
+
+    Must be called from a running event loop. A session left over from a
+    different (closed) loop is replaced, so standalone scripts that call
+    asyncio.run() more than once keep working.
+
+    Returns:
+        Shared aiohttp.ClientSession
+    """
+    global _session, _session_loop
+
+    loop = asyncio.get_running_loop()
+    if _session is None or _session.closed or _session_loop is not loop:
+        _session = _create_session()
+        _session_loop = loop
+        logger.info("Opened shared HTTP session")
+    return _session
+
+
+async def open_http_session() -> aiohttp.ClientSession:
+    """Open the shared HTTP session (called on application startup)"""
+    return get_http_session()
+
+
+async def close_http_session():
+    """Close the shared HTTP session (called on application shutdown)"""
+    global _session, _session_loop
+
+    if _session is not None and not _session.closed:
+        await _session.close()
+        logger.info("Closed shared HTTP session")
+    _session = None
+    _session_loop = None
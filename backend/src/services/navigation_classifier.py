@@ -0,0 +1,240 @@
+"""
+Local navigation classifier - resolves obvious navigation intents without an LLM call
+Keyword rules plus TF-IDF similarity over sections.json and the navigation tool declarations
+Portfolio-specific vocabulary (company, school and technology names) lives in sections.json
+("keywords" per section); only generic intent words are kept here
+"""
+
+import math
+import os
+import re
+from collections import Counter
+from typing import Any, Dict, List, Sequence, Tuple
+
+NAVIGATION_FAST_PATH = os.getenv("NAVIGATION_FAST_PATH", "true").lower() in ("1", "true", "yes")
+# Predictions below this confidence are sent to Gemini instead
+NAVIGATION_FAST_PATH_MIN_CONFIDENCE = float(os.getenv("NAVIGATION_FAST_PATH_MIN_CONFIDENCE", "0.75"))
+
+# Generic intent words per section type, same rules as the NavigationService system prompt
+# ("Navigation Guidelines"); each section's id, name and sections.json keywords are added to these
+INTENT_KEYWORDS = {
+    "home": ["homepage", "home page", "landing page", "start", "beginning", "hero"],
+    "about": ["about section", "background", "overview", "summary", "introduce", "introduction"],
+    "experience": [
+        "work experience", "work history", "job", "company", "companies", "role",
+        "career", "employer", "worked"
+    ],
+    "projects": ["project", "implementation", "case study", "case studies", "work sample", "work example", "built"],
+    "skills": [
+        "skill", "technology", "technologies", "tech stack", "programming language", "language",
+        "framework", "expertise"
+    ],
+    "github": ["repo", "repository", "repositories", "contribution", "open source", "commit"],
+    "education": [
+        "degree", "university", "college", "study", "studied", "academic",
+        "academic background", "certification", "course"
+    ],
+    "contact": [
+        "reach out", "get in touch", "send message", "send a message", "email",
+        "phone", "linkedin", "hire", "collaborate", "collaboration"
+    ],
+}
+
+# Messages made only of these words are greetings/acknowledgements -> home
+GREETING_WORDS = {
+    "hello", "hi", "hey", "hiya", "yo", "greetings", "good", "morning", "afternoon", "evening",
+    "thanks", "thank", "thx", "cheers", "nice", "cool", "great", "awesome", "ok", "okay",
+    "portfolio", "there", "you", "sup", "whats", "up", "howdy", "bye", "goodbye",
+}
+
+STOPWORDS = {
+    "a", "an", "the", "and", "or", "of", "to", "in", "on", "for", "with", "at", "by", "from",
+    "me", "my", "your", "yours", "you", "i", "we", "us", "he", "his", "him", "she", "her", "it",
+    "is", "are", "was", "were", "be", "been", "do", "does", "did", "can", "could", "would",
+    "will", "should", "please", "show", "tell", "take", "go", "see", "view", "want", "wanna",
+    "let", "lets", "what", "which", "who", "how", "where", "when", "some", "any", "more",
+    "about", "this", "that", "these", "those", "there", "have", "has", "had", "sriharsha",
+    "use", "user", "when", "wants", "asks", "section", "navigate", "like", "know", "give",
+}
+
+GREETING_CONFIDENCE = 0.95
+# Keyword confidence ranges from KEYWORD_MIN (tie between sections) to KEYWORD_MAX (single section)
+KEYWORD_MIN_CONFIDENCE = 0.6
+KEYWORD_MAX_CONFIDENCE = 0.95
+
+_TOKEN = re.compile(r"[a-z0-9+#]+")
+
+
+def _stem(token: str) -> str:
+    # Plurals only: "projects" -> "project", "technologies" -> "technology"
+    if len(token) > 4 and token.endswith("ies"):
+        return token[:-3] + "y"
+    if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+        return token[:-1]
+    return token
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens with plurals folded ("B.Tech" -> ["b", "tech"])"""
+    return [
+        token if token in STOPWORDS or token in GREETING_WORDS else _stem(token)
+        for token in _TOKEN.findall(text.lower().replace("'", ""))
+    ]
+
+
+class NavigationClassifier:
+    """
+    Maps a user message to a portfolio section without calling Gemini
+
+    Three rules, tried in order:
+    1. Greetings and acknowledgements ("hi", "thanks!") -> home
+    2. Section keywords, longest phrase first; confidence reflects how clearly
+       one section wins over the others
+    3. TF-IDF cosine similarity against a document per section (name,
+       sections.json description, tool declaration description, keywords);
+       confidence is the winning score discounted by the runner-up
+
+    A section's keywords are its generic intent words plus its id, name and
+    "keywords" list from sections.json, so a new section or renamed company
+    only needs a sections.json edit.
+
+    Section vectors are built once at construction, so classify() is pure
+    Python over a handful of tokens (microseconds).
+    """
+
+    def __init__(self, sections: Sequence[Dict[str, Any]], declarations: Sequence[Dict[str, Any]] = ()):
+        """
+        Args:
+            sections: Section dicts from sections.json (id, name, description, optional keywords)
+            declarations: Navigation tool declarations (navigate_to_<id>, description)
+        """
+        self.section_ids = [section["id"] for section in sections]
+        descriptions = {
+            declaration["name"].replace("navigate_to_", "", 1): declaration.get("description", "")
+            for declaration in declarations
+        }
+        keywords = {section["id"]: self._section_keywords(section) for section in sections}
+
+        # Keyword phrases indexed by first token, longest first so "academic background" beats "background"
+        self._phrases: Dict[str, List[Tuple[Tuple[str, ...], str]]] = {}
+        seen = set()
+        for section_id in self.section_ids:
+            for phrase in keywords[section_id]:
+                tokens = tuple(tokenize(phrase))
+                # Stopword-only phrases (e.g. the "about" id) would match nearly every message
+                if all(token in STOPWORDS for token in tokens) or (tokens, section_id) in seen:
+                    continue
+                seen.add((tokens, section_id))
+                self._phrases.setdefault(tokens[0], []).append((tokens, section_id))
+        for candidates in self._phrases.values():
+            candidates.sort(key=lambda item: -len(item[0]))
+
+        documents = {
+            section["id"]: self._terms(" ".join([
+                section.get("name", ""),
+                section.get("description", ""),
+                descriptions.get(section["id"], ""),
+                " ".join(keywords[section["id"]]),
+            ]))
+            for section in sections
+        }
+        document_frequency = Counter(term for terms in documents.values() for term in set(terms))
+        total = len(documents)
+        self._idf = {
+            term: math.log((1 + total) / (1 + count)) + 1
+            for term, count in document_frequency.items()
+        }
+        self._vectors = {section_id: self._vector(terms) for section_id, terms in documents.items()}
+
+    @staticmethod
+    def _section_keywords(section: Dict[str, Any]) -> List[str]:
+        return [
+            *INTENT_KEYWORDS.get(section["id"], []),
+            section["id"],
+            section.get("name", ""),
+            *section.get("keywords", []),
+        ]
+
+    @staticmethod
+    def _terms(text: str) -> List[str]:
+        return [token for token in tokenize(text) if token not in STOPWORDS]
+
+    def _vector(self, terms: List[str]) -> Dict[str, float]:
+        weights = {
+            term: count * self._idf[term]
+            for term, count in Counter(terms).items()
+            if term in self._idf
+        }
+        norm = math.sqrt(sum(weight * weight for weight in weights.values()))
+        return {term: weight / norm for term, weight in weights.items()} if norm else {}
+
+    def classify(self, message: str) -> Dict[str, Any]:
+        """
+        Predict the section a message is asking for
+
+        Args:
+            message: User's query
+
+        Returns:
+            Dictionary with section_id (None if nothing matched), confidence (0-1),
+            method ("greeting", "keywords", "tfidf" or "none") and per-section scores
+        """
+        tokens = tokenize(message)
+        if tokens and all(token in GREETING_WORDS or token in STOPWORDS for token in tokens) \
+                and any(token in GREETING_WORDS for token in tokens):
+            return self._prediction("home", GREETING_CONFIDENCE, "greeting", {"home": 1.0})
+
+        hits = self._keyword_hits(tokens)
+        if hits:
+            ranked = hits.most_common()
+            best, best_hits = ranked[0]
+            runner_up = ranked[1][1] if len(ranked) > 1 else 0
+            if best_hits > runner_up:
+                margin = (best_hits - runner_up) / best_hits
+                confidence = KEYWORD_MIN_CONFIDENCE + (KEYWORD_MAX_CONFIDENCE - KEYWORD_MIN_CONFIDENCE) * margin
+            else:
+                # Tie: let TF-IDF pick among the tied sections, but don't trust it
+                tied = [section_id for section_id, count in ranked if count == best_hits]
+                similarity = self._similarity(tokens)
+                best = max(tied, key=lambda section_id: similarity.get(section_id, 0.0))
+                confidence = KEYWORD_MIN_CONFIDENCE * 0.5
+            return self._prediction(best, confidence, "keywords", dict(hits))
+
+        similarity = self._similarity(tokens)
+        ranked_scores = sorted(similarity.items(), key=lambda item: -item[1])
+        if not ranked_scores or ranked_scores[0][1] <= 0:
+            return self._prediction(None, 0.0, "none", {})
+        best, best_score = ranked_scores[0]
+        runner_up = ranked_scores[1][1] if len(ranked_scores) > 1 else 0.0
+        confidence = best_score * (1 - runner_up / best_score)
+        return self._prediction(best, confidence, "tfidf", similarity)
+
+    def _keyword_hits(self, tokens: List[str]) -> Counter:
+        # Greedy longest match, left to right; each token counts towards one phrase at most
+        hits: Counter = Counter()
+        position = 0
+        while position < len(tokens):
+            for phrase, section_id in self._phrases.get(tokens[position], ()):
+                if tuple(tokens[position:position + len(phrase)]) == phrase:
+                    hits[section_id] += 1
+                    position += len(phrase)
+                    break
+            else:
+                position += 1
+        return hits
+
+    def _similarity(self, tokens: List[str]) -> Dict[str, float]:
+        query = self._vector([token for token in tokens if token not in STOPWORDS])
+        return {
+            section_id: round(sum(weight * vector.get(term, 0.0) for term, weight in query.items()), 4)
+            for section_id, vector in self._vectors.items()
+        }
+
+    @staticmethod
+    def _prediction(section_id, confidence: float, method: str, scores: Dict[str, float]) -> Dict[str, Any]:
+        return {
+            "section_id": section_id,
+            "confidence": round(confidence, 3),
+            "method": method,
+            "scores": scores,
+        }
@@ -5,20 +5,42 @@ Handles navigation decisions independently from question answering
 from google import genai
 from google.genai import types
 import os
+import re
 import json
+import time
 from pathlib import Path
 from typing import List, Dict, Any
-from src.tools.navigation_tools import (
-    navigate_to_home,
-    navigate_to_about,
-    navigate_to_experience,
-    navigate_to_projects,
-    navigate_to_skills,
-    navigate_to_github,
-    navigate_to_education,
-    navigate_to_contact,
-    NAVIGATION_TOOL_DECLARATIONS
+from src.tools.navigation_tools import build_section_table, NAVIGATION_TOOL_DECLARATIONS
+from src.services.resilience import (
+    GEMINI_RETRIES,
+    GEMINI_TIMEOUT_SECONDS,
+    GEMINI_TRANSIENT_ERRORS,
+    CircuitOpenError,
+    get_breaker,
+    resilient_call
 )
+from src.services.navigation_classifier import (
+    NAVIGATION_FAST_PATH,
+    NAVIGATION_FAST_PATH_MIN_CONFIDENCE,
+    NavigationClassifier
+)
+from src.services.navigation_shadow import NAVIGATION_SHADOW_ENABLED, NavigationShadow
+from src.services.cache import TTLCache
+
+# How Gemini answers: "tools" (function calling) or "enum" (constrained section id)
+NAVIGATION_LLM_MODE = os.getenv("NAVIGATION_LLM_MODE", "tools").lower()
+
+# Decision cache (keyed on the normalized message) and how often sections.json is checked for changes
+NAVIGATION_CACHE_TTL_SECONDS = float(os.getenv("NAVIGATION_CACHE_TTL_SECONDS", "3600"))
+NAVIGATION_CACHE_MAX_ENTRIES = int(os.getenv("NAVIGATION_CACHE_MAX_ENTRIES", "1024"))
+NAVIGATION_SECTIONS_CHECK_SECONDS = float(os.getenv("NAVIGATION_SECTIONS_CHECK_SECONDS", "5"))
+
+_PUNCTUATION = re.compile(r"[^\w\s]+")
+
+
+def normalize_message(message: str) -> str:
+    """Cache key for a message: lowercase, punctuation removed, whitespace collapsed"""
+    return " ".join(_PUNCTUATION.sub(" ", message.lower().replace("'", "")).split())
 
 
 class NavigationService:
@@ -26,14 +48,46 @@ class NavigationService:
     
     def __init__(self):
         self.model_name = 'gemini-2.5-flash'
+        self.timeout = GEMINI_TIMEOUT_SECONDS
+        self.retries = GEMINI_RETRIES
+        self.breaker = get_breaker("gemini")
         self.client = genai.Client(api_key=os.getenv("GOOGLE_API_KEY"))
         
-        # Load sections data
-        sections_file = Path(__file__).resolve().parent.parent.parent.parent / "sections.json"
+        # Local fast path: obvious intents are resolved without calling Gemini
+        self.fast_path = NAVIGATION_FAST_PATH
+        self.fast_path_min_confidence = NAVIGATION_FAST_PATH_MIN_CONFIDENCE
+        self._stats = {"local": 0, "llm": 0, "local_ms": 0.0, "llm_ms": 0.0}
+        # Shadow evaluation: the path that didn't serve a request also decides, in the background
+        self.shadow = NavigationShadow() if NAVIGATION_SHADOW_ENABLED else None
+        # Gemini output: "tools" (function calling) or "enum" (section id only)
+        self.llm_mode = NAVIGATION_LLM_MODE
+        
+        # Configure tools (navigation only - NO profile/GitHub tools)
+        self.tools = types.Tool(function_declarations=NAVIGATION_TOOL_DECLARATIONS)
+        
+        # Decision cache: a navigation decision depends only on the message and sections.json
+        self.decision_cache = TTLCache(max_entries=NAVIGATION_CACHE_MAX_ENTRIES, stale_ttl=0)
+        self.cache_ttl = NAVIGATION_CACHE_TTL_SECONDS
+        self._cache_stats = {"sections_reloads": 0}
+        
+        # Load sections data (prompts, configs, section table and classifier derive from it)
+        self.sections_file = Path(__file__).resolve().parent.parent.parent.parent / "sections.json"
+        self._sections_checked_at = time.monotonic()
+        self._load_sections()
+    
+    def _load_sections(self):
+        """
+        Load sections.json and rebuild everything derived from it
         
-        with open(sections_file, 'r', encoding='utf-8') as f:
+        Rebuilds the prompts, Gemini configs, section table and local classifier,
+        and clears cached decisions that may point at the old sections.
+        """
+        self._sections_mtime = os.stat(self.sections_file).st_mtime
+        with open(self.sections_file, 'r', encoding='utf-8') as f:
             sections_data = json.load(f)
         
+        self.classifier = NavigationClassifier(sections_data['sections'], NAVIGATION_TOOL_DECLARATIONS)
+        
         # Build navigation-specific system prompt
         self.system_prompt = f"""You are a navigation assistant for Sriharsha Velicheti's portfolio website.
 
@@ -76,21 +130,6 @@ Examples:
 REMEMBER: Always pick the closest matching section. Never return without calling a navigation tool.
 """
         
-        # Tool mapping for execution
-        self.tool_functions = {
-            "navigate_to_home": navigate_to_home,
-            "navigate_to_about": navigate_to_about,
-            "navigate_to_experience": navigate_to_experience,
-            "navigate_to_projects": navigate_to_projects,
-            "navigate_to_skills": navigate_to_skills,
-            "navigate_to_github": navigate_to_github,
-            "navigate_to_education": navigate_to_education,
-            "navigate_to_contact": navigate_to_contact,
-        }
-        
-        # Configure tools (navigation only - NO profile/GitHub tools)
-        self.tools = types.Tool(function_declarations=NAVIGATION_TOOL_DECLARATIONS)
-        
         self.config = types.GenerateContentConfig(
             temperature=0.1,  # Lower temperature for consistent decisions
             top_p=0.9,
@@ -98,59 +137,267 @@ REMEMBER: Always pick the closest matching section. Never return without calling
             system_instruction=self.system_prompt,
             tools=[self.tools],
         )
+        
+        # Enum mode: Gemini returns only a section id; the action comes from the precomputed table
+        self.section_table = build_section_table(sections_data['sections'])
+        section_lines = "\n".join(
+            f"- {section['id']}: {section['description']}" for section in sections_data['sections']
+        )
+        self.enum_prompt = f"""Pick the section of Sriharsha Velicheti's portfolio that best answers the visitor's message.
+
+Sections:
+{section_lines}
+
+Greetings, thanks, small talk, introductions and unclear intent → home.
+"""
+        self.enum_config = types.GenerateContentConfig(
+            temperature=0.1,
+            max_output_tokens=16,
+            system_instruction=self.enum_prompt,
+            response_mime_type="text/x.enum",
+            response_schema=types.Schema(type=types.Type.STRING, enum=list(self.section_table)),
+            thinking_config=types.ThinkingConfig(thinking_budget=0),
+        )
+        
+        self.decision_cache.clear()
+    
+    def _check_sections(self):
+        """Reload sections.json if it changed (checked at most every NAVIGATION_SECTIONS_CHECK_SECONDS)"""
+        now = time.monotonic()
+        if now - self._sections_checked_at < NAVIGATION_SECTIONS_CHECK_SECONDS:
+            return
+        self._sections_checked_at = now
+        try:
+            if os.stat(self.sections_file).st_mtime != self._sections_mtime:
+                self._load_sections()
+                self._cache_stats["sections_reloads"] += 1
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Sections reload error: {e}")
     
     async def get_navigation_decision(self, user_message: str) -> List[Dict[str, Any]]:
         """
         Determine navigation actions based on user query
         
+        Decisions are cached by normalized message (see normalize_message);
+        confident local classifications are answered directly; ambiguous
+        queries fall back to Gemini. Each action reports the path taken
+        ('cache', 'local' or 'llm') and the local classifier's confidence.
+        
         Args:
             user_message: User's query
             
         Returns:
             List of navigation actions (usually 0 or 1 action)
         """
+        self._check_sections()
+        key = normalize_message(user_message)
+        # A fresh entry is a cache hit; callers joining an in-flight miss get the decider's path
+        hit = self.decision_cache.get(key) is not None
+        actions = await self.decision_cache.get_or_load(key, lambda: self._decide(user_message), self.cache_ttl)
+        # Copies, so callers can't modify the cached decision
+        if hit:
+            return [{**action, 'path': 'cache'} for action in actions]
+        return [dict(action) for action in actions]
+    
+    async def _decide(self, user_message: str) -> List[Dict[str, Any]]:
+        """
+        Make an uncached navigation decision (local fast path, then Gemini)
+        
+        Args:
+            user_message: User's query
+            
+        Returns:
+            List of navigation actions annotated with path and confidence
+        """
+        start = time.perf_counter()
+        prediction = self.classifier.classify(user_message) if self.fast_path or self.shadow else None
+        local_ms = (time.perf_counter() - start) * 1000
+        
+        if self.fast_path and prediction and prediction['section_id'] \
+                and prediction['confidence'] >= self.fast_path_min_confidence:
+            actions = self._section_action(
+                prediction['section_id'],
+                f"Matched {prediction['method']} (confidence {prediction['confidence']})"
+            )
+            path = "local"
+        else:
+            actions = await self._llm_decision(user_message)
+            path = "llm"
+        
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self._stats[path] += 1
+        self._stats[f"{path}_ms"] += elapsed_ms
+        if self.shadow:
+            self._shadow_compare(user_message, path, actions, elapsed_ms, prediction, local_ms)
+        
+        confidence = prediction['confidence'] if prediction else None
+        for action in actions:
+            action['path'] = path
+            action['confidence'] = confidence
+        return actions
+    
+    def _shadow_compare(
+        self,
+        user_message: str,
+        path: str,
+        actions: List[Dict[str, Any]],
+        elapsed_ms: float,
+        prediction: Dict[str, Any],
+        local_ms: float
+    ):
+        """
+        Schedule the shadow decision for a served request (never blocks it)
+        
+        Gemini-served requests are compared with the local prediction already
+        computed; locally served ones are re-decided by Gemini in a background
+        task for a sample of requests (NAVIGATION_SHADOW_LLM_SAMPLE_RATE).
+        """
+        served = {
+            "path": path,
+            "section_id": actions[0]['section_id'] if actions else None,
+            "latency_ms": round(elapsed_ms, 3),
+        }
+        local = {
+            "path": "local",
+            "section_id": prediction['section_id'],
+            "confidence": prediction['confidence'],
+            "method": prediction['method'],
+            "latency_ms": round(local_ms, 3),
+        }
+        if path == "llm":
+            self.shadow.schedule(self.shadow.record(user_message, served, local))
+        elif self.shadow.should_check_llm():
+            self.shadow.schedule(self._shadow_llm(user_message, {**local, **served}))
+    
+    async def _shadow_llm(self, user_message: str, served: Dict[str, Any]):
+        """Make the Gemini decision for a locally served request and record the comparison"""
+        start = time.perf_counter()
+        actions = await self._llm_decision(user_message)
+        await self.shadow.record(user_message, served, {
+            "path": "llm",
+            "section_id": actions[0]['section_id'] if actions else None,
+            "latency_ms": round((time.perf_counter() - start) * 1000, 3),
+        })
+    
+    async def _llm_decision(self, user_message: str) -> List[Dict[str, Any]]:
+        """
+        Ask Gemini which section to navigate to
+        
+        In "tools" mode Gemini calls one of the navigate_to_* tools; in "enum"
+        mode it returns just the section id (constrained output, short prompt,
+        no thinking) and the action is looked up in the section table.
+        
+        Args:
+            user_message: User's query
+            
+        Returns:
+            List of navigation actions (empty on error or open circuit)
+        """
         try:
             # Simple single-turn prompt
             contents = [
                 types.Content(role="user", parts=[types.Part(text=user_message)])
             ]
             
-            actions = []
+            enum_mode = self.llm_mode == "enum"
+            config = self.enum_config if enum_mode else self.config
             
             # Single call to determine navigation (no multi-turn needed)
-            response = self.client.models.generate_content(
-                model=self.model_name,
-                contents=contents,
-                config=self.config
+            response = await resilient_call(
+                lambda: self.client.aio.models.generate_content(
+                    model=self.model_name,
+                    contents=contents,
+                    config=config
+                ),
+                self.breaker,
+                self.timeout,
+                retries=self.retries,
+                retry_on=GEMINI_TRANSIENT_ERRORS
             )
             
+            if enum_mode:
+                return self._section_action((response.text or "").strip().strip('"'))
+            
             if response.candidates and response.candidates[0].content.parts:
                 first_part = response.candidates[0].content.parts[0]
                 
                 if first_part.function_call:
                     function_call = first_part.function_call
-                    function_name = function_call.name
                     function_args = dict(function_call.args) if function_call.args else {}
-                    
-                    # Execute navigation tool
-                    if function_name in self.tool_functions:
-                        try:
-                            nav_result = await self.tool_functions[function_name](**function_args)
-                            
-                            # Build action from navigation result
-                            if isinstance(nav_result, dict) and nav_result.get('action') == 'navigate':
-                                actions.append({
-                                    'type': 'navigate',
-                                    'section_id': nav_result.get('section_id'),
-                                    'section_name': nav_result.get('section_name'),
-                                    'reason': nav_result.get('reason', ''),
-                                    'audio_text': nav_result.get('audio_text', '')
-                                })
-                        except Exception as e:
-                            print(f"Navigation tool execution error: {e}")
+                    return self._execute_navigation(function_call.name, function_args)
             
-            return actions
+            return []
             
+        except CircuitOpenError:
+            # Degraded: no navigation while Gemini is unavailable
+            return []
         except Exception as e:
             print(f"Navigation decision error: {e}")
             return []
+    
+    def _execute_navigation(self, function_name: str, function_args: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Build the action for a navigate_to_<section> tool call
+        
+        Uses the section table rebuilt on every sections.json reload, like the
+        enum and fused paths, so names and copy never come from stale sections.
+        
+        Args:
+            function_name: navigate_to_<section> tool name
+            function_args: Tool arguments (e.g. reason)
+            
+        Returns:
+            List with one navigation action, or empty for unknown tools/sections
+        """
+        if not function_name.startswith("navigate_to_"):
+            return []
+        return self._section_action(
+            function_name.replace("navigate_to_", "", 1),
+            str(function_args.get('reason') or '')
+        )
+    
+    def _section_action(self, section_id: str, reason: str = "") -> List[Dict[str, Any]]:
+        """
+        Build a navigation action from the precomputed section table
+        
+        Args:
+            section_id: Section to navigate to
+            reason: Optional explanation (defaults to the section's canned reason)
+            
+        Returns:
+            List with one navigation action, or empty for unknown sections
+        """
+        section = self.section_table.get(section_id)
+        if section is None:
+            return []
+        return [{
+            'type': 'navigate',
+            'section_id': section_id,
+            'section_name': section['section_name'],
+            'reason': reason or section['reason'],
+            'audio_text': section['audio_text']
+        }]
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get navigation path statistics
+        
+        Returns:
+            Dictionary with decision counts per path, local share, average latency per path,
+            decision cache counters and shadow evaluation counters (None when shadow mode is off)
+        """
+        local, llm = self._stats["local"], self._stats["llm"]
+        total = local + llm
+        return {
+            "llm_mode": self.llm_mode,
+            "fast_path": self.fast_path,
+            "min_confidence": self.fast_path_min_confidence,
+            "decisions": total,
+            "local": local,
+            "llm": llm,
+            "local_ratio": round(local / total, 3) if total else 0.0,
+            "avg_local_ms": round(self._stats["local_ms"] / local, 3) if local else None,
+            "avg_llm_ms": round(self._stats["llm_ms"] / llm, 3) if llm else None,
+            "cache": {**self.decision_cache.stats(), **self._cache_stats},
+            "shadow": self.shadow.status() if self.shadow else None,
+        }
@@ -0,0 +1,221 @@
+"""
+Navigation shadow evaluation - compares the local classifier with Gemini on live traffic
+Every decision is also made by the path that did not serve it, off the critical path,
+and both results are appended to a JSONL log that summarize() reports on
+(see benchmarks/navigation_shadow_report.py)
+"""
+
+import asyncio
+import json
+import os
+import random
+import threading
+from collections import Counter
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set
+import logging
+
+logger = logging.getLogger(__name__)
+
+NAVIGATION_SHADOW_ENABLED = os.getenv("NAVIGATION_SHADOW_ENABLED", "false").lower() in ("1", "true", "yes")
+NAVIGATION_SHADOW_LOG_PATH = os.getenv(
+    "NAVIGATION_SHADOW_LOG_PATH",
+    str(Path(__file__).resolve().parent.parent.parent / ".cache" / "navigation_shadow.jsonl")
+)
+# Share of locally served decisions that are re-checked with Gemini (costs quota)
+NAVIGATION_SHADOW_LLM_SAMPLE_RATE = float(os.getenv("NAVIGATION_SHADOW_LLM_SAMPLE_RATE", "1.0"))
+
+MAX_MESSAGE_CHARS = 200
+CONFIDENCE_BUCKETS = (0.0, 0.25, 0.5, 0.75, 0.9)
+
+
+class NavigationShadow:
+    """
+    Background recorder for shadow navigation decisions
+
+    Records are written by a worker thread, so the request path only pays for
+    scheduling a task. Pending tasks are kept referenced until they finish.
+    """
+
+    def __init__(self, log_path: str = NAVIGATION_SHADOW_LOG_PATH, llm_sample_rate: float = NAVIGATION_SHADOW_LLM_SAMPLE_RATE):
+        """
+        Args:
+            log_path: JSONL file the records are appended to
+            llm_sample_rate: Fraction (0-1) of local decisions to re-check with Gemini
+        """
+        self.log_path = Path(log_path)
+        self.llm_sample_rate = llm_sample_rate
+        self._lock = threading.Lock()
+        self._tasks: Set[asyncio.Task] = set()
+        self._stats = {"recorded": 0, "agreed": 0, "skipped": 0, "errors": 0}
+
+    def should_check_llm(self) -> bool:
+        """Whether this locally served decision should also be made by Gemini"""
+        return random.random() < self.llm_sample_rate
+
+    def schedule(self, coro) -> None:
+        """Run a shadow coroutine in the background, never failing the caller"""
+        task = asyncio.ensure_future(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._finished)
+
+    def _finished(self, task: asyncio.Task):
+        self._tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            self._stats["errors"] += 1
+            logger.error(f"Navigation shadow error: {task.exception()}")
+
+    async def record(self, message: str, primary: Dict[str, Any], shadow: Dict[str, Any]):
+        """
+        Append one comparison to the log (skipped when Gemini made no decision)
+
+        Args:
+            message: User's query (truncated in the log)
+            primary: Decision that was served ({path, section_id, latency_ms})
+            shadow: Decision made in the background ({path, section_id, confidence, method, latency_ms})
+        """
+        llm = primary if primary.get("path") == "llm" else shadow
+        if llm.get("section_id") is None:
+            # Gemini failed or chose nothing: no reference to compare against
+            self._stats["skipped"] += 1
+            return
+        record = {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "message": message[:MAX_MESSAGE_CHARS],
+            "primary": primary,
+            "shadow": shadow,
+            "agree": primary.get("section_id") == shadow.get("section_id"),
+        }
+        self._stats["recorded"] += 1
+        self._stats["agreed"] += record["agree"]
+        await asyncio.to_thread(self._append, json.dumps(record, ensure_ascii=False))
+
+    def _append(self, line: str):
+        with self._lock:
+            self.log_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.log_path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+
+    async def drain(self):
+        """Wait for pending shadow work (tests and shutdown)"""
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+    def status(self) -> Dict[str, Any]:
+        """
+        Get in-process shadow counters
+
+        Returns:
+            Dictionary with log_path, recorded, agreed, agreement_rate, skipped, errors and pending
+        """
+        recorded = self._stats["recorded"]
+        return {
+            "log_path": str(self.log_path),
+            **self._stats,
+            "agreement_rate": round(self._stats["agreed"] / recorded, 3) if recorded else None,
+            "pending": len(self._tasks),
+        }
+
+
+def load_records(log_path: str = NAVIGATION_SHADOW_LOG_PATH) -> List[Dict[str, Any]]:
+    """
+    Read a shadow log, skipping malformed lines
+
+    Args:
+        log_path: JSONL file written by NavigationShadow
+
+    Returns:
+        List of records (empty if the file doesn't exist)
+    """
+    path = Path(log_path)
+    if not path.exists():
+        return []
+    records = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    return records
+
+
+def _percentiles(values: List[float]) -> Dict[str, Optional[float]]:
+    if not values:
+        return {"count": 0, "p50": None, "p95": None, "p99": None}
+    ordered = sorted(values)
+
+    def at(q: float) -> float:
+        return round(ordered[min(len(ordered) - 1, int(q * len(ordered)))], 3)
+
+    return {"count": len(ordered), "p50": at(0.5), "p95": at(0.95), "p99": at(0.99)}
+
+
+def _bucket(confidence: Optional[float]) -> Optional[str]:
+    if confidence is None:
+        return None
+    lower = max(edge for edge in CONFIDENCE_BUCKETS if confidence >= edge)
+    upper = next((edge for edge in CONFIDENCE_BUCKETS if edge > lower), 1.0)
+    return f"{lower:.2f}-{upper:.2f}"
+
+
+def summarize(records: Iterable[Dict[str, Any]], samples: int = 10) -> Dict[str, Any]:
+    """
+    Summarise shadow records
+
+    The local classifier's accuracy is measured against Gemini whichever of the
+    two served the request; agreement per confidence bucket shows what
+    NAVIGATION_FAST_PATH_MIN_CONFIDENCE can safely be.
+
+    Args:
+        records: Records from load_records
+        samples: Number of most recent disagreements to include
+
+    Returns:
+        Dictionary with totals, agreement_rate, latency percentiles per path,
+        agreement by local confidence bucket, top confusions and disagreement samples
+    """
+    records = list(records)
+    latencies: Dict[str, List[float]] = {}
+    buckets: Dict[str, Counter] = {}
+    confusions: Counter = Counter()
+    disagreements = []
+
+    for record in records:
+        decisions = [record.get("primary", {}), record.get("shadow", {})]
+        for decision in decisions:
+            if decision.get("latency_ms") is not None:
+                latencies.setdefault(decision.get("path", "unknown"), []).append(decision["latency_ms"])
+
+        local = next((d for d in decisions if d.get("path") == "local"), {})
+        llm = next((d for d in decisions if d.get("path") == "llm"), {})
+        bucket = _bucket(local.get("confidence"))
+        if bucket:
+            buckets.setdefault(bucket, Counter())["agree" if record.get("agree") else "disagree"] += 1
+        if not record.get("agree"):
+            confusions[f"{local.get('section_id')} (local) vs {llm.get('section_id')} (llm)"] += 1
+            disagreements.append({
+                "message": record.get("message"),
+                "local": local.get("section_id"),
+                "confidence": local.get("confidence"),
+                "llm": llm.get("section_id"),
+                "served": record.get("primary", {}).get("path"),
+            })
+
+    agreed = sum(1 for record in records if record.get("agree"))
+    return {
+        "records": len(records),
+        "agreement_rate": round(agreed / len(records), 3) if records else None,
+        "served": dict(Counter(record.get("primary", {}).get("path") for record in records)),
+        "latency_ms": {path: _percentiles(values) for path, values in sorted(latencies.items())},
+        "agreement_by_confidence": {
+            bucket: {
+                "records": counts["agree"] + counts["disagree"],
+                "agreement_rate": round(counts["agree"] / (counts["agree"] + counts["disagree"]), 3),
+            }
+            for bucket, counts in sorted(buckets.items())
+        },
+        "top_confusions": dict(confusions.most_common(5)),
+        "disagreements": disagreements[-samples:] if samples else [],
+    }
@@ -0,0 +1,310 @@
+"""
+Persistent GitHub cache - SQLite (WAL) store that survives container restarts
+Holds normalized profile, repository, language and commit records plus ETag validators
+"""
+
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS profiles (
+    username TEXT PRIMARY KEY,
+    data TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS repositories (
+    owner TEXT NOT NULL,
+    name TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    size INTEGER NOT NULL,
+    PRIMARY KEY (owner, name)
+);
+CREATE TABLE IF NOT EXISTS languages (
+    owner TEXT NOT NULL,
+    repo TEXT NOT NULL,
+    data TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    size INTEGER NOT NULL,
+    PRIMARY KEY (owner, repo)
+);
+CREATE TABLE IF NOT EXISTS commits (
+    owner TEXT NOT NULL,
+    repo TEXT NOT NULL,
+    sha TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    size INTEGER NOT NULL,
+    PRIMARY KEY (owner, repo, sha)
+);
+CREATE TABLE IF NOT EXISTS etags (
+    endpoint TEXT PRIMARY KEY,
+    etag TEXT,
+    last_modified TEXT,
+    link TEXT,
+    body TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    size INTEGER NOT NULL
+);
+"""
+
+# Eviction units, least recently accessed first (grouped tables are evicted as a whole list)
+EVICTION_CANDIDATES = """
+SELECT 'profiles', username, NULL, accessed_at, size FROM profiles
+UNION ALL
+SELECT 'repositories', owner, NULL, MAX(accessed_at), SUM(size) FROM repositories GROUP BY owner
+UNION ALL
+SELECT 'languages', owner, repo, accessed_at, size FROM languages
+UNION ALL
+SELECT 'commits', owner, repo, MAX(accessed_at), SUM(size) FROM commits GROUP BY owner, repo
+UNION ALL
+SELECT 'etags', endpoint, NULL, accessed_at, size FROM etags
+ORDER BY 4
+"""
+
+EVICTION_DELETES = {
+    "profiles": "DELETE FROM profiles WHERE username = ?",
+    "repositories": "DELETE FROM repositories WHERE owner = ?",
+    "languages": "DELETE FROM languages WHERE owner = ? AND repo = ?",
+    "commits": "DELETE FROM commits WHERE owner = ? AND repo = ?",
+    "etags": "DELETE FROM etags WHERE endpoint = ?",
+}
+
+
+class GitHubDiskCache:
+    """
+    SQLite-backed cache tier for GitHubService
+
+    All public methods are coroutines that run the blocking SQLite work in a
+    worker thread. When the stored data exceeds `max_bytes`, the least recently
+    accessed records are evicted until usage drops below 90% of the cap.
+    Usage is a running total kept by the writes; the tables are only summed
+    on open and after an eviction.
+    """
+
+    def __init__(self, path: str, max_bytes: int = 50 * 1024 * 1024):
+        """
+        Args:
+            path: SQLite database file (parent directories are created)
+            max_bytes: Size cap for stored record data
+        """
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+        self._stats = {"reads": 0, "hits": 0, "writes": 0, "evictions": 0}
+        self._bytes = self._total_bytes()
+
+    async def _run(self, fn, *args):
+        return await asyncio.to_thread(self._locked, fn, *args)
+
+    def _locked(self, fn, *args):
+        with self._lock:
+            return fn(*args)
+
+    def _read(self, query: str, params: Tuple, touch: Optional[Tuple[str, Tuple]] = None) -> List[Tuple]:
+        self._stats["reads"] += 1
+        rows = self._conn.execute(query, params).fetchall()
+        if rows:
+            self._stats["hits"] += 1
+            if touch:
+                self._conn.execute(touch[0], (time.time(), *touch[1]))
+                self._conn.commit()
+        return rows
+
+    def _write(self, statements: List[Tuple[str, Any]], size: int, replaced: Tuple[str, Tuple]):
+        """
+        Run write statements in one transaction and update the running byte total
+
+        Args:
+            statements: (statement, params) pairs; list params use executemany
+            size: Bytes of record data being written
+            replaced: Keyed (indexed) query summing the size of the records being replaced
+        """
+        self._stats["writes"] += 1
+        with self._conn:
+            replaced_bytes = self._conn.execute(*replaced).fetchone()[0]
+            for statement, params in statements:
+                if isinstance(params, list):
+                    self._conn.executemany(statement, params)
+                else:
+                    self._conn.execute(statement, params)
+        self._bytes += size - replaced_bytes
+        self._evict_if_needed()
+
+    def _evict_if_needed(self):
+        if self._bytes <= self.max_bytes:
+            return
+
+        total = self._bytes
+        target = self.max_bytes * 0.9
+        with self._conn:
+            for table, key1, key2, _, size in self._conn.execute(EVICTION_CANDIDATES).fetchall():
+                if total <= target:
+                    break
+                params = (key1,) if key2 is None else (key1, key2)
+                self._conn.execute(EVICTION_DELETES[table], params)
+                total -= size or 0
+                self._stats["evictions"] += 1
+        self._bytes = self._total_bytes()
+
+    def _total_bytes(self) -> int:
+        return sum(
+            self._conn.execute(f"SELECT COALESCE(SUM(size), 0) FROM {table}").fetchone()[0]
+            for table in EVICTION_DELETES
+        )
+
+    # Profiles
+
+    async def get_profile(self, username: str) -> Optional[Tuple[Dict, float]]:
+        """Get a stored profile as (profile, fetched_at)"""
+        rows = await self._run(
+            self._read,
+            "SELECT data, fetched_at FROM profiles WHERE username = ?",
+            (username,),
+            ("UPDATE profiles SET accessed_at = ? WHERE username = ?", (username,))
+        )
+        return (json.loads(rows[0][0]), rows[0][1]) if rows else None
+
+    async def put_profile(self, username: str, profile: Dict):
+        data = json.dumps(profile)
+        now = time.time()
+        await self._run(self._write, [(
+            "INSERT OR REPLACE INTO profiles VALUES (?, ?, ?, ?, ?)",
+            (username, data, now, now, len(data))
+        )], len(data), ("SELECT COALESCE(SUM(size), 0) FROM profiles WHERE username = ?", (username,)))
+
+    # Repositories (one row per repository, full list per owner)
+
+    async def get_repositories(self, owner: str) -> Optional[Tuple[List[Dict], float]]:
+        """Get a stored repository list as (repositories, fetched_at)"""
+        rows = await self._run(
+            self._read,
+            "SELECT data, fetched_at FROM repositories WHERE owner = ? ORDER BY position",
+            (owner,),
+            ("UPDATE repositories SET accessed_at = ? WHERE owner = ?", (owner,))
+        )
+        return ([json.loads(row[0]) for row in rows], min(row[1] for row in rows)) if rows else None
+
+    async def put_repositories(self, owner: str, repos: List[Dict]):
+        now = time.time()
+        rows = []
+        for position, repo in enumerate(repos):
+            data = json.dumps(repo)
+            rows.append((owner, repo.get("name"), position, data, now, now, len(data)))
+        await self._run(self._write, [
+            ("DELETE FROM repositories WHERE owner = ?", (owner,)),
+            ("INSERT OR REPLACE INTO repositories VALUES (?, ?, ?, ?, ?, ?, ?)", rows),
+        ], sum(row[-1] for row in rows), ("SELECT COALESCE(SUM(size), 0) FROM repositories WHERE owner = ?", (owner,)))
+
+    # Languages
+
+    async def get_languages(self, owner: str, repo: str) -> Optional[Tuple[Dict[str, int], float]]:
+        """Get stored language byte counts as (languages, fetched_at)"""
+        rows = await self._run(
+            self._read,
+            "SELECT data, fetched_at FROM languages WHERE owner = ? AND repo = ?",
+            (owner, repo),
+            ("UPDATE languages SET accessed_at = ? WHERE owner = ? AND repo = ?", (owner, repo))
+        )
+        return (json.loads(rows[0][0]), rows[0][1]) if rows else None
+
+    async def put_languages(self, owner: str, repo: str, languages: Dict[str, int]):
+        data = json.dumps(languages)
+        now = time.time()
+        await self._run(self._write, [(
+            "INSERT OR REPLACE INTO languages VALUES (?, ?, ?, ?, ?, ?)",
+            (owner, repo, data, now, now, len(data))
+        )], len(data), ("SELECT COALESCE(SUM(size), 0) FROM languages WHERE owner = ? AND repo = ?", (owner, repo)))
+
+    # Commits (one row per commit, newest first)
+
+    async def get_commits(self, owner: str, repo: str, limit: int) -> Optional[Tuple[List[Dict], float]]:
+        """Get the newest `limit` stored commits as (commits, fetched_at), if that many are stored"""
+        rows = await self._run(
+            self._read,
+            "SELECT data, fetched_at FROM commits WHERE owner = ? AND repo = ? ORDER BY position LIMIT ?",
+            (owner, repo, limit),
+            ("UPDATE commits SET accessed_at = ? WHERE owner = ? AND repo = ?", (owner, repo))
+        )
+        if len(rows) < limit:
+            return None
+        return [json.loads(row[0]) for row in rows], min(row[1] for row in rows)
+
+    async def put_commits(self, owner: str, repo: str, commits: List[Dict]):
+        now = time.time()
+        rows = []
+        for position, commit in enumerate(commits):
+            data = json.dumps(commit)
+            rows.append((owner, repo, commit.get("sha"), position, data, now, now, len(data)))
+        await self._run(self._write, [
+            ("DELETE FROM commits WHERE owner = ? AND repo = ?", (owner, repo)),
+            ("INSERT OR REPLACE INTO commits VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows),
+        ], sum(row[-1] for row in rows), ("SELECT COALESCE(SUM(size), 0) FROM commits WHERE owner = ? AND repo = ?", (owner, repo)))
+
+    # ETag validators
+
+    async def get_etag(self, endpoint: str) -> Optional[Dict[str, Any]]:
+        """Get a stored conditional-request entry (same shape as GitHubService's ETag cache)"""
+        rows = await self._run(
+            self._read,
+            "SELECT etag, last_modified, link, body, fetched_at FROM etags WHERE endpoint = ?",
+            (endpoint,),
+            ("UPDATE etags SET accessed_at = ? WHERE endpoint = ?", (endpoint,))
+        )
+        if not rows:
+            return None
+        etag, last_modified, link, body, fetched_at = rows[0]
+        return {
+            "body": json.loads(body),
+            "etag": etag,
+            "last_modified": last_modified,
+            "link": link,
+            "fetched_at": fetched_at
+        }
+
+    async def put_etag(self, endpoint: str, entry: Dict[str, Any]):
+        body = json.dumps(entry["body"])
+        now = time.time()
+        await self._run(self._write, [(
+            "INSERT OR REPLACE INTO etags VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (endpoint, entry["etag"], entry["last_modified"], entry["link"], body, entry["fetched_at"], now, len(body))
+        )], len(body), ("SELECT COALESCE(SUM(size), 0) FROM etags WHERE endpoint = ?", (endpoint,)))
+
+    async def stats(self) -> Dict[str, Any]:
+        """
+        Get disk cache counters
+
+        Returns:
+            Dictionary with reads, hits, writes, evictions, stored bytes and size cap
+        """
+        return await self._run(self._snapshot)
+
+    def _snapshot(self) -> Dict[str, Any]:
+        return {**self._stats, "bytes": self._bytes, "max_bytes": self.max_bytes, "path": str(self.path)}
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,73 @@
+"""
+Field projection (sparse fieldsets) for API and tool payloads
+Prunes results to the fields a consumer asked for before they are serialized
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+Fields = Optional[Union[str, Sequence[str]]]
+
+
+def parse_fields(fields: Fields) -> List[str]:
+    """
+    Normalize a field selection
+
+    Args:
+        fields: Comma-separated string ("name,stargazers_count") or list of field names
+
+    Returns:
+        List of non-empty field paths (empty list means "all fields")
+    """
+    if not fields:
+        return []
+    if isinstance(fields, str):
+        fields = fields.split(",")
+    return [field.strip() for field in fields if field and field.strip()]
+
+
+def project(data: Any, fields: Fields) -> Any:
+    """
+    Keep only the selected fields of a dict, or of every dict in a list
+
+    Dotted paths select nested keys ("profile.followers", "payload.commits");
+    a path through a list applies to each item. Unknown fields are ignored.
+
+    Args:
+        data: Dict, list of dicts, or any other value (returned unchanged)
+        fields: Field selection (see parse_fields); empty returns data unchanged
+
+    Returns:
+        Projected copy of data
+    """
+    paths = parse_fields(fields)
+    if not paths:
+        return data
+    return _project(data, _tree(paths))
+
+
+def _tree(paths: List[str]) -> Dict[str, Any]:
+    # "a.b", "a.c", "d" -> {"a": {"b": {}, "c": {}}, "d": {}}; {} means "whole value"
+    tree: Dict[str, Any] = {}
+    for path in paths:
+        node = tree
+        parts = path.split(".")
+        for index, part in enumerate(parts):
+            if part in node and not node[part]:
+                break  # an ancestor is already selected whole
+            child = node.setdefault(part, {})
+            if index == len(parts) - 1:
+                child.clear()
+            node = child
+    return tree
+
+
+def _project(data: Any, tree: Dict[str, Any]) -> Any:
+    if isinstance(data, list):
+        return [_project(item, tree) for item in data]
+    if not isinstance(data, dict):
+        return data
+    return {
+        key: _project(data[key], subtree) if subtree else data[key]
+        for key, subtree in tree.items()
+        if key in data
+    }
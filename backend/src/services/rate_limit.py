@@ -0,0 +1,218 @@
+"""
+Request priority and GitHub rate-limit scheduling
+Tracks the remaining quota per token so interactive requests keep working while
+background refreshes back off as the quota runs low
+"""
+
+import asyncio
+import heapq
+import itertools
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Priorities (lower runs first)
+INTERACTIVE = 0
+BACKGROUND = 1
+
+# Max outbound GitHub requests in flight per token
+MAX_CONCURRENT_REQUESTS = int(os.getenv("GITHUB_MAX_CONCURRENT_REQUESTS", "16"))
+
+# Background work is shed once remaining quota drops below this share of the limit
+BACKGROUND_RESERVE_RATIO = float(os.getenv("GITHUB_RATE_LIMIT_BACKGROUND_RESERVE", "0.2"))
+
+# Longest an interactive request will wait for a rate limit to clear before giving up
+MAX_WAIT_SECONDS = float(os.getenv("GITHUB_RATE_LIMIT_MAX_WAIT_SECONDS", "10"))
+
+# Secondary rate limits without Retry-After: GitHub asks clients to wait at least a minute
+SECONDARY_LIMIT_BACKOFF_SECONDS = 60
+
+_priority: ContextVar[int] = ContextVar("request_priority", default=INTERACTIVE)
+
+
+def current_priority() -> int:
+    """Priority of outbound requests made from the current context"""
+    return _priority.get()
+
+
+@contextmanager
+def background_priority() -> Iterator[None]:
+    """Mark requests made inside the block (and tasks started from it) as background work"""
+    token = _priority.set(BACKGROUND)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+class GitHubRateLimiter:
+    """
+    Quota-aware scheduler for GitHub API calls made with one token
+
+    Concurrency slots are handed out lowest priority value first. Before a slot
+    is granted the limiter checks the known quota: background work is shed when
+    the remaining quota is within the reserve, and interactive work waits out a
+    Retry-After or reset window if it is short enough, otherwise it is shed too.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = MAX_CONCURRENT_REQUESTS,
+        background_reserve: float = BACKGROUND_RESERVE_RATIO,
+        max_wait: float = MAX_WAIT_SECONDS
+    ):
+        """
+        Args:
+            max_concurrency: Max requests in flight
+            background_reserve: Share of the hourly limit kept for interactive requests
+            max_wait: Longest an interactive request waits for the limit to clear
+        """
+        self.max_concurrency = max_concurrency
+        self.background_reserve = background_reserve
+        self.max_wait = max_wait
+
+        self.limit: Optional[int] = None
+        self.remaining: Optional[int] = None
+        self.reset_at: Optional[float] = None
+        self.blocked_until = 0.0
+
+        self._free = max_concurrency
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self._stats = {"interactive": 0, "background": 0, "deferred": 0, "shed": 0, "rate_limited": 0}
+
+    def _delay(self, priority: int) -> Optional[float]:
+        """Seconds to wait before sending, or None if the request should be shed"""
+        now = time.time()
+        delay = max(self.blocked_until - now, 0.0)
+
+        if self.remaining is not None and self.reset_at and self.reset_at > now:
+            if self.remaining <= 0:
+                delay = max(delay, self.reset_at - now)
+            elif priority == BACKGROUND and self.limit and self.remaining <= self.limit * self.background_reserve:
+                return None
+
+        if delay == 0:
+            return 0.0
+        if priority == BACKGROUND or delay > self.max_wait:
+            return None
+        return delay
+
+    async def acquire(self) -> bool:
+        """
+        Wait for quota and a concurrency slot for the current context's priority
+
+        Returns:
+            True if the request may be sent (call `release` afterwards), False if it was shed
+        """
+        priority = current_priority()
+        delay = self._delay(priority)
+        if delay is None:
+            self._stats["shed"] += 1
+            return False
+        if delay:
+            self._stats["deferred"] += 1
+            await asyncio.sleep(delay)
+
+        if self._free > 0 and not self._waiters:
+            self._free -= 1
+        else:
+            waiter = asyncio.get_running_loop().create_future()
+            heapq.heappush(self._waiters, (priority, next(self._sequence), waiter))
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    # The slot was handed over just as we were cancelled
+                    self.release()
+                raise
+
+        if self.remaining is not None:
+            # Spend quota up front so a burst can't overshoot before headers come back
+            self.remaining -= 1
+        self._stats["background" if priority == BACKGROUND else "interactive"] += 1
+        return True
+
+    def release(self):
+        """Return a concurrency slot to the highest-priority waiter"""
+        while self._waiters:
+            _, _, waiter = heapq.heappop(self._waiters)
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self._free += 1
+
+    def update(self, status: int, headers: Mapping[str, str], message: str = "") -> Optional[float]:
+        """
+        Record quota headers from a response
+
+        Args:
+            status: HTTP status code
+            headers: Response headers
+            message: Error message body for 403/429 responses
+
+        Returns:
+            Seconds to back off if the response was a rate limit, else None
+        """
+        try:
+            if headers.get("X-RateLimit-Limit") is not None:
+                self.limit = int(headers["X-RateLimit-Limit"])
+            if headers.get("X-RateLimit-Remaining") is not None:
+                self.remaining = int(headers["X-RateLimit-Remaining"])
+            if headers.get("X-RateLimit-Reset") is not None:
+                self.reset_at = float(headers["X-RateLimit-Reset"])
+        except ValueError:
+            logger.warning("Ignoring malformed GitHub rate-limit headers")
+
+        if status not in (403, 429):
+            return None
+
+        now = time.time()
+        retry_after = headers.get("Retry-After")
+        if retry_after and retry_after.isdigit():
+            delay = float(retry_after)
+        elif self.remaining == 0 and self.reset_at:
+            delay = max(self.reset_at - now, 0.0)
+        elif status == 429 or "rate limit" in message.lower():
+            delay = SECONDARY_LIMIT_BACKOFF_SECONDS
+        else:
+            # A plain 403 (permissions, blocked resource) is not a rate limit
+            return None
+
+        self.blocked_until = max(self.blocked_until, now + delay)
+        self._stats["rate_limited"] += 1
+        return delay
+
+    def status(self) -> Dict[str, Any]:
+        """
+        Get quota and scheduling state
+
+        Returns:
+            Dictionary with limit, remaining, reset time, seconds blocked,
+            requests in flight and queued, and interactive/background/deferred/shed/rate_limited counters
+        """
+        return {
+            "limit": self.limit,
+            "remaining": self.remaining,
+            "reset_at": self.reset_at,
+            "blocked_for_seconds": round(max(self.blocked_until - time.time(), 0.0), 1),
+            "in_flight": self.max_concurrency - self._free,
+            "queued": sum(1 for _, _, waiter in self._waiters if not waiter.done()),
+            **self._stats
+        }
+
+
+_limiters: Dict[str, GitHubRateLimiter] = {}
+
+
+def get_rate_limiter(token: Optional[str]) -> GitHubRateLimiter:
+    """Get the process-wide limiter for a token (quota is per token, not per service instance)"""
+    key = token or ""
+    if key not in _limiters:
+        _limiters[key] = GitHubRateLimiter()
+    return _limiters[key]
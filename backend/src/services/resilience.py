@@ -0,0 +1,188 @@
+"""
+Shared resilience helpers for outbound calls (GitHub and Gemini)
+Per-call timeouts, bounded retries with jittered backoff and circuit breakers
+"""
+
+import asyncio
+import os
+import random
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Type
+import logging
+import httpx
+from google.genai import errors as genai_errors
+
+logger = logging.getLogger(__name__)
+
+# Per-call deadlines and retry budgets (retries apply to idempotent calls only)
+GITHUB_TIMEOUT_SECONDS = float(os.getenv("GITHUB_TIMEOUT_SECONDS", "10"))
+GITHUB_RETRIES = int(os.getenv("GITHUB_RETRIES", "2"))
+GEMINI_TIMEOUT_SECONDS = float(os.getenv("GEMINI_TIMEOUT_SECONDS", "30"))
+GEMINI_RETRIES = int(os.getenv("GEMINI_RETRIES", "1"))
+
+# Backoff: full jitter between 0 and min(max, base * 2^attempt)
+RETRY_BASE_DELAY_SECONDS = float(os.getenv("RETRY_BASE_DELAY_SECONDS", "0.2"))
+RETRY_MAX_DELAY_SECONDS = float(os.getenv("RETRY_MAX_DELAY_SECONDS", "2"))
+
+# Circuit breaker: consecutive failures before opening, seconds before a trial call
+BREAKER_FAILURE_THRESHOLD = int(os.getenv("BREAKER_FAILURE_THRESHOLD", "5"))
+BREAKER_RECOVERY_SECONDS = float(os.getenv("BREAKER_RECOVERY_SECONDS", "30"))
+
+# Gemini failures worth retrying (4xx client errors are not)
+GEMINI_TRANSIENT_ERRORS = (genai_errors.ServerError, httpx.TransportError, asyncio.TimeoutError, ConnectionError)
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because its circuit breaker is open"""
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker
+
+    closed: calls pass; `failure_threshold` consecutive failures open the breaker.
+    open: calls are rejected until `recovery_timeout` has passed.
+    half_open: one trial call is let through; success closes, failure re-opens.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+        recovery_timeout: float = BREAKER_RECOVERY_SECONDS
+    ):
+        """
+        Args:
+            name: Upstream name shown in monitoring
+            failure_threshold: Consecutive failures that open the breaker
+            recovery_timeout: Seconds the breaker stays open before a trial call
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = 0.0
+        self._trial_in_flight = False
+        self._stats = {"successes": 0, "failures": 0, "rejected": 0, "opened": 0}
+
+    def allow(self) -> bool:
+        """Check whether a call may go to the upstream now"""
+        if self.state == "open" and time.monotonic() - self.opened_at >= self.recovery_timeout:
+            self.state = "half_open"
+            self._trial_in_flight = False
+
+        if self.state == "closed":
+            return True
+        if self.state == "half_open" and not self._trial_in_flight:
+            self._trial_in_flight = True
+            return True
+
+        self._stats["rejected"] += 1
+        return False
+
+    def cancel_trial(self):
+        """Free the half-open trial slot when the trial call was cancelled"""
+        self._trial_in_flight = False
+
+    def record_success(self):
+        self._stats["successes"] += 1
+        self.failures = 0
+        self.state = "closed"
+        self._trial_in_flight = False
+
+    def record_failure(self):
+        self._stats["failures"] += 1
+        self.failures += 1
+        if self.state == "half_open" or self.failures >= self.failure_threshold:
+            if self.state != "open":
+                self._stats["opened"] += 1
+                logger.warning(f"Circuit breaker '{self.name}' opened after {self.failures} failures")
+            self.state = "open"
+            self.opened_at = time.monotonic()
+            self._trial_in_flight = False
+
+    def status(self) -> Dict[str, Any]:
+        """
+        Get breaker state
+
+        Returns:
+            Dictionary with state, consecutive failures, seconds until a trial call
+            (when open) and success/failure/rejected/opened counters
+        """
+        retry_in = 0.0
+        if self.state == "open":
+            retry_in = max(self.recovery_timeout - (time.monotonic() - self.opened_at), 0.0)
+        return {
+            "state": self.state,
+            "consecutive_failures": self.failures,
+            "retry_in_seconds": round(retry_in, 1),
+            **self._stats
+        }
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+
+
+def get_breaker(name: str) -> CircuitBreaker:
+    """Get the process-wide breaker for an upstream (created on first use)"""
+    if name not in _breakers:
+        _breakers[name] = CircuitBreaker(name)
+    return _breakers[name]
+
+
+def breaker_states() -> Dict[str, Dict[str, Any]]:
+    """State of every breaker, keyed by upstream name"""
+    return {name: breaker.status() for name, breaker in _breakers.items()}
+
+
+def backoff_delay(attempt: int) -> float:
+    """Jittered delay before retry number `attempt + 1`"""
+    return random.uniform(0, min(RETRY_MAX_DELAY_SECONDS, RETRY_BASE_DELAY_SECONDS * 2 ** attempt))
+
+
+async def resilient_call(
+    call: Callable[[], Awaitable[Any]],
+    breaker: CircuitBreaker,
+    timeout: Optional[float],
+    retries: int = 0,
+    retry_on: Tuple[Type[BaseException], ...] = (Exception,)
+) -> Any:
+    """
+    Run an outbound call with a deadline, jittered retries and a circuit breaker
+
+    Args:
+        call: Zero-argument coroutine function making the call (invoked once per attempt)
+        breaker: Breaker for the upstream
+        timeout: Deadline per attempt in seconds (None for no deadline)
+        retries: Extra attempts after a failure (use 0 for non-idempotent calls)
+        retry_on: Exception types counted as upstream failures
+
+    Returns:
+        The call's result
+
+    Raises:
+        CircuitOpenError: If the breaker rejected the call
+        The last failure once retries are exhausted
+    """
+    for attempt in range(retries + 1):
+        if not breaker.allow():
+            raise CircuitOpenError(f"{breaker.name} is unavailable (circuit open)")
+        try:
+            result = await asyncio.wait_for(call(), timeout)
+        except asyncio.CancelledError:
+            breaker.cancel_trial()
+            raise
+        except retry_on as e:
+            breaker.record_failure()
+            if attempt >= retries:
+                raise
+            logger.warning(f"{breaker.name} call failed ({type(e).__name__}: {e}); retrying")
+            await asyncio.sleep(backoff_delay(attempt))
+        except Exception:
+            # The upstream answered (e.g. a 4xx), so it is healthy even though the call failed
+            breaker.record_success()
+            raise
+        else:
+            breaker.record_success()
+            return result
@@ -0,0 +1,73 @@
+"""
+JSON serialization helpers shared by the API and the Gemini services
+Uses orjson when installed and falls back to the standard library
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
+
+def dumps(content: Any) -> bytes:
+    """
+    Serialize to compact UTF-8 JSON bytes
+
+    Non-string dict keys are converted to strings and unknown types are
+    rendered with str(), matching json.dumps(..., default=str).
+
+    Args:
+        content: Value to serialize
+
+    Returns:
+        JSON bytes
+    """
+    if orjson is not None:
+        # Datetimes go through default=str too, so output matches the stdlib path
+        return orjson.dumps(
+            content,
+            default=str,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        )
+    return json.dumps(content, default=str, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def to_jsonable(value: Any) -> Any:
+    """
+    Convert a value into plain JSON types in one pass
+
+    Equivalent to json.loads(json.dumps(value, default=str)) without building
+    and re-parsing a string: tuples and lists become lists, dict keys become
+    strings and anything that isn't a JSON type becomes str(value).
+
+    Args:
+        value: Value to convert
+
+    Returns:
+        The value made of dict, list, str, int, float, bool and None only
+    """
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return value
+    if isinstance(value, dict):
+        return {_key(key): to_jsonable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_jsonable(item) for item in value]
+    return str(value)
+
+
+def _key(key: Any) -> str:
+    # json.dumps renders non-string keys like JSON scalars (True -> "true", None -> "null")
+    if isinstance(key, str):
+        return key
+    if key is True:
+        return "true"
+    if key is False:
+        return "false"
+    if key is None:
+        return "null"
+    if isinstance(key, (int, float)):
+        return json.dumps(key)
+    return str(key)
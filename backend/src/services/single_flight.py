@@ -0,0 +1,73 @@
+"""
+Single-flight request coalescing
+Concurrent callers asking for the same key share one in-flight call instead of each making their own
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class SingleFlight:
+    """
+    Deduplicates concurrent calls by key
+
+    The first caller for a key starts the call as a task; callers arriving while
+    it runs await the same task. The task is shielded, so one caller being
+    cancelled (e.g. a client disconnect) does not cancel it for the others;
+    once every caller has been cancelled, the call itself is cancelled.
+    Results are not kept after the call finishes - caching is the caller's job.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Task] = {}
+        self._waiters: Dict[Hashable, int] = {}
+        self._stats = {"calls": 0, "shared": 0, "cancelled": 0}
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run `call` once for all concurrent callers with the same key
+
+        Args:
+            key: Identity of the call (e.g. an endpoint)
+            call: Zero-argument coroutine function, invoked only by the first caller
+
+        Returns:
+            The shared call's result (exceptions are raised to every caller)
+        """
+        task = self._calls.get(key)
+        if task is None or task.done():
+            # A finished task may still be registered until its done-callback runs
+            self._stats["calls"] += 1
+            task = asyncio.ensure_future(call())
+            self._calls[key] = task
+            self._waiters[key] = 0
+            task.add_done_callback(lambda finished: self._forget(key, finished))
+        else:
+            self._stats["shared"] += 1
+        self._waiters[key] = self._waiters.get(key, 0) + 1
+        try:
+            return await asyncio.shield(task)
+        finally:
+            if self._calls.get(key) is task:
+                self._waiters[key] -= 1
+                if not self._waiters[key] and not task.done():
+                    # Last caller went away (cancelled): nobody needs the result
+                    self._stats["cancelled"] += 1
+                    task.cancel()
+
+    def _forget(self, key: Hashable, task: asyncio.Task):
+        if self._calls.get(key) is task:
+            del self._calls[key]
+            self._waiters.pop(key, None)
+        if not task.cancelled():
+            task.exception()  # mark retrieved even if every caller went away
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get coalescing counters
+
+        Returns:
+            Dictionary with calls (made upstream), shared (callers that joined one),
+            cancelled (calls abandoned by all their callers) and in_flight
+        """
+        return {**self._stats, "in_flight": len(self._calls)}
@@ -1,31 +1,37 @@
 """
 GitHub Tools - Tools for accessing GitHub data via GitHub service
 """
-from typing import Dict, Any, List
-from src.services.github_service import GitHubService
+from typing import Dict, Any, List, Optional
+from src.services.github_service import get_github_service
+from src.services.projection import project
 
-# Initialize GitHub service once at module level
-github_service = GitHubService()
+# Process-wide GitHub service (same instance and caches as the /github routes)
+github_service = get_github_service()
 
 
-async def get_github_profile(username: str = "sriharsha8991") -> Dict[str, Any]:
+async def get_github_profile(
+    username: str = "sriharsha8991",
+    fields: Optional[List[str]] = None
+) -> Dict[str, Any]:
     """
     Get GitHub profile information for Sriharsha Velicheti or any GitHub user.
     
     Args:
         username: GitHub username (default: sriharsha8991)
+        fields: Only return these fields (default: all)
         
     Returns:
         GitHub profile data including bio, followers, repos count, etc.
     """
     profile = await github_service.get_user_profile(username)
-    return profile if profile else {"error": "Profile not found"}
+    return project(profile, fields) if profile else {"error": "Profile not found"}
 
 
 async def get_github_repositories(
     username: str = "sriharsha8991",
     sort: str = "updated",
-    limit: int = 10
+    limit: int = 10,
+    fields: Optional[List[str]] = None
 ) -> List[Dict[str, Any]]:
     """
     Get GitHub repositories for Sriharsha Velicheti or any GitHub user.
@@ -34,33 +40,44 @@ async def get_github_repositories(
         username: GitHub username (default: sriharsha8991)
         sort: Sort by 'created', 'updated', 'pushed', or 'full_name'
         limit: Number of repositories to return (max 100)
+        fields: Only return these fields of each repository (default: all)
         
     Returns:
         List of repository data
     """
-    repos = await github_service.get_repositories(username, sort, min(limit, 100))
-    return repos[:limit] if repos else []
+    if sort == "updated" and github_service.has_repositories(username):
+        # Slice the full list warmup, stats and the dashboard keep cached
+        repos = await github_service.get_repositories(username, sort)
+    else:
+        # Cold: one page is enough, don't page through every repository for `limit` of them
+        repos = await github_service.get_repositories(username, sort, min(limit, 100), max_pages=1)
+    return project(repos[:limit], fields) if repos else []
 
 
-async def get_github_stats(username: str = "sriharsha8991") -> Dict[str, Any]:
+async def get_github_stats(
+    username: str = "sriharsha8991",
+    fields: Optional[List[str]] = None
+) -> Dict[str, Any]:
     """
     Get comprehensive GitHub statistics for Sriharsha Velicheti including
     total repos, stars, forks, top languages, and top repositories.
     
     Args:
         username: GitHub username (default: sriharsha8991)
+        fields: Only return these sections or dotted paths, e.g. ['statistics', 'languages.top_languages'] (default: all)
         
     Returns:
         Comprehensive GitHub statistics
     """
     stats = await github_service.get_user_stats(username)
-    return stats if stats else {"error": "Stats not available"}
+    return project(stats, fields) if stats else {"error": "Stats not available"}
 
 
 async def search_github_repositories(
     query: str,
     sort: str = "stars",
-    limit: int = 10
+    limit: int = 10,
+    fields: Optional[List[str]] = None
 ) -> List[Dict[str, Any]]:
     """
     Search GitHub repositories with a query. Useful for finding specific projects
@@ -70,12 +87,22 @@ async def search_github_repositories(
         query: Search query (e.g., "user:sriharsha8991 language:python")
         sort: Sort by 'stars', 'forks', 'help-wanted-issues', or 'updated'
         limit: Number of results to return (max 100)
+        fields: Only return these fields of each repository (default: all)
         
     Returns:
         List of matching repositories
     """
     repos = await github_service.search_repositories(query, sort, "desc", min(limit, 100))
-    return repos[:limit] if repos else []
+    return project(repos[:limit], fields) if repos else []
+
+
+def _fields_parameter(example: str) -> Dict[str, Any]:
+    """Declaration for the optional `fields` projection argument"""
+    return {
+        "type": "array",
+        "items": {"type": "string"},
+        "description": f"Only return these fields to keep the result small, e.g. {example}. Omit to get all fields."
+    }
 
 
 # Tool declarations for Gemini
@@ -89,7 +116,8 @@ GITHUB_TOOL_DECLARATIONS = [
                 "username": {
                     "type": "string",
                     "description": "GitHub username (default: sriharsha8991 for Sriharsha Velicheti)"
-                }
+                },
+                "fields": _fields_parameter("['bio', 'followers', 'public_repos']")
             },
             "required": []
         }
@@ -114,7 +142,8 @@ GITHUB_TOOL_DECLARATIONS = [
                     "description": "Number of repositories to return (1-100)",
                     "minimum": 1,
                     "maximum": 100
-                }
+                },
+                "fields": _fields_parameter("['name', 'description', 'language', 'stargazers_count']")
             },
             "required": []
         }
@@ -128,7 +157,8 @@ GITHUB_TOOL_DECLARATIONS = [
                 "username": {
                     "type": "string",
                     "description": "GitHub username (default: sriharsha8991)"
-                }
+                },
+                "fields": _fields_parameter("['statistics', 'languages.top_languages', 'top_repositories']")
             },
             "required": []
         }
@@ -153,7 +183,8 @@ GITHUB_TOOL_DECLARATIONS = [
                     "description": "Number of results (1-100)",
                     "minimum": 1,
                     "maximum": 100
-                }
+                },
+                "fields": _fields_parameter("['name', 'description', 'html_url']")
             },
             "required": ["query"]
         }
@@ -3,7 +3,7 @@ Navigation Tools for Portfolio Section Navigation
 Provides Gemini AI with tools to navigate users to specific portfolio sections
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, List
 import json
 
 
@@ -31,6 +31,88 @@ def load_sections():
 SECTIONS = load_sections()
 SECTION_IDS = [section['id'] for section in SECTIONS]
 
+# Canned navigation copy per section (names come from sections.json)
+SECTION_COPY = {
+    "home": {
+        "reason": "User wants to view the home/hero section",
+        "audio_text": "hi there Let's head to the home page and see what Sriharsha is all about!"
+    },
+    "about": {
+        "reason": "User wants to learn about professional background",
+        "audio_text": "Great! Let me show you more about Sriharsha's background and expertise."
+    },
+    "experience": {
+        "reason": "User wants to view work experience",
+        "audio_text": "Taking you to Sriharsha's professional journey and work experience!"
+    },
+    "projects": {
+        "reason": "User wants to see portfolio projects",
+        "audio_text": "Here are some amazing projects that Sriharsha has built. Check them out!"
+    },
+    "skills": {
+        "reason": "User wants to view technical skills",
+        "audio_text": "Let's explore the technical skills and expertise Sriharsha brings to the table."
+    },
+    "github": {
+        "reason": "User wants to see GitHub activity",
+        "audio_text": "Let me show you Sriharsha's GitHub activity and open source contributions!"
+    },
+    "education": {
+        "reason": "User wants to view educational background",
+        "audio_text": "Here's where Sriharsha learned all this amazing stuff - his educational background and accomplishments."
+    },
+    "contact": {
+        "reason": "User wants to contact or get in touch",
+        "audio_text": "Want to get in touch? Here's how you can reach out to Sriharsha!"
+    },
+}
+
+
+def build_section_table(sections: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Precompute the navigation result for every section
+    
+    Args:
+        sections: Section dicts from sections.json (id, name)
+    
+    Returns:
+        Mapping of section id to its navigation result (with the default reason)
+    """
+    table = {}
+    for section in sections:
+        name = section.get('name', section['id'].title())
+        copy = SECTION_COPY.get(section['id'], {})
+        table[section['id']] = {
+            "action": "navigate",
+            "section_id": section['id'],
+            "section_name": name,
+            "reason": copy.get("reason", f"User wants to view the {name} section"),
+            "success": True,
+            "message": f"Navigating to {name} section",
+            "audio_text": copy.get("audio_text", f"Taking you to the {name} section!")
+        }
+    return table
+
+
+SECTION_TABLE = build_section_table(SECTIONS)
+
+
+def navigation_result(section_id: str, reason: str = "") -> Dict[str, Any]:
+    """
+    Get the navigation result for a section
+    
+    Args:
+        section_id: Section to navigate to
+        reason: Optional explanation (replaces the default reason)
+    
+    Returns:
+        Navigation action with section details
+    """
+    result = dict(SECTION_TABLE[section_id])
+    if reason:
+        result["reason"] = reason
+    return result
+
 
 async def navigate_to_home(reason: str = "") -> Dict[str, Any]:
     """
@@ -42,15 +124,7 @@ async def navigate_to_home(reason: str = "") -> Dict[str, Any]:
     Returns:
         Navigation action with section details
     """
-    return {
-        "action": "navigate",
-        "section_id": "home",
-        "section_name": "Home",
-        "reason": reason or "User wants to view the home/hero section",
-        "success": True,
-        "message": "Navigating to Home section",
-        "audio_text": "hi there Let's head to the home page and see what Sriharsha is all about!"
-    }
+    return navigation_result("home", reason)
 
 
 async def navigate_to_about(reason: str = "") -> Dict[str, Any]:
@@ -63,15 +137,7 @@ async def navigate_to_about(reason: str = "") -> Dict[str, Any]:
     Returns:
         Navigation action with section details
     """
-    return {
-        "action": "navigate",
-        "section_id": "about",
-        "section_name": "About",
-        "reason": reason or "User wants to learn about professional background",
-        "success": True,
-        "message": "Navigating to About section",
-        "audio_text": "Great! Let me show you more about Sriharsha's background and expertise."
-    }
+    return navigation_result("about", reason)
 
 
 async def navigate_to_experience(reason: str = "") -> Dict[str, Any]:
@@ -84,15 +150,7 @@ async def navigate_to_experience(reason: str = "") -> Dict[str, Any]:
     Returns:
         Navigation action with section details
     """
-    return {
-        "action": "navigate",
-        "section_id": "experience",
-        "section_name": "Experience",
-        "reason": reason or "User wants to view work experience",
-        "success": True,
-        "message": "Navigating to Experience section",
-        "audio_text": "Taking you to Sriharsha's professional journey and work experience!"
-    }
+    return navigation_result("experience", reason)
 
 
 async def navigate_to_projects(reason: str = "") -> Dict[str, Any]:
@@ -105,15 +163,7 @@ async def navigate_to_projects(reason: str = "") -> Dict[str, Any]:
     Returns:
         Navigation action with section details
     """
-    return {
-        "action": "navigate",
-        "section_id": "projects",
-        "section_name": "Projects",
-        "reason": reason or "User wants to see portfolio projects",
-        "success": True,
-        "message": "Navigating to Projects section",
-        "audio_text": "Here are some amazing projects that Sriharsha has built. Check them out!"
-    }
+    return navigation_result("projects", reason)
 
 
 async def navigate_to_skills(reason: str = "") -> Dict[str, Any]:
@@ -126,15 +176,7 @@ async def navigate_to_skills(reason: str = "") -> Dict[str, Any]:
     Returns:
         Navigation action with section details
     """
-    return {
-        "action": "navigate",
-        "section_id": "skills",
-        "section_name": "Skills",
-        "reason": reason or "User wants to view technical skills",
-        "success": True,
-        "message": "Navigating to Skills section",
-        "audio_text": "Let's explore the technical skills and expertise Sriharsha brings to the table."
-    }
+    return navigation_result("skills", reason)
 
 
 async def navigate_to_github(reason: str = "") -> Dict[str, Any]:
@@ -147,15 +189,7 @@ async def navigate_to_github(reason: str = "") -> Dict[str, Any]:
     Returns:
         Navigation action with section details
     """
-    return {
-        "action": "navigate",
-        "section_id": "github",
-        "section_name": "GitHub",
-        "reason": reason or "User wants to see GitHub activity",
-        "success": True,
-        "message": "Navigating to GitHub section",
-        "audio_text": "Let me show you Sriharsha's GitHub activity and open source contributions!"
-    }
+    return navigation_result("github", reason)
 
 
 async def navigate_to_education(reason: str = "") -> Dict[str, Any]:
@@ -168,15 +202,7 @@ async def navigate_to_education(reason: str = "") -> Dict[str, Any]:
     Returns:
         Navigation action with section details
     """
-    return {
-        "action": "navigate",
-        "section_id": "education",
-        "section_name": "Education",
-        "reason": reason or "User wants to view educational background",
-        "success": True,
-        "message": "Navigating to Education section",
-        "audio_text": "Here's where Sriharsha learned all this amazing stuff - his educational background and accomplishments."
-    }
+    return navigation_result("education", reason)
 
 
 async def navigate_to_contact(reason: str = "") -> Dict[str, Any]:
@@ -189,15 +215,7 @@ async def navigate_to_contact(reason: str = "") -> Dict[str, Any]:
     Returns:
         Navigation action with section details
     """
-    return {
-        "action": "navigate",
-        "section_id": "contact",
-        "section_name": "Contact",
-        "reason": reason or "User wants to contact or get in touch",
-        "success": True,
-        "message": "Navigating to Contact section",
-        "audio_text": "Want to get in touch? Here's how you can reach out to Sriharsha!"
-    }
+    return navigation_result("contact", reason)
 
 
 # Tool declarations for Gemini function calling
@@ -315,3 +333,36 @@ NAVIGATION_TOOL_DECLARATIONS = [
         }
     }
 ]
+
+
+def navigation_tool_declaration(sections: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Single navigation tool for fused mode (AnswerService picks the section itself)
+    
+    One enum parameter replaces the eight navigate_to_* declarations.
+    
+    Args:
+        sections: Section dicts from sections.json (id, name, description)
+    
+    Returns:
+        Function declaration for navigate_to_section
+    """
+    return {
+        "name": "navigate_to_section",
+        "description": (
+            "Scroll the portfolio to the section that best matches the visitor's message. "
+            "Use home for greetings, small talk or unclear intent. Sections: "
+            + "; ".join(f"{section['id']} ({section.get('name', section['id'])})" for section in sections)
+        ),
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "section_id": {
+                    "type": "string",
+                    "enum": [section['id'] for section in sections],
+                    "description": "Section to show"
+                }
+            },
+            "required": ["section_id"]
+        }
+    }
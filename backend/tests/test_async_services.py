@@ -0,0 +1,610 @@
+"""
+Test that the Gemini-backed services never block the event loop
+Uses a fake Gemini client with a fixed latency, so no API key is needed
+"""
+
+import asyncio
+import json
+import sys
+import os
+import shutil
+import tempfile
+import time
+from datetime import datetime
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+os.environ["GITHUB_DISK_CACHE_PATH"] = ""  # tests opt in to the disk tier explicitly
+os.environ.setdefault("GOOGLE_API_KEY", "test-key")
+
+from google.genai import errors, types
+from src.api import chat as chat_api
+from src.services import AnswerService, NavigationService
+from src.services.answer_service import DEGRADED_ANSWER
+from src.services.navigation_classifier import NavigationClassifier
+from src.services.navigation_shadow import NavigationShadow, load_records, summarize
+from src.services.resilience import CircuitBreaker
+from src.services.serialization import to_jsonable
+
+GEMINI_LATENCY = 0.3
+SECTIONS_PATH = os.path.join(os.path.dirname(__file__), "..", "..", "sections.json")
+CONCURRENT_REQUESTS = 5
+
+
+class FakeAsyncModels:
+    """Stands in for client.aio.models with a fixed, non-blocking latency"""
+
+    def __init__(self, part: types.Part):
+        self.part = part
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def generate_content(self, model, contents, config):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(GEMINI_LATENCY)
+            return types.GenerateContentResponse(
+                candidates=[types.Candidate(content=types.Content(role="model", parts=[self.part]))]
+            )
+        finally:
+            self.in_flight -= 1
+
+
+def fake_client(part: types.Part) -> SimpleNamespace:
+    return SimpleNamespace(aio=SimpleNamespace(models=FakeAsyncModels(part)))
+
+
+async def test_navigation_requests_overlap():
+    """Concurrent navigation decisions should take ~1 Gemini latency, not N"""
+    service = NavigationService()
+    service.fast_path = False  # measure the Gemini path
+    service.client = fake_client(
+        types.Part(function_call=types.FunctionCall(name="navigate_to_projects", args={}))
+    )
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*[
+        service.get_navigation_decision(f"Show me your projects {i}")
+        for i in range(CONCURRENT_REQUESTS)
+    ])
+    elapsed = time.perf_counter() - start
+
+    assert all(actions and actions[0]["section_id"] == "projects" for actions in results)
+    assert service.client.aio.models.max_in_flight == CONCURRENT_REQUESTS
+    assert elapsed < GEMINI_LATENCY * 2, f"Requests did not overlap ({elapsed:.2f}s)"
+    print(f"✅ {CONCURRENT_REQUESTS} navigation requests overlapped in {elapsed:.2f}s")
+
+
+async def test_navigation_fast_path():
+    """Obvious intents are answered locally without a Gemini call; ambiguous ones still use it"""
+    service = NavigationService()
+    service.client = fake_client(
+        types.Part(function_call=types.FunctionCall(name="navigate_to_about", args={}))
+    )
+
+    expected = {
+        "Hello": "home",
+        "Thanks!": "home",
+        "Show me your projects": "projects",
+        "What programming languages do you know?": "skills",
+        "Tell me about your work experience": "experience",
+        "I want to hire you": "contact",
+        "What did you study?": "education",
+        "Show me his GitHub repositories": "github",
+    }
+    start = time.perf_counter()
+    for message, section_id in expected.items():
+        actions = await service.get_navigation_decision(message)
+        assert actions[0]["section_id"] == section_id, f"{message!r} -> {actions}"
+        assert actions[0]["path"] == "local" and actions[0]["confidence"] >= service.fast_path_min_confidence
+    elapsed = time.perf_counter() - start
+    assert service.client.aio.models.max_in_flight == 0, "Obvious intents should not call Gemini"
+    assert elapsed < GEMINI_LATENCY, f"Local decisions took {elapsed:.2f}s"
+
+    actions = await service.get_navigation_decision("What makes his approach to agents different?")
+    assert actions[0]["path"] == "llm" and actions[0]["section_id"] == "about"
+    assert service.client.aio.models.max_in_flight == 1
+
+    stats = service.get_stats()
+    assert stats["local"] == len(expected) and stats["llm"] == 1
+
+    # Portfolio names are read from sections.json, so editing it retrains the classifier
+    with open(SECTIONS_PATH, encoding="utf-8") as f:
+        sections = json.load(f)["sections"]
+    prediction = NavigationClassifier(sections).classify("Did he work at Datasmith?")
+    assert prediction["section_id"] == "experience" and prediction["method"] == "keywords"
+    for section in sections:
+        if section["id"] == "experience":
+            section["keywords"] = ["Acme Labs"]
+    renamed = NavigationClassifier(sections)
+    prediction = renamed.classify("Did he work at Acme Labs?")
+    assert prediction["section_id"] == "experience" and prediction["method"] == "keywords"
+    assert renamed.classify("Datasmith")["method"] != "keywords", "Removed keywords should not match"
+    print(f"✅ Navigation fast path: {len(expected)} local decisions in {elapsed * 1000:.2f}ms, {stats}")
+
+
+async def test_navigation_shadow():
+    """Shadow decisions run off the critical path and are logged for the report"""
+    service = NavigationService()
+    service.client = fake_client(
+        types.Part(function_call=types.FunctionCall(name="navigate_to_projects", args={}))
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        log_path = os.path.join(tmp, "shadow.jsonl")
+        service.shadow = NavigationShadow(log_path, llm_sample_rate=1.0)
+
+        start = time.perf_counter()
+        local = await service.get_navigation_decision("Show me your projects")
+        greeting = await service.get_navigation_decision("Hello")
+        elapsed = time.perf_counter() - start
+        assert local[0]["path"] == greeting[0]["path"] == "local"
+        assert elapsed < GEMINI_LATENCY, f"Shadow Gemini calls blocked the response ({elapsed:.2f}s)"
+
+        served = await service.get_navigation_decision("What makes his approach to agents different?")
+        assert served[0]["path"] == "llm"
+        await service.shadow.drain()
+
+        summary = summarize(load_records(log_path))
+        assert summary["records"] == 3 and service.client.aio.models.max_in_flight == 3
+        assert summary["served"] == {"local": 2, "llm": 1}
+        assert set(summary["latency_ms"]) == {"local", "llm"}
+        assert summary["latency_ms"]["llm"]["p50"] >= GEMINI_LATENCY * 1000
+        assert any(sample["message"] == "Hello" for sample in summary["disagreements"])
+        assert service.get_stats()["shadow"]["recorded"] == 3
+    print(f"✅ Navigation shadow: agreement {summary['agreement_rate']}, {summary['top_confusions']}")
+
+
+async def test_navigation_enum_mode():
+    """Enum mode gets a bare section id from Gemini and builds the action from the section table"""
+    service = NavigationService()
+    service.llm_mode = "enum"
+    service.client = fake_client(types.Part(text="education"))
+    configs = []
+    generate_content = service.client.aio.models.generate_content
+
+    async def recording_generate_content(model, contents, config):
+        configs.append(config)
+        return await generate_content(model, contents, config)
+
+    service.client.aio.models.generate_content = recording_generate_content
+
+    actions = await service.get_navigation_decision("What makes his approach to agents different?")
+    assert actions[0]["path"] == "llm" and actions[0]["section_id"] == "education"
+    assert actions[0]["audio_text"] == service.section_table["education"]["audio_text"]
+    config = configs[0]
+    assert config.tools is None and config.response_mime_type == "text/x.enum"
+    assert config.response_schema.enum == list(service.section_table)
+    assert len(service.enum_prompt) < len(service.system_prompt) / 2
+
+    service.client = fake_client(types.Part(text="pricing"))
+    service.decision_cache.clear()
+    assert await service.get_navigation_decision("What makes his approach to agents different?") == []
+    print(f"✅ Navigation enum mode: prompt {len(service.enum_prompt)} vs {len(service.system_prompt)} chars")
+
+
+async def test_navigation_decision_cache():
+    """Equivalent phrasings share one decision; editing sections.json invalidates it"""
+    service = NavigationService()
+    service.fast_path = False  # every miss goes to Gemini
+    service.client = fake_client(
+        types.Part(function_call=types.FunctionCall(name="navigate_to_projects", args={}))
+    )
+
+    first = await service.get_navigation_decision("Show me your projects!")
+    variants = await asyncio.gather(*[
+        service.get_navigation_decision(message)
+        for message in ["show me your PROJECTS", "  Show me, your projects?", "show me your projects"]
+    ])
+    assert first[0]["path"] == "llm"
+    assert all(actions[0]["path"] == "cache" and actions[0]["section_id"] == "projects" for actions in variants)
+    assert service.client.aio.models.max_in_flight == 1
+    variants[0][0]["section_id"] = "changed by caller"
+    assert (await service.get_navigation_decision("show me your projects"))[0]["section_id"] == "projects"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        service.sections_file = os.path.join(tmp, "sections.json")
+        shutil.copy(SECTIONS_PATH, service.sections_file)
+        service._load_sections()
+        assert service.decision_cache.stats()["entries"] == 0
+        await service.get_navigation_decision("Show me your projects")
+        with open(SECTIONS_PATH, encoding="utf-8") as f:
+            sections = json.load(f)
+        for section in sections["sections"]:
+            if section["id"] == "projects":
+                section["name"] = "Case Studies"
+        with open(service.sections_file, "w", encoding="utf-8") as f:
+            json.dump(sections, f)
+        mtime = os.stat(service.sections_file).st_mtime
+        os.utime(service.sections_file, (mtime + 10, mtime + 10))
+        service._sections_checked_at = 0
+        actions = await service.get_navigation_decision("Show me your projects")
+        assert actions[0]["path"] == "llm", "sections.json change should invalidate cached decisions"
+        assert actions[0]["section_name"] == "Case Studies", "Tools mode should use the reloaded sections"
+        assert service._execute_navigation("navigate_to_blog", {}) == [], "Unknown sections give no action"
+
+    stats = service.get_stats()["cache"]
+    assert stats["hits"] == 4 and stats["sections_reloads"] == 1
+    print(f"✅ Navigation decision cache: {stats}")
+
+
+async def test_navigation_cancellation():
+    """A cancelled caller cancels the Gemini call; joined callers keep their decider's path"""
+    service = NavigationService()
+    service.fast_path = False
+    service.client = fake_client(
+        types.Part(function_call=types.FunctionCall(name="navigate_to_projects", args={}))
+    )
+    calls = {"started": 0, "cancelled": 0}
+    generate_content = service.client.aio.models.generate_content
+
+    async def tracked_generate_content(model, contents, config):
+        calls["started"] += 1
+        try:
+            return await generate_content(model, contents, config)
+        except asyncio.CancelledError:
+            calls["cancelled"] += 1
+            raise
+
+    service.client.aio.models.generate_content = tracked_generate_content
+
+    try:
+        await asyncio.wait_for(service.get_navigation_decision("What is his story?"), timeout=GEMINI_LATENCY / 3)
+        raise AssertionError("Navigation should have timed out")
+    except asyncio.TimeoutError:
+        pass
+    await asyncio.sleep(0)
+    assert calls == {"started": 1, "cancelled": 1}, f"Gemini call kept running after the caller left: {calls}"
+
+    # Two waiters: cancelling one keeps the call alive for the other
+    first = asyncio.create_task(service.get_navigation_decision("What is his story?"))
+    second = asyncio.create_task(service.get_navigation_decision("what is his story"))
+    await asyncio.sleep(GEMINI_LATENCY / 3)
+    first.cancel()
+    actions = await second
+    assert calls == {"started": 2, "cancelled": 1}
+    assert actions[0]["path"] == "llm", "Joining an in-flight decision is not a cache hit"
+
+    cached = await service.get_navigation_decision("What is his story?")
+    stats = service.get_stats()["cache"]
+    assert cached[0]["path"] == "cache" and stats["hits"] == 1
+    print(f"✅ Navigation cancellation: {calls}, cache {stats['hits']} hit / {stats['misses']} misses")
+
+
+async def test_answer_requests_overlap():
+    """Concurrent answers should overlap, and the loop should stay responsive meanwhile"""
+    service = AnswerService()
+    service.client = fake_client(types.Part(text="Sriharsha is a Gen AI Engineer."))
+
+    ticks = 0
+
+    async def heartbeat():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    heartbeat_task = asyncio.create_task(heartbeat())
+    start = time.perf_counter()
+    results = await asyncio.gather(*[
+        service.get_response("Who is Sriharsha?", [])
+        for _ in range(CONCURRENT_REQUESTS)
+    ])
+    elapsed = time.perf_counter() - start
+    heartbeat_task.cancel()
+
+    assert all(text == "Sriharsha is a Gen AI Engineer." for text, _ in results)
+    assert elapsed < GEMINI_LATENCY * 2, f"Requests did not overlap ({elapsed:.2f}s)"
+    assert ticks > 10, "Event loop was blocked while waiting on Gemini"
+    print(f"✅ {CONCURRENT_REQUESTS} answers overlapped in {elapsed:.2f}s ({ticks} heartbeat ticks)")
+
+
+async def test_parallel_tool_calls():
+    """All function calls from one model turn should run together and return in one turn"""
+    service = AnswerService()
+    requests_seen = []
+
+    async def generate_content(model, contents, config):
+        requests_seen.append(list(contents))
+        if len(requests_seen) == 1:
+            parts = [
+                types.Part(function_call=types.FunctionCall(name="get_github_stats", args={})),
+                types.Part(function_call=types.FunctionCall(name="get_sriharsha_profile", args={})),
+            ]
+        else:
+            parts = [types.Part(text="Here is the summary.")]
+        return types.GenerateContentResponse(
+            candidates=[types.Candidate(content=types.Content(role="model", parts=parts))]
+        )
+
+    async def slow_tool(**kwargs):
+        await asyncio.sleep(GEMINI_LATENCY)
+        return {"ok": True}
+
+    service.client = SimpleNamespace(aio=SimpleNamespace(models=SimpleNamespace(generate_content=generate_content)))
+    service.tool_functions = {"get_github_stats": slow_tool, "get_sriharsha_profile": slow_tool}
+
+    start = time.perf_counter()
+    text, tools_used = await service.get_response("Summarise GitHub and profile", [])
+    elapsed = time.perf_counter() - start
+
+    function_responses = requests_seen[-1][-1].parts
+    assert text == "Here is the summary."
+    assert tools_used == ["get_github_stats", "get_sriharsha_profile"]
+    assert len(requests_seen) == 2, "Multi-call turn should need a single follow-up request"
+    assert [part.function_response.name for part in function_responses] == tools_used
+    assert elapsed < GEMINI_LATENCY * 2, f"Tools did not run concurrently ({elapsed:.2f}s)"
+    print(f"✅ 2 tool calls answered in one follow-up turn in {elapsed:.2f}s")
+
+
+def scripted_client(turns: list, requests_seen: list) -> SimpleNamespace:
+    """Client whose Nth request (streamed or not) answers with turns[N] (one list of parts per chunk)"""
+
+    def next_turn(contents, config):
+        requests_seen.append((list(contents), config))
+        return turns[min(len(requests_seen), len(turns)) - 1]
+
+    def response(parts):
+        return types.GenerateContentResponse(
+            candidates=[types.Candidate(content=types.Content(role="model", parts=parts))]
+        )
+
+    async def generate_content(model, contents, config):
+        return response([part for chunk in next_turn(contents, config) for part in chunk])
+
+    async def generate_content_stream(model, contents, config):
+        chunks = next_turn(contents, config)
+
+        async def stream():
+            for chunk in chunks:
+                yield response(chunk)
+
+        return stream()
+
+    return SimpleNamespace(aio=SimpleNamespace(models=SimpleNamespace(
+        generate_content=generate_content,
+        generate_content_stream=generate_content_stream
+    )))
+
+
+async def test_fused_mode():
+    """Fused mode gets the answer and the section from the answer call, without NavigationService"""
+    from src.api import chat
+
+    navigate = lambda section_id: types.Part(
+        function_call=types.FunctionCall(name="navigate_to_section", args={"section_id": section_id})
+    )
+    service = AnswerService()
+    requests_seen = []
+    service.client = scripted_client([[[types.Part(text="Here are his projects."), navigate("projects")]]], requests_seen)
+    text, tools_used, actions = await service.get_response_and_navigation("Show me your projects", [])
+    assert text == "Here are his projects." and tools_used == [] and len(requests_seen) == 1
+    assert actions[0]["section_id"] == "projects" and actions[0]["path"] == "fused"
+    declarations = requests_seen[0][1].tools[0].function_declarations
+    assert declarations[-1].name == "navigate_to_section"
+
+    requests_seen.clear()
+    service.client = scripted_client([
+        [[navigate("skills"), types.Part(function_call=types.FunctionCall(name="get_sriharsha_profile", args={}))]],
+        [[types.Part(text="He works mostly in Python.")]],
+    ], requests_seen)
+    text, tools_used, actions = await service.get_response_and_navigation("What languages does he use?", [])
+    function_responses = requests_seen[-1][0][-1].parts
+    assert text == "He works mostly in Python." and tools_used == ["get_sriharsha_profile"]
+    assert actions[0]["section_id"] == "skills" and len(requests_seen) == 2
+    assert [part.function_response.name for part in function_responses] == ["navigate_to_section", "get_sriharsha_profile"]
+
+    # Streamed: text emitted before the section is chosen is held until the actions event
+    requests_seen.clear()
+    service.client = scripted_client([[[types.Part(text="Hi! ")], [navigate("home")], [types.Part(text="Welcome.")]]], requests_seen)
+    original = chat.answer_service, chat.CHAT_EXECUTION_MODE
+    chat.answer_service, chat.CHAT_EXECUTION_MODE = service, "fused"
+    try:
+        events = [event async for event in chat.chat_events("Hi", [])]
+    finally:
+        chat.answer_service, chat.CHAT_EXECUTION_MODE = original
+    assert [event["event"] for event in events] == ["actions", "answer", "answer", "done"]
+    assert events[0]["data"][0]["section_id"] == "home" and len(requests_seen) == 1
+
+    # Editing sections.json updates the fused tool's section enum and the section table
+    with tempfile.TemporaryDirectory() as tmp:
+        service.sections_file = os.path.join(tmp, "sections.json")
+        with open(SECTIONS_PATH, encoding="utf-8") as f:
+            sections = json.load(f)
+        sections["sections"].append({"id": "blog", "name": "Blog", "description": "Articles and talks"})
+        with open(service.sections_file, "w", encoding="utf-8") as f:
+            json.dump(sections, f)
+        service._sections_checked_at = 0
+
+        requests_seen.clear()
+        service.client = scripted_client([[[types.Part(text="Here are his articles."), navigate("blog")]]], requests_seen)
+        _, _, actions = await service.get_response_and_navigation("Does he write articles?", [])
+        declaration = requests_seen[0][1].tools[0].function_declarations[-1]
+        assert "blog" in declaration.parameters.properties["section_id"].enum
+        assert actions and actions[0]["section_id"] == "blog" and actions[0]["section_name"] == "Blog"
+    print(f"✅ Fused mode: answer + navigation from one Gemini request ({[e['event'] for e in events]})")
+
+
+async def test_chat_event_order():
+    """Streamed chat: actions first, then tool events as they happen, then the answer; timeouts end with an error"""
+    async def navigation(user_message):
+        await asyncio.sleep(GEMINI_LATENCY / 2)
+        return [{"type": "navigate", "section_id": "github"}]
+
+    def tool(delay):
+        async def run(**kwargs):
+            await asyncio.sleep(delay)
+            return {"ok": True}
+        return run
+
+    service = AnswerService()
+    service.tool_functions = {"get_github_stats": tool(GEMINI_LATENCY / 3), "get_sriharsha_profile": tool(0)}
+    service.client = scripted_client([
+        [[types.Part(function_call=types.FunctionCall(name="get_github_stats", args={})),
+          types.Part(function_call=types.FunctionCall(name="get_sriharsha_profile", args={}))]],
+        [[types.Part(text="He has ")], [types.Part(text="many repositories.")]],
+    ], [])
+
+    saved = (chat_api.navigation_service, chat_api.answer_service,
+             chat_api.CHAT_EXECUTION_MODE, chat_api.ANSWER_TIMEOUT_SECONDS)
+    chat_api.navigation_service = SimpleNamespace(get_navigation_decision=navigation)
+    chat_api.answer_service = service
+    chat_api.CHAT_EXECUTION_MODE = "concurrent"
+    try:
+        events = [event async for event in chat_api.chat_events("Show me his GitHub", [])]
+        sequence = [
+            (event["event"], event["data"].get("name") if isinstance(event["data"], dict) else None)
+            for event in events
+        ]
+        assert sequence == [
+            ("actions", None),
+            ("tool_started", "get_github_stats"),
+            ("tool_started", "get_sriharsha_profile"),
+            ("tool_finished", "get_sriharsha_profile"),
+            ("tool_finished", "get_github_stats"),
+            ("answer", None),
+            ("answer", None),
+            ("done", None),
+        ], f"Unexpected event order: {sequence}"
+        assert events[0]["data"][0]["section_id"] == "github"
+        assert "".join(event["data"]["text"] for event in events if event["event"] == "answer") == "He has many repositories."
+        assert events[-1]["data"]["tools_used"] == ["get_github_stats", "get_sriharsha_profile"]
+
+        # SSE frames use the same encoder as the JSON responses (datetimes, non-ASCII text)
+        data = {"text": "Namasté", "timestamp": datetime(2024, 1, 2, 3, 4, 5)}
+        frame = chat_api._format_sse({"event": "done", "data": data})
+        assert frame.startswith(b"event: done\ndata: ") and frame.endswith(b"\n\n")
+        assert json.loads(frame[len(b"event: done\ndata: "):-2]) == to_jsonable(data)
+
+        # A tool that outlives ANSWER_TIMEOUT_SECONDS ends the stream with the timeout error
+        chat_api.ANSWER_TIMEOUT_SECONDS = GEMINI_LATENCY
+        service.tool_functions = {"get_github_stats": tool(60), "get_sriharsha_profile": tool(0)}
+        service.client = scripted_client([
+            [[types.Part(function_call=types.FunctionCall(name="get_github_stats", args={}))]],
+        ], [])
+        start = time.perf_counter()
+        events = [event async for event in chat_api.chat_events("Show me his GitHub", [])]
+        elapsed = time.perf_counter() - start
+        assert [event["event"] for event in events] == ["actions", "tool_started", "error"]
+        assert events[-1]["data"]["detail"] == chat_api.ANSWER_TIMEOUT_MESSAGE
+        assert elapsed < GEMINI_LATENCY * 2, f"Answer deadline not enforced ({elapsed:.2f}s)"
+    finally:
+        (chat_api.navigation_service, chat_api.answer_service,
+         chat_api.CHAT_EXECUTION_MODE, chat_api.ANSWER_TIMEOUT_SECONDS) = saved
+    print("✅ Chat events: actions -> tool_started/finished -> answer -> done; timeout -> error")
+
+
+class FlakyAsyncModels(FakeAsyncModels):
+    """Fails the first `failures` calls with a 503, or hangs them if `hang` is set"""
+
+    def __init__(self, part: types.Part, failures: int, hang: bool = False):
+        super().__init__(part)
+        self.failures = failures
+        self.hang = hang
+        self.calls = 0
+
+    async def generate_content(self, model, contents, config):
+        self.calls += 1
+        if self.calls <= self.failures:
+            if self.hang:
+                await asyncio.sleep(60)
+            raise errors.ServerError(503, {"error": {"message": "overloaded", "status": "UNAVAILABLE"}})
+        return await super().generate_content(model, contents, config)
+
+
+async def test_chat_stage_deadlines():
+    """A slow or failing stage falls back on its own; the other stage's result is kept"""
+    async def slow_navigation(user_message):
+        await asyncio.sleep(GEMINI_LATENCY * 10)
+        return [{"type": "navigate", "section_id": "projects"}]
+
+    async def broken_navigation(user_message):
+        raise RuntimeError("navigation down")
+
+    async def answer(user_message, conversation_history):
+        await asyncio.sleep(GEMINI_LATENCY)
+        return "Sriharsha is a Gen AI Engineer.", ["get_sriharsha_profile"]
+
+    async def broken_answer(user_message, conversation_history):
+        raise RuntimeError("answer down")
+
+    saved = (chat_api.navigation_service, chat_api.answer_service,
+             chat_api.CHAT_EXECUTION_MODE, chat_api.NAVIGATION_TIMEOUT_SECONDS)
+    chat_api.NAVIGATION_TIMEOUT_SECONDS = GEMINI_LATENCY / 2
+    request = chat_api.ChatRequest(message="Show me your projects")
+    try:
+        for mode in ("concurrent", "sequential"):
+            chat_api.CHAT_EXECUTION_MODE = mode
+            chat_api.navigation_service = SimpleNamespace(get_navigation_decision=slow_navigation)
+            chat_api.answer_service = SimpleNamespace(get_response=answer)
+            start = time.perf_counter()
+            response = await chat_api.chat(request)
+            elapsed = time.perf_counter() - start
+            assert response.actions is None, "Timed-out navigation should fall back to no actions"
+            assert response.response == "Sriharsha is a Gen AI Engineer."
+            assert response.tools_used == ["get_sriharsha_profile"], "Answer should survive the navigation timeout"
+            assert elapsed < GEMINI_LATENCY * 3, f"{mode}: navigation deadline not enforced ({elapsed:.2f}s)"
+
+        chat_api.CHAT_EXECUTION_MODE = "concurrent"
+        chat_api.navigation_service = SimpleNamespace(get_navigation_decision=broken_navigation)
+        response = await chat_api.chat(request)
+        assert response.actions is None and response.response == "Sriharsha is a Gen AI Engineer."
+
+        chat_api.navigation_service = SimpleNamespace(
+            get_navigation_decision=lambda user_message: asyncio.sleep(0, [{"type": "navigate", "section_id": "projects"}])
+        )
+        chat_api.answer_service = SimpleNamespace(get_response=broken_answer)
+        response = await chat_api.chat(request)
+        assert response.response == chat_api.ANSWER_ERROR_MESSAGE and response.tools_used is None
+        assert response.actions[0]["section_id"] == "projects", "Navigation should survive the answer failure"
+    finally:
+        (chat_api.navigation_service, chat_api.answer_service,
+         chat_api.CHAT_EXECUTION_MODE, chat_api.NAVIGATION_TIMEOUT_SECONDS) = saved
+    print("✅ Chat stages: timeouts and failures fall back without losing the other stage")
+
+
+async def test_retries_and_circuit_breaker():
+    """Transient Gemini errors are retried; a hung upstream opens the breaker and degrades fast"""
+    service = AnswerService()
+    service.breaker = CircuitBreaker("gemini-test", failure_threshold=2, recovery_timeout=60)
+    service.client = SimpleNamespace(aio=SimpleNamespace(
+        models=FlakyAsyncModels(types.Part(text="Recovered answer"), failures=1)
+    ))
+    text, _ = await service.get_response("Hi", [])
+    assert text == "Recovered answer" and service.client.aio.models.calls == 2
+    assert service.breaker.state == "closed"
+
+    service.timeout = 0.1
+    service.client.aio.models = FlakyAsyncModels(types.Part(text="never"), failures=100, hang=True)
+    start = time.perf_counter()
+    text, _ = await service.get_response("Hi", [])
+    assert service.breaker.state == "open", "Two timeouts should open the breaker"
+
+    calls_when_opened = service.client.aio.models.calls
+    text, _ = await service.get_response("Hi", [])
+    elapsed = time.perf_counter() - start
+    assert text == DEGRADED_ANSWER and service.client.aio.models.calls == calls_when_opened
+    assert elapsed < 1, f"Hung upstream should be cut off by the timeout ({elapsed:.2f}s)"
+
+    events = [event async for event in service.stream_response("Hi", [])]
+    assert events[0]["data"]["text"] == DEGRADED_ANSWER and events[-1]["data"]["degraded"]
+    print(f"✅ Gemini retry + circuit breaker: {service.breaker.status()}")
+
+
+async def main():
+    await test_navigation_requests_overlap()
+    await test_navigation_fast_path()
+    await test_navigation_shadow()
+    await test_navigation_enum_mode()
+    await test_navigation_decision_cache()
+    await test_navigation_cancellation()
+    await test_answer_requests_overlap()
+    await test_parallel_tool_calls()
+    await test_fused_mode()
+    await test_retries_and_circuit_breaker()
+    await test_chat_stage_deadlines()
+    await test_chat_event_order()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,130 @@
+"""
+Offline test for the GitHub GraphQL batch backend
+Runs GitHubService against a local stub GraphQL server, so no token or network is needed
+"""
+
+import asyncio
+import sys
+import os
+from aiohttp import web
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+os.environ["GITHUB_DISK_CACHE_PATH"] = ""  # tests opt in to the disk tier explicitly
+
+from src.services.github_service import GitHubService
+from src.services.github_graphql import GitHubGraphQLClient
+from src.services.http_session import close_http_session
+
+USERNAME = "octocat"
+REPO_COUNT = 150
+PAGE_SIZE = 100
+
+
+def repository_node(index: int) -> dict:
+    return {
+        "name": f"repo-{index}",
+        "nameWithOwner": f"{USERNAME}/repo-{index}",
+        "description": None,
+        "url": f"https://github.com/{USERNAME}/repo-{index}",
+        "homepageUrl": None,
+        "primaryLanguage": {"name": "Python"},
+        "stargazerCount": index,
+        "watchers": {"totalCount": 1},
+        "forkCount": 0,
+        "issues": {"totalCount": 0},
+        "diskUsage": 10,
+        "defaultBranchRef": {"name": "main"},
+        "repositoryTopics": {"nodes": [{"topic": {"name": "ai"}}]},
+        "visibility": "PUBLIC",
+        "isFork": index == 0,
+        "createdAt": "2024-01-01T00:00:00Z",
+        "updatedAt": "2024-01-02T00:00:00Z",
+        "pushedAt": "2024-01-03T00:00:00Z",
+        "languages": {"edges": [
+            {"size": 100, "node": {"name": "Python"}},
+            {"size": 10, "node": {"name": "Shell"}},
+        ]},
+    }
+
+
+class StubGraphQL:
+    """Local GraphQL endpoint serving a user with cursor-paginated repositories"""
+
+    def __init__(self):
+        self.queries = []
+        self.runner = None
+        self.url = None
+
+    async def handle(self, request: web.Request) -> web.Response:
+        payload = await request.json()
+        assert request.headers["Authorization"] == "bearer test-token"
+        variables = payload["variables"]
+        self.queries.append(variables)
+
+        start = int(variables["cursor"] or 0)
+        end = min(start + PAGE_SIZE, REPO_COUNT)
+        user = {
+            "login": USERNAME,
+            "name": "The Octocat",
+            "url": f"https://github.com/{USERNAME}",
+            "gists": {"totalCount": 8},
+            "followers": {"totalCount": 20},
+            "following": {"totalCount": 9},
+            "repositories": {
+                "totalCount": REPO_COUNT,
+                "pageInfo": {"hasNextPage": end < REPO_COUNT, "endCursor": str(end)},
+                "nodes": [repository_node(i) for i in range(start, end)],
+            },
+        }
+        return web.json_response({"data": {"user": user}})
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_post("/graphql", self.handle)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}/graphql"
+
+    async def stop(self):
+        await self.runner.cleanup()
+
+
+async def test_graphql_stats():
+    """Stats should come from one query per 100 repos and match the REST shapes"""
+    stub = StubGraphQL()
+    await stub.start()
+    try:
+        service = GitHubService()
+        service.BASE_URL = "http://127.0.0.1:9"  # any REST call would fail
+        service.graphql = GitHubGraphQLClient("test-token", url=stub.url)
+
+        stats = await service.get_user_stats(USERNAME)
+        assert len(stub.queries) == 2, "150 repositories should need two paginated queries"
+        assert stub.queries[1]["cursor"] == "100"
+
+        assert stats["profile"]["username"] == USERNAME
+        assert stats["profile"]["public_repos"] == REPO_COUNT
+        assert stats["statistics"]["total_repos"] == REPO_COUNT
+        assert stats["statistics"]["forked_repos"] == 1
+        assert stats["languages"]["bytes"] == {"Python": 100 * 149, "Shell": 10 * 149}
+
+        # REST-shaped results were cached, so these make no requests
+        profile = await service.get_user_profile(USERNAME)
+        repos = await service.get_repositories(USERNAME)
+        languages = await service.get_repository_languages(USERNAME, "repo-1")
+        assert profile["followers"] == 20
+        assert repos[1]["topics"] == ["ai"] and repos[1]["visibility"] == "public"
+        assert set(repos[0]) == set(GitHubService._format_repository({}))
+        assert languages == {"Python": 100, "Shell": 10}
+        assert len(stub.queries) == 2
+        print(f"✅ GraphQL stats for {REPO_COUNT} repositories in {len(stub.queries)} round trips")
+    finally:
+        await close_http_session()
+        await stub.stop()
+
+
+if __name__ == "__main__":
+    asyncio.run(test_graphql_stats())
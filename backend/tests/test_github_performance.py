@@ -0,0 +1,584 @@
+"""
+Offline tests for GitHubService connection handling and caching
+Runs against a local stub GitHub API, so no token or network is needed
+"""
+
+import asyncio
+import sys
+import os
+import sqlite3
+import tempfile
+import time
+from aiohttp import web
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+os.environ["GITHUB_DISK_CACHE_PATH"] = ""  # tests opt in to the disk tier explicitly
+os.environ.setdefault("GOOGLE_API_KEY", "test-key")  # importing the app builds the Gemini clients
+
+from src.services.github_service import GitHubService, get_github_service
+from src.services.github_warmup import GitHubWarmup
+from src.services.http_session import close_http_session
+from src.services.persistent_cache import GitHubDiskCache
+from src.services.rate_limit import GitHubRateLimiter, background_priority
+from src.services.resilience import CircuitBreaker
+from src.tools import github_tools
+
+USERNAME = "octocat"
+
+
+class StubGitHub:
+    """Minimal local GitHub API that records every request it receives"""
+
+    def __init__(self, repo_count: int = 3):
+        self.requests = []
+        self.connections = set()
+        self.not_modified = 0
+        self.rate_headers = {}  # X-RateLimit-* headers sent with every response
+        self.throttled = 0  # next N requests get 429 with Retry-After
+        self.failing = 0  # next N requests get 503
+        self.missing_page = None  # this page of every list endpoint gets 404
+        self.repos = [
+            {
+                "name": f"repo-{i}",
+                "full_name": f"{USERNAME}/repo-{i}",
+                "language": "Python" if i % 2 else "JavaScript",
+                "stargazers_count": i,
+                "forks_count": 0,
+                "fork": False,
+            }
+            for i in range(repo_count)
+        ]
+        self.runner = None
+        self.url = None
+
+    def route(self, request: web.Request):
+        if request.path == f"/users/{USERNAME}":
+            return {"login": USERNAME, "followers": 1, "following": 2}
+        if request.path == f"/users/{USERNAME}/repos":
+            return self.repos
+        if request.path == f"/users/{USERNAME}/events/public":
+            return [
+                {"type": "PushEvent", "repo": {"name": f"{USERNAME}/repo-{i}"}, "created_at": "2024-01-01T00:00:00Z", "payload": {}}
+                for i in range(3)
+            ]
+        if request.path.startswith(f"/repos/{USERNAME}/") and request.path.endswith("/languages"):
+            index = int(request.path.split("/")[3].split("-")[1])
+            return {"Python": 1000 * (index + 1), "Shell": 100}
+        return None
+
+    async def handle(self, request: web.Request) -> web.Response:
+        self.requests.append(request.path_qs)
+        self.connections.add(request.transport.get_extra_info("peername"))
+        if self.throttled:
+            self.throttled -= 1
+            return web.json_response(
+                {"message": "You have exceeded a secondary rate limit"},
+                status=429,
+                headers={**self.rate_headers, "Retry-After": "1"}
+            )
+        if self.failing:
+            self.failing -= 1
+            return web.json_response({"message": "Service Unavailable"}, status=503)
+        body = self.route(request)
+        if body is None or request.query.get("page") == str(self.missing_page):
+            return web.json_response({"message": "Not Found"}, status=404)
+
+        headers = dict(self.rate_headers)
+        if isinstance(body, list):
+            body, headers = self.paginate(request, body)
+
+        etag = f'"{hash(repr(body)) & 0xffffffff:x}"'
+        headers["ETag"] = etag
+        if request.headers.get("If-None-Match") == etag:
+            self.not_modified += 1
+            return web.Response(status=304, headers=headers)
+        return web.json_response(body, headers=headers)
+
+    def paginate(self, request: web.Request, items: list):
+        """Slice a list like GitHub does and build the Link header"""
+        per_page = int(request.query.get("per_page", 30))
+        page = int(request.query.get("page", 1))
+        last_page = max((len(items) + per_page - 1) // per_page, 1)
+        links = []
+        if page < last_page:
+            links.append(f'<{self.url}{request.path}?per_page={per_page}&page={page + 1}>; rel="next"')
+            links.append(f'<{self.url}{request.path}?per_page={per_page}&page={last_page}>; rel="last"')
+        headers = {"Link": ", ".join(links)} if links else {}
+        return items[(page - 1) * per_page:page * per_page], headers
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_route("GET", "/{tail:.*}", self.handle)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}"
+
+    async def stop(self):
+        await self.runner.cleanup()
+
+
+def make_service(stub: StubGitHub, cached: bool = True) -> GitHubService:
+    service = GitHubService()
+    service.BASE_URL = stub.url
+    if not cached:
+        # Every call goes to the (stub) API
+        service.cache_ttls = {method: 0 for method in service.cache_ttls}
+        service._cache.stale_ttl = 0
+    return service
+
+
+async def test_connection_reuse():
+    """Calls from separate service instances should share pooled keep-alive connections"""
+    stub = StubGitHub()
+    await stub.start()
+    try:
+        api_service, tools_service = make_service(stub, cached=False), make_service(stub, cached=False)
+        for _ in range(3):
+            assert await api_service.get_user_profile(USERNAME)
+            assert await tools_service.get_repositories(USERNAME)
+
+        assert len(stub.requests) == 6
+        assert len(stub.connections) == 1, f"Expected 1 pooled connection, saw {len(stub.connections)}"
+        print(f"✅ {len(stub.requests)} requests served over {len(stub.connections)} connection")
+    finally:
+        await close_http_session()
+        await stub.stop()
+
+
+async def test_conditional_requests():
+    """Repeat fetches should revalidate with If-None-Match and serve the cached body on 304"""
+    stub = StubGitHub()
+    await stub.start()
+    try:
+        service = make_service(stub, cached=False)
+        first = await service.get_repositories(USERNAME)
+        second = await service.get_repositories(USERNAME)
+        assert first == second and len(second) == 3
+        assert stub.not_modified == 1
+
+        stub.repos.append({"name": "new-repo", "full_name": f"{USERNAME}/new-repo"})
+        third = await service.get_repositories(USERNAME)
+        assert len(third) == 4, "Changed data must be refetched"
+
+        stats = (await service.get_cache_stats())["conditional_requests"]
+        assert stats["misses"] == 1 and stats["hits"] == 2 and stats["not_modified"] == 1
+        print(f"✅ Conditional requests: {stats}")
+    finally:
+        await close_http_session()
+        await stub.stop()
+
+
+async def test_stale_while_revalidate():
+    """Fresh entries skip the network; expired entries are served at once and refreshed once"""
+    stub = StubGitHub()
+    await stub.start()
+    try:
+        service = make_service(stub)
+        service.cache_ttls["profile"] = 0.1
+
+        assert await service.get_user_profile(USERNAME)
+        assert await service.get_user_profile(USERNAME)
+        assert len(stub.requests) == 1, "Fresh entry should not hit the network"
+
+        await asyncio.sleep(0.15)
+        stale_reads = await asyncio.gather(*[service.get_user_profile(USERNAME) for _ in range(5)])
+        assert all(profile["username"] == USERNAME for profile in stale_reads)
+        await asyncio.sleep(0.05)
+        assert len(stub.requests) == 2, "Stale reads should trigger exactly one background refresh"
+
+        stats = (await service.get_cache_stats())["response_cache"]
+        assert stats["hits"] == 1 and stats["stale_hits"] == 5 and stats["refreshes"] == 1
+        print(f"✅ Stale-while-revalidate: {stats}")
+    finally:
+        await close_http_session()
+        await stub.stop()
+
+
+async def test_pagination():
+    """All pages should be fetched (remaining pages concurrently) in page order"""
+    stub = StubGitHub(repo_count=250)
+    await stub.start()
+    try:
+        shared_service, github_tools.github_service = github_tools.github_service, make_service(stub)
+        try:
+            cold = await github_tools.get_github_repositories(USERNAME, limit=5)
+        finally:
+            github_tools.github_service = shared_service
+        assert len(cold) == 5 and len(stub.requests) == 1, "A cold tool call should fetch one page, not all"
+        stub.requests.clear()
+
+        service = make_service(stub)
+        repos = await service.get_repositories(USERNAME)
+        assert [repo["name"] for repo in repos] == [f"repo-{i}" for i in range(250)]
+        assert len(stub.requests) == 3
+
+        first_page_only = await service.get_repositories(USERNAME, max_pages=1)
+        assert len(first_page_only) == 100
+
+        streamed = [repo["name"] async for repo in service.iter_repositories(USERNAME, per_page=100)]
+        assert streamed == [repo["name"] for repo in repos]
+
+        stats = await service.get_user_stats(USERNAME)
+        assert stats["statistics"]["total_repos"] == 250
+        requests = len(stub.requests)
+
+        # A failed page must not leave a truncated list (or stats computed from it) in the caches
+        with tempfile.TemporaryDirectory() as tmp:
+            partial = make_service(stub)
+            partial.disk = GitHubDiskCache(os.path.join(tmp, "github.sqlite3"))
+            stub.missing_page = 2
+            assert await partial.get_repositories(USERNAME) == []
+            assert await partial.get_user_stats(USERNAME) == {}
+            assert not partial.has_repositories(USERNAME) and await partial.disk.get_repositories(USERNAME) is None
+            stub.missing_page = None
+            assert len(await partial.get_repositories(USERNAME)) == 250
+            assert (await partial.get_user_stats(USERNAME))["statistics"]["total_repos"] == 250
+            partial.disk.close()
+        print(f"✅ Pagination: {len(repos)} repositories across {requests} requests")
+    finally:
+        await close_http_session()
+        await stub.stop()
+
+
+async def test_byte_weighted_languages():
+    """Stats should weigh languages by bytes across non-fork repositories"""
+    stub = StubGitHub(repo_count=4)
+    stub.repos[3]["fork"] = True
+    await stub.start()
+    try:
+        service = make_service(stub)
+        stats = await service.get_user_stats(USERNAME)
+        languages = stats["languages"]
+
+        # repo-0..2 are original: Python = 1000 + 2000 + 3000, Shell = 3 * 100
+        assert languages["bytes"] == {"Python": 6000, "Shell": 300}
+        assert languages["total_bytes"] == 6300
+        assert [lang["name"] for lang in languages["top_languages"]][:2] == ["Python", "Shell"]
+        assert languages["top_languages"][0]["percentage"] == 95.24
+
+        language_requests = [path for path in stub.requests if path.endswith("/languages")]
+        assert len(language_requests) == 3, "Forks should be skipped"
+
+        await service.get_repository_languages(USERNAME, "repo-0")
+        assert len([path for path in stub.requests if path.endswith("/languages")]) == 3, "Languages should be cached"
+        print(f"✅ Byte-weighted languages: {languages['top_languages']}")
+    finally:
+        await close_http_session()
+        await stub.stop()
+
+
+async def test_disk_cache_cold_start():
+    """A restarted service should answer from disk, then evict by size when over its cap"""
+    stub = StubGitHub()
+    await stub.start()
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "github.sqlite3")
+        try:
+            service = make_service(stub)
+            service.disk = GitHubDiskCache(db_path)
+            profile = await service.get_user_profile(USERNAME)
+            repos = await service.get_repositories(USERNAME)
+            await service.disk.put_repositories(USERNAME, repos[:1])  # replaces the stored list
+            await service.disk.put_repositories(USERNAME, repos)
+            assert (await service.disk.stats())["bytes"] == service.disk._total_bytes(), "Running byte total drifted"
+            service.disk.close()
+            requests_before_restart = len(stub.requests)
+
+            # "Restart": fresh in-memory state, same database file
+            restarted = make_service(stub)
+            restarted.disk = GitHubDiskCache(db_path)
+            assert await restarted.get_user_profile(USERNAME) == profile
+            assert await restarted.get_repositories(USERNAME) == repos
+            assert len(stub.requests) == requests_before_restart, "Cold start should read from disk"
+
+            disk_stats = (await restarted.get_cache_stats())["disk_cache"]
+            assert disk_stats["hits"] == 2
+            restarted.disk.close()
+
+            # Size cap: least recently accessed records are evicted first
+            small = GitHubDiskCache(os.path.join(tmp, "small.sqlite3"), max_bytes=2000)
+            for i in range(20):
+                await small.put_languages(USERNAME, f"repo-{i}", {"Python": i, "Padding": "x" * 150})
+            assert await small.get_languages(USERNAME, "repo-0") is None
+            assert await small.get_languages(USERNAME, "repo-19") is not None
+            small_stats = await small.stats()
+            assert small_stats["bytes"] <= 2000 and small_stats["evictions"] > 0
+            assert small_stats["bytes"] == small._total_bytes(), "Running byte total drifted from the tables"
+            small.close()
+
+            # Application shutdown closes the shared service's database
+            import main
+            shared = get_github_service()
+            disk = shared.disk = GitHubDiskCache(os.path.join(tmp, "app.sqlite3"))
+            warmup_enabled, main.WARMUP_ENABLED = main.WARMUP_ENABLED, False
+            try:
+                async with main.lifespan(main.app):
+                    pass
+            finally:
+                main.WARMUP_ENABLED = warmup_enabled
+            assert shared.disk is None
+            try:
+                disk._conn.execute("SELECT 1")
+                raise AssertionError("Disk cache should be closed on shutdown")
+            except sqlite3.ProgrammingError:
+                pass
+            print(f"✅ Disk cache cold start: {disk_stats['hits']} disk hits, 0 network requests")
+        finally:
+            await close_http_session()
+            await stub.stop()
+
+
+async def test_warmup():
+    """Warmup should prefill caches so later reads make no requests, and report its timing"""
+    stub = StubGitHub()
+    await stub.start()
+    try:
+        api_service, tools_service = make_service(stub), make_service(stub)
+        warmup = GitHubWarmup([api_service, tools_service], usernames=[USERNAME, "missing-user"], interval=3600)
+        warmup.start()
+        await asyncio.sleep(0.2)
+        status = warmup.status()
+        assert status["runs"] == 1 and status["running"]
+        assert status["last_refresh_at"] and status["last_duration_ms"] is not None
+        assert "empty stats" in status["last_error"], "A failing user should be reported"
+
+        requests_after_warmup = len(stub.requests)
+        assert await tools_service.get_user_stats(USERNAME)
+        assert await api_service.get_user_profile(USERNAME)
+        assert await api_service.get_repositories(USERNAME)
+        assert len(stub.requests) == requests_after_warmup, "Warm reads should not hit the network"
+
+        shared_service, github_tools.github_service = github_tools.github_service, tools_service
+        try:
+            repos = await github_tools.get_github_repositories(USERNAME, limit=2)
+        finally:
+            github_tools.github_service = shared_service
+        assert [repo["name"] for repo in repos] == ["repo-0", "repo-1"]
+        assert len(stub.requests) == requests_after_warmup, "The chat tool should be served by the warmed list"
+
+        await warmup.refresh_once()
+        assert warmup.status()["runs"] == 2 and len(stub.requests) > requests_after_warmup
+
+        await warmup.stop()
+        assert not warmup.status()["running"]
+        print(f"✅ Warmup: {status['last_duration_ms']}ms, {requests_after_warmup} requests")
+    finally:
+        await close_http_session()
+        await stub.stop()
+
+
+async def test_rate_limit_scheduling():
+    """Low quota sheds background work, Retry-After is honoured, interactive requests go first"""
+    stub = StubGitHub()
+    await stub.start()
+    try:
+        service = make_service(stub, cached=False)
+        service.rate_limiter = GitHubRateLimiter(max_concurrency=1, background_reserve=0.2, max_wait=5)
+        stub.rate_headers = {
+            "X-RateLimit-Limit": "60",
+            "X-RateLimit-Remaining": "10",
+            "X-RateLimit-Reset": str(int(time.time()) + 3600),
+        }
+
+        profile = await service.get_user_profile(USERNAME)
+        assert service.rate_limiter.remaining == 10
+
+        # 10 of 60 left is inside the 20% reserve: background refresh is shed and serves the last body
+        with background_priority():
+            assert await service.get_user_profile(USERNAME) == profile
+        assert len(stub.requests) == 1 and service.rate_limiter.status()["shed"] == 1
+
+        # Secondary rate limit: the interactive request waits out Retry-After and retries once
+        stub.throttled = 1
+        start = time.perf_counter()
+        assert await service.get_repositories(USERNAME)
+        assert time.perf_counter() - start >= 1.0
+        assert service.rate_limiter.status()["rate_limited"] == 1
+
+        # With the single slot held, a queued interactive request overtakes earlier background ones
+        limiter = GitHubRateLimiter(max_concurrency=1)
+        assert await limiter.acquire()
+        order = []
+
+        async def queued(name, background):
+            if background:
+                with background_priority():
+                    await limiter.acquire()
+            else:
+                await limiter.acquire()
+            order.append(name)
+            limiter.release()
+
+        tasks = [asyncio.create_task(queued("background", True)), asyncio.create_task(queued("interactive", False))]
+        await asyncio.sleep(0.01)
+        limiter.release()
+        await asyncio.gather(*tasks)
+        assert order == ["interactive", "background"]
+        print(f"✅ Rate-limit scheduling: {service.rate_limiter.status()}")
+    finally:
+        await close_http_session()
+        await stub.stop()
+
+
+async def test_retries_and_circuit_breaker():
+    """5xx responses are retried; repeated failures open the breaker and serve the last known body"""
+    stub = StubGitHub()
+    await stub.start()
+    try:
+        service = make_service(stub, cached=False)
+        service.breaker = CircuitBreaker("github-test", failure_threshold=3, recovery_timeout=60)
+        stub.failing = 2
+        profile = await service.get_user_profile(USERNAME)
+        assert profile and len(stub.requests) == 3, "Two 503s should be retried"
+
+        stub.failing = 100
+        assert await service.get_user_profile(USERNAME) == profile, "Last known body should be served"
+        assert service.breaker.state == "open"
+
+        requests_when_opened = len(stub.requests)
+        assert await service.get_user_profile(USERNAME) == profile
+        assert len(stub.requests) == requests_when_opened, "Open breaker should not call GitHub"
+        print(f"✅ GitHub retry + circuit breaker: {service.breaker.status()}")
+    finally:
+        await close_http_session()
+        await stub.stop()
+
+
+async def test_request_coalescing():
+    """Identical concurrent calls, even from separate instances, should share one upstream request"""
+    stub = StubGitHub()
+    await stub.start()
+    try:
+        api_service, tools_service = make_service(stub, cached=False), make_service(stub, cached=False)
+        results = await asyncio.gather(
+            *[api_service.get_repositories(USERNAME) for _ in range(10)],
+            *[tools_service.get_repositories(USERNAME) for _ in range(10)]
+        )
+        assert all(repos == results[0] and len(repos) == 3 for repos in results)
+        assert len(stub.requests) == 1, f"Expected 1 upstream request, saw {len(stub.requests)}"
+
+        # Concurrent misses on one service also share a single (multi-request) stats computation
+        service = make_service(stub)
+        await asyncio.gather(*[service.get_user_stats(USERNAME) for _ in range(10)])
+        assert len([path for path in stub.requests if path == f"/users/{USERNAME}"]) == 1
+
+        from src.tools.github_tools import github_service as tools_module_service
+        from src.api.github import github_service as api_module_service
+        assert tools_module_service is api_module_service is get_github_service()
+        single_flight = (await api_service.get_cache_stats())["single_flight"]
+        print(f"✅ Coalescing: 20 concurrent calls, 1 request ({single_flight})")
+    finally:
+        await close_http_session()
+        await stub.stop()
+
+
+async def test_dashboard_endpoint():
+    """The dashboard route should return the whole GitHub section, cached and compressed"""
+    import httpx
+    from main import app
+
+    stub = StubGitHub(repo_count=40)
+    await stub.start()
+    try:
+        service = get_github_service()
+        service.BASE_URL = stub.url
+        service.disk = None
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.get(f"/github/dashboard/{USERNAME}", headers={"Accept-Encoding": "gzip"})
+            assert response.status_code == 200
+            assert response.headers["Content-Encoding"] == "gzip"
+            assert "max-age" in response.headers["Cache-Control"]
+
+            data = response.json()["data"]
+            assert data["profile"]["username"] == USERNAME
+            assert len(data["recent_repositories"]) == 6 and len(data["top_repositories"]) == 5
+            assert data["languages"][0]["name"] == "Python"
+            assert data["recent_activity"][0] == {"type": "PushEvent", "repo": f"{USERNAME}/repo-0", "created_at": "2024-01-01T00:00:00Z"}
+
+            requests_after_first = len(stub.requests)
+            await client.get(f"/github/dashboard/{USERNAME}")
+            assert len(stub.requests) == requests_after_first, "Dashboard should be served from cache"
+
+            events_path = f"/users/{USERNAME}/events/public"
+            events_requests = sum(1 for path in stub.requests if path.startswith(events_path))
+            no_activity = (await client.get(f"/github/dashboard/{USERNAME}?activity=0")).json()["data"]
+            assert no_activity["recent_activity"] == []
+            assert sum(1 for path in stub.requests if path.startswith(events_path)) == events_requests, \
+                "activity=0 should not request events"
+
+            missing = await client.get("/github/dashboard/missing-user")
+            assert missing.status_code == 404
+        print(f"✅ Dashboard: 1 backend request, {requests_after_first} GitHub requests on first load, 0 after")
+    finally:
+        await close_http_session()
+        await stub.stop()
+
+
+async def test_http_caching_headers():
+    """GitHub routes should send strong ETags and per-route Cache-Control, answer 304 on a match, and honour fields="""
+    import httpx
+    from main import app
+
+    stub = StubGitHub()
+    await stub.start()
+    try:
+        service = get_github_service()
+        service.BASE_URL = stub.url
+        service.disk = None
+        service._cache.clear()
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            first = await client.get("/github/profile", params={"username": USERNAME})
+            etag = first.headers["ETag"]
+            assert first.status_code == 200 and etag.startswith('"') and not etag.startswith("W/")
+            assert first.headers["Cache-Control"] == "public, max-age=300, stale-while-revalidate=3600"
+
+            revalidated = await client.get("/github/profile", params={"username": USERNAME}, headers={"If-None-Match": etag})
+            assert revalidated.status_code == 304 and revalidated.content == b""
+            assert revalidated.headers["ETag"] == etag
+
+            other = await client.get("/github/profile", params={"username": USERNAME}, headers={"If-None-Match": '"stale"'})
+            assert other.status_code == 200 and other.json() == first.json()
+
+            repos = await client.get("/github/repositories", params={"username": USERNAME})
+            assert repos.headers["ETag"] != etag
+
+            missing = await client.get("/github/profile", params={"username": "missing-user"})
+            assert missing.status_code == 404
+
+            sparse = await client.get("/github/repositories", params={"username": USERNAME, "fields": "name,language"})
+            assert sparse.json()["data"][0] == {"name": "repo-0", "language": "JavaScript"}
+            assert len(sparse.content) < len(repos.content) / 3
+
+        from src.tools.github_tools import get_github_repositories
+        tool_repos = await get_github_repositories(USERNAME, limit=2, fields=["name"])
+        assert tool_repos == [{"name": "repo-0"}, {"name": "repo-1"}]
+        print(f"✅ HTTP caching: ETag {etag}, 304 on If-None-Match")
+    finally:
+        await close_http_session()
+        await stub.stop()
+
+
+async def main():
+    await test_connection_reuse()
+    await test_conditional_requests()
+    await test_stale_while_revalidate()
+    await test_pagination()
+    await test_byte_weighted_languages()
+    await test_disk_cache_cold_start()
+    await test_warmup()
+    await test_rate_limit_scheduling()
+    await test_retries_and_circuit_breaker()
+    await test_request_coalescing()
+    await test_dashboard_endpoint()
+    await test_http_caching_headers()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
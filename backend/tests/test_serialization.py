@@ -0,0 +1,118 @@
+"""
+Tests for the JSON serialization helpers, field projection and the response compression middleware
+"""
+
+import asyncio
+import json
+import sys
+import os
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+os.environ["GITHUB_DISK_CACHE_PATH"] = ""  # tests opt in to the disk tier explicitly
+
+import httpx
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from src.api.compression import CompressionMiddleware, negotiate_encoding
+from src.api.responses import FastJSONResponse
+from src.services.projection import parse_fields, project
+from src.services.serialization import dumps, to_jsonable
+
+
+def test_to_jsonable_matches_round_trip():
+    """to_jsonable should give exactly what json.loads(json.dumps(..., default=str)) gives"""
+    value = {
+        "repos": [{"name": "repo", "stars": 3, "fork": False, "topics": ("ai", "rag")}],
+        "when": datetime(2024, 1, 2, 3, 4, 5),
+        1: None,
+        2.5: [1.5, None, True],
+        "nested": {"tags": {"python"}, "path": os.path.join("a", "b")},
+    }
+    assert to_jsonable(value) == json.loads(json.dumps(value, default=str))
+    assert json.loads(dumps(value)) == json.loads(json.dumps(value, default=str))
+    print("✅ to_jsonable matches the json round trip")
+
+
+def test_field_projection():
+    """Sparse fieldsets should keep only the requested (possibly nested) fields"""
+    repos = [{"name": "a", "stars": 1, "topics": ["ai"]}, {"name": "b", "stars": 2, "topics": []}]
+    assert project(repos, "name, stars") == [{"name": "a", "stars": 1}, {"name": "b", "stars": 2}]
+    assert project(repos, ["name", "missing"]) == [{"name": "a"}, {"name": "b"}]
+    assert project(repos, None) is repos and project(repos, "") is repos
+
+    stats = {
+        "profile": {"username": "octocat", "followers": 3, "bio": "x"},
+        "languages": {"top_languages": [{"name": "Python", "bytes": 10}], "bytes": {"Python": 10}},
+        "statistics": {"total_repos": 4},
+    }
+    assert project(stats, "profile.followers,languages.top_languages.name") == {
+        "profile": {"followers": 3},
+        "languages": {"top_languages": [{"name": "Python"}]},
+    }
+    assert project(stats, "profile.bio,profile") == {"profile": stats["profile"]}
+    assert project(stats, "statistics,statistics.total_repos") == {"statistics": stats["statistics"]}
+    assert parse_fields(" a, ,b ") == ["a", "b"]
+    print("✅ Field projection")
+
+
+def test_negotiate_encoding():
+    assert negotiate_encoding(None) is None
+    assert negotiate_encoding("identity") is None
+    assert negotiate_encoding("gzip;q=0") is None
+    assert negotiate_encoding("deflate, gzip;q=0.5") == "gzip"
+    assert negotiate_encoding("*") in ("br", "gzip")
+    print("✅ Accept-Encoding negotiation")
+
+
+async def test_compression_middleware():
+    """Large JSON is compressed, small JSON and event streams are not"""
+    app = FastAPI(default_response_class=FastJSONResponse)
+    app.add_middleware(CompressionMiddleware, minimum_size=1024)
+
+    @app.get("/large")
+    async def large():
+        return {"items": [{"name": f"repo-{i}", "description": "x" * 40} for i in range(100)]}
+
+    @app.get("/small")
+    async def small():
+        return {"ok": True}
+
+    @app.get("/stream")
+    async def stream():
+        async def events():
+            for i in range(3):
+                yield f"data: {'x' * 1000}{i}\n\n"
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        headers = {"Accept-Encoding": "gzip"}
+        large_response = await client.get("/large", headers=headers)
+        assert large_response.headers["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in large_response.headers["Vary"]
+        assert len(large_response.json()["items"]) == 100
+        raw_size = len(dumps(large_response.json()))
+        wire_size = int(large_response.headers["Content-Length"])
+        assert wire_size < raw_size / 5
+
+        small_response = await client.get("/small", headers=headers)
+        assert "Content-Encoding" not in small_response.headers
+
+        stream_response = await client.get("/stream", headers=headers)
+        assert "Content-Encoding" not in stream_response.headers
+        assert stream_response.text.count("data: ") == 3
+
+        for accept_encoding in ("identity", "", "compress"):
+            plain = await client.get("/large", headers={"Accept-Encoding": accept_encoding})
+            assert "Content-Encoding" not in plain.headers
+            assert "Accept-Encoding" in plain.headers["Vary"], "Identity variants must be marked too"
+            assert len(plain.json()["items"]) == 100
+    print(f"✅ Compression: {raw_size} -> {wire_size} bytes on the wire")
+
+
+if __name__ == "__main__":
+    test_to_jsonable_matches_round_trip()
+    test_field_projection()
+    test_negotiate_encoding()
+    asyncio.run(test_compression_middleware())
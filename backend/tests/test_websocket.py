@@ -0,0 +1,109 @@
+"""
+Tests for the WebSocket chat channel: message/cancel/reset, malformed input and the history cap
+Answers come from a stub chat_events, so no API key or network is needed
+"""
+
+import asyncio
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+os.environ.setdefault("GOOGLE_API_KEY", "test-key")
+os.environ["GITHUB_DISK_CACHE_PATH"] = ""  # tests opt in to the disk tier explicitly
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from src.api import websocket as websocket_api
+
+histories = []
+
+
+async def stub_chat_events(message, conversation_history):
+    """Echoes the message; "slow" messages never finish (until cancelled)"""
+    histories.append(conversation_history)
+    yield {"event": "actions", "data": []}
+    if message == "slow":
+        await asyncio.sleep(60)
+    yield {"event": "answer", "data": {"text": f"echo: {message}"}}
+    yield {"event": "done", "data": {"tools_used": []}}
+
+
+def make_client() -> TestClient:
+    app = FastAPI()
+    app.include_router(websocket_api.router)
+    websocket_api.chat_events = stub_chat_events
+    return TestClient(app)
+
+
+def receive_until(websocket, event_type):
+    events = []
+    while not events or events[-1]["type"] != event_type:
+        events.append(websocket.receive_json())
+    return events
+
+
+def test_message_and_history_cap():
+    """Each answer is streamed back; only the last MAX_HISTORY_EXCHANGES exchanges are kept"""
+    histories.clear()
+    with make_client().websocket_connect("/ws/chat") as websocket:
+        total = websocket_api.MAX_HISTORY_EXCHANGES + 3
+        for i in range(total):
+            websocket.send_json({"type": "message", "message": f"question {i}"})
+            events = receive_until(websocket, "done")
+            assert [event["type"] for event in events] == ["actions", "answer", "done"]
+            assert events[1]["data"]["text"] == f"echo: question {i}"
+            assert "timestamp" in events[-1]["data"]
+
+    assert histories[1] == [{"user": "question 0", "assistant": "echo: question 0"}]
+    assert len(histories[-1]) == websocket_api.MAX_HISTORY_EXCHANGES
+    assert histories[-1][-1]["user"] == f"question {total - 2}" and histories[-1][0]["user"] == "question 2"
+    print(f"✅ WebSocket messages: history capped at {websocket_api.MAX_HISTORY_EXCHANGES} exchanges")
+
+
+def test_cancel_and_reset():
+    """cancel stops the in-flight answer without keeping it; reset clears the history"""
+    histories.clear()
+    with make_client().websocket_connect("/ws/chat") as websocket:
+        websocket.send_json({"type": "message", "message": "first"})
+        receive_until(websocket, "done")
+
+        websocket.send_json({"type": "message", "message": "slow"})
+        assert websocket.receive_json()["type"] == "actions"
+        websocket.send_json({"type": "message", "message": "too soon"})
+        assert websocket.receive_json()["type"] == "error", "Only one answer may be in flight"
+        websocket.send_json({"type": "cancel"})
+        assert websocket.receive_json() == {"type": "cancelled", "data": {}}
+
+        websocket.send_json({"type": "message", "message": "second"})
+        receive_until(websocket, "done")
+        assert [exchange["user"] for exchange in histories[-1]] == ["first"], "Cancelled answers are not kept"
+
+        websocket.send_json({"type": "reset"})
+        assert websocket.receive_json() == {"type": "reset", "data": {}}
+        websocket.send_json({"type": "message", "message": "third"})
+        receive_until(websocket, "done")
+        assert histories[-1] == []
+    print("✅ WebSocket cancel and reset")
+
+
+def test_malformed_input():
+    """Malformed JSON, binary frames and unknown types get an error event; the connection stays usable"""
+    with make_client().websocket_connect("/ws/chat") as websocket:
+        websocket.send_text("{not json")
+        assert websocket.receive_json() == {"type": "error", "data": {"detail": "Malformed JSON"}}
+        websocket.send_bytes(b'{"type": "message", "message": "hi"}')
+        assert websocket.receive_json()["data"]["detail"].startswith("Binary frames are not supported")
+        websocket.send_json({"type": "dance"})
+        assert websocket.receive_json()["type"] == "error"
+        websocket.send_json({"type": "message", "message": "  "})
+        assert websocket.receive_json()["data"]["detail"] == "Message is empty"
+
+        websocket.send_json({"type": "message", "message": "still there?"})
+        assert receive_until(websocket, "done")[1]["data"]["text"] == "echo: still there?"
+    print("✅ WebSocket malformed input keeps the connection open")
+
+
+if __name__ == "__main__":
+    test_message_and_history_cap()
+    test_cancel_and_reset()
+    test_malformed_input()
@@ -1482,22 +1482,31 @@ async function loadGitHubData() {
     const username = 'sriharsha8991';
     
     try {
-        // Fetch user data
-        const userResponse = await fetch(`https://api.github.com/users/${username}`);
-        const userData = await userResponse.json();
+        let profile, repos;
+        try {
+            // One cached request to our backend instead of several to api.github.com
+            const response = await fetch(`${CHAT_API_URL}/github/dashboard/${username}?repos=6&activity=0`);
+            if (!response.ok) throw new Error(`Dashboard request failed: ${response.status}`);
+            const { data } = await response.json();
+            profile = data.profile;
+            repos = data.recent_repositories;
+        } catch (backendError) {
+            // Backend unavailable (e.g. cold start) - fall back to the public GitHub API
+            console.warn('GitHub dashboard unavailable, using GitHub API:', backendError);
+            const userResponse = await fetch(`https://api.github.com/users/${username}`);
+            profile = await userResponse.json();
+            const reposResponse = await fetch(`https://api.github.com/users/${username}/repos?sort=updated&per_page=6`);
+            repos = await reposResponse.json();
+        }
         
         // Update stats
-        document.getElementById('github-repos').textContent = userData.public_repos || 0;
-        document.getElementById('github-followers').textContent = userData.followers || 0;
-        document.getElementById('github-following').textContent = userData.following || 0;
-        document.getElementById('github-gists').textContent = userData.public_gists || 0;
-        
-        // Fetch repositories
-        const reposResponse = await fetch(`https://api.github.com/users/${username}/repos?sort=updated&per_page=6`);
-        const reposData = await reposResponse.json();
+        document.getElementById('github-repos').textContent = profile.public_repos || 0;
+        document.getElementById('github-followers').textContent = profile.followers || 0;
+        document.getElementById('github-following').textContent = profile.following || 0;
+        document.getElementById('github-gists').textContent = profile.public_gists || 0;
         
         // Display repositories
-        displayRepositories(reposData);
+        displayRepositories(repos);
         
     } catch (error) {
         console.error('Error fetching GitHub data:', error);